@@ -3,12 +3,12 @@ import sys
 import argparse
 import os
 
-from antibug.utils.convert_to_json import convert_to_compile_info_json, convert_to_detect_result_json, remove_all_json_files, convert_to_contract_analysis_info_json, get_root_dir
+from antibug.utils.convert_to_json import convert_to_compile_info_json, convert_to_detect_result_json, remove_all_json_files, convert_to_contract_analysis_info_json, convert_to_profile_json, get_root_dir
 from antibug.utils.audit_report import export_to_markdown
 from antibug.run_detectors.detectors import RunDetector
 
 from antibug.compile.safe_dev_analyzer import SafeDevAnalyzer
-from antibug.compile.parse_version_and_install_solc import SolcParser
+from antibug.compile.parse_version_and_install_solc import SOLC_PARSER_OFFLINE, SolcParser
 from antibug.run_security_report.app import main as audit_report
 from antibug.run_printer.printer import contract_analysis
 from antibug.run_printer.printer import RunPrinter
@@ -16,6 +16,13 @@ from antibug.run_printer.printer import RunPrinter
 
 from streamlit.web.cli import main_run
 
+def jobs_count(value):
+    jobs = int(value)
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(f'invalid number of processes: {value} (0: all cores)')
+    return jobs
+
+
 def parse_arguments():
     usage = 'antibug target [<args>]\n\n'
     usage += 'target can be:\n\t'
@@ -35,6 +42,14 @@ def parse_arguments():
     # detect_parser.add_argument('language', help='Language of the description', nargs='?')
     detect_parser.add_argument('detector', help='Target rule', nargs='*')
     detect_parser.add_argument('target', help='Path to the rule file')
+    detect_parser.add_argument('-j', '--jobs', help='Number of processes used to compile a directory and to run the detectors (0: all cores)', type=jobs_count, default=1)
+    detect_parser.add_argument('--offline', help='Resolve solc versions from the installed binaries only', action='store_true')
+    detect_parser.add_argument('--no-compile-cache', help='Always run solc, ignoring the compilation cache', action='store_true')
+    detect_parser.add_argument('--batch', help='Compile the files of a directory with one solc call per compiler version', action='store_true')
+    detect_parser.add_argument('--standard-json', help='Compile with solc --standard-json, requesting only the outputs needed', action='store_true')
+    detect_parser.add_argument('--snapshot', help='Reuse the analysis saved by a previous run on the same compilation', action='store_true')
+    detect_parser.add_argument('--incremental', help='Only analyze and check the contracts changed since the previous run', action='store_true')
+    detect_parser.add_argument('--profile', help='Write the time and memory of every phase, detector and printer as a json profile next to the results', action='store_true')
     
     remove_parser = subparsers.add_parser('remove')
     
@@ -42,6 +57,12 @@ def parse_arguments():
     compile_parser = subparsers.add_parser(
         'compile', help='antibug compiler, defaults to all')
     compile_parser.add_argument('target', help='path to the rule file')
+    compile_parser.add_argument('-j', '--jobs', help='Number of processes used to compile a directory (0: all cores)', type=jobs_count, default=1)
+    compile_parser.add_argument('--offline', help='Resolve solc versions from the installed binaries only', action='store_true')
+    compile_parser.add_argument('--no-compile-cache', help='Always run solc, ignoring the compilation cache', action='store_true')
+    compile_parser.add_argument('--batch', help='Compile the files of a directory with one solc call per compiler version', action='store_true')
+    compile_parser.add_argument('--standard-json', help='Compile with solc --standard-json, requesting only the outputs needed', action='store_true')
+    compile_parser.add_argument('--snapshot', help='Reuse the analysis saved by a previous run on the same compilation', action='store_true')
 
     if len(sys.argv) == 1:
         parser.print_help(sys.stderr)
@@ -74,7 +95,11 @@ def detect_vuln_action(analyzer, detector):
 
 def main():
     args = parse_arguments()
-    analyzer = SafeDevAnalyzer(args.target)
+    analyzer = SafeDevAnalyzer(args.target, jobs=args.jobs or None, offline=args.offline or SOLC_PARSER_OFFLINE,
+                               compile_cache=not args.no_compile_cache, batch=args.batch,
+                               standard_json=args.command if args.standard_json else None,
+                               snapshot=args.snapshot, incremental=getattr(args, 'incremental', False),
+                               profile=getattr(args, 'profile', False))
     
     if args.command == 'compile':
         abi_list, bytecode_list = analyzer.to_compile()
@@ -83,7 +108,8 @@ def main():
     elif args.command == 'detect':
         try:
             # contract analysis -> json
-            combined_data = contract_analysis(analyzer)
+            with analyzer.profiler.phase("printer", "contract-analysis"):
+                combined_data = contract_analysis(analyzer)
             convert_to_contract_analysis_info_json(combined_data, analyzer)
             
             # call graph -> png
@@ -93,6 +119,8 @@ def main():
             
             result_list, filename, error = detect_vuln_action(analyzer, args.detector)
             ret= convert_to_detect_result_json(result_list, filename, error, analyzer)
+            if args.profile:
+                convert_to_profile_json(analyzer)
             if ret != 0:
                 export_to_markdown(args.target)
                 # streamlit_path_ = get_root_dir()
@@ -6,12 +6,13 @@ import logging
 import os
 import re
 
-from collections import defaultdict
+from array import array
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union
 
 from antibug.compile.compilation_unit import CompilationUnit
 from antibug.compile.solc import Solc
+from antibug.compile.utils.line_index import compute_line_starts, line_to_offset, offset_to_line
 from antibug.compile.utils.naming import Filename
 
 # Cycle dependency
@@ -49,13 +50,14 @@ class AntibugCompile:
     """
 
     # pylint: disable=too-many-branches
-    def __init__(self, target: Union[str, Solc], binary: str, **kwargs: str) -> None:
+    def __init__(self, target: Union[str, List[str]], binary: str, **kwargs: str) -> None:
         """See https://github.com/crytic/crytic-compile/wiki/Configuration
         Target is usually a file or a project directory. It can be an AbstractPlatform
         for custom setup
 
         Args:
-            target (Union[str, AbstractPlatform]): Target
+            target (Union[str, List[str]]): Target. A list of files sharing the same
+                compiler version is compiled in a single solc call
             **kwargs: additional arguments
         """
 
@@ -64,19 +66,19 @@ class AntibugCompile:
 
         self._src_content: Dict = {}
 
-        # Mapping each file to
-        #  offset -> line, column
-        # This is not memory optimized, but allow an offset lookup in O(1)
-        # Because we frequently do this lookup in Slither during the AST parsing
-        # We decided to favor the running time versus memory
-        self._cached_offset_to_line: Dict[Filename, Dict[int, Tuple[int, int]]] = {}
-        # Lines are indexed from 1
-        self._cached_line_to_offset: Dict[Filename, Dict[int, int]] = defaultdict(dict)
+        # Mapping each file to the offsets at which its lines start (see utils/line_index.py)
+        # An offset is converted to (line, column) by a binary search over the line starts
+        # Lines are indexed from 1: line 1 starts at index 0
+        self._cached_line_starts: Dict[Filename, array] = {}
 
         # Return the line from the line number
         # Note: line 1 is at index 0
         self._cached_line_to_code: Dict[Filename, List[bytes]] = {}
 
+        # Filenames already converted (see utils/naming.py:convert_filename)
+        # (used filename, working dir, process cwd, relative_to_short) -> Filename
+        self._cached_filenames: Dict[Tuple, Filename] = {}
+
         self._working_dir = Path.cwd()
         
         self.compiler_version: str = binary
@@ -100,6 +102,15 @@ class AntibugCompile:
         """
         return self._platform.target
 
+    @property
+    def targets(self) -> List[str]:
+        """Return the solidity files given to solc
+
+        Returns:
+            List[str]: targets
+        """
+        return self._platform.targets
+
     @property
     def compilation_units(self) -> Dict[str, CompilationUnit]:
         """Return the compilation units
@@ -185,27 +196,26 @@ class AntibugCompile:
         """
         self._working_dir = path
 
-    def _get_cached_offset_to_line(self, file: Filename) -> None:
-        """Compute the cached offsets to lines
+    def get_line_starts(self, filename: Union[Filename, str]) -> array:
+        """Return the line start offsets of a file, computed on first use
 
         Args:
-            file (Filename): filename
-        """
-        if file not in self._cached_line_to_code:
-            self._get_cached_line_to_code(file)
-
-        source_code = self._cached_line_to_code[file]
-        acc = 0
-        lines_delimiters: Dict[int, Tuple[int, int]] = {}
-        for line_number, x in enumerate(source_code):
-            self._cached_line_to_offset[file][line_number + 1] = acc
-
-            for i in range(acc, acc + len(x)):
-                lines_delimiters[i] = (line_number + 1, i - acc + 1)
+            filename (Union[Filename, str]): filename
 
-            acc += len(x)
-        lines_delimiters[acc] = (len(source_code) + 1, 0)
-        self._cached_offset_to_line[file] = lines_delimiters
+        Returns:
+            array: line start offsets (line 1 at index 0), followed by the size of the file
+        """
+        if isinstance(filename, str):
+            file = self.filename_lookup(filename)
+        else:
+            file = filename
+        line_starts = self._cached_line_starts.get(file)
+        if line_starts is None:
+            if file not in self._cached_line_to_code:
+                self._get_cached_line_to_code(file)
+            line_starts = compute_line_starts(self._cached_line_to_code[file])
+            self._cached_line_starts[file] = line_starts
+        return line_starts
 
     def get_line_from_offset(self, filename: Union[Filename, str], offset: int) -> Tuple[int, int]:
         """Return the line from a given offset
@@ -217,15 +227,19 @@ class AntibugCompile:
         Returns:
             Tuple[int, int]: (line, line offset)
         """
-        if isinstance(filename, str):
-            file = self.filename_lookup(filename)
-        else:
-            file = filename
-        if file not in self._cached_offset_to_line:
-            self._get_cached_offset_to_line(file)
+        return offset_to_line(self.get_line_starts(filename), offset)
 
-        lines_delimiters = self._cached_offset_to_line[file]
-        return lines_delimiters[offset]
+    def get_offset_from_line(self, filename: Union[Filename, str], line: int) -> int:
+        """Return the offset at which a line starts. Start at line = 1
+
+        Args:
+            filename (Union[Filename, str]): filename
+            line (int): line
+
+        Returns:
+            int: global offset
+        """
+        return line_to_offset(self.get_line_starts(filename), line)
 
     def _get_cached_line_to_code(self, file: Filename) -> None:
         """Compute the cached lines
@@ -238,26 +252,36 @@ class AntibugCompile:
         source_code_list = source_code_encoded.splitlines(True)
         self._cached_line_to_code[file] = source_code_list
     
-    def get_code_from_line(self, filename: Union[Filename, str], line: int) -> Optional[bytes]:
-        """Return the code from the line. Start at line = 1.
-        Return None if the line is not in the file
+    def get_lines(self, filename: Union[Filename, str]) -> List[bytes]:
+        """Return the lines of a file, line endings included. Line 1 is at index 0
 
         Args:
             filename (Union[Filename, str]): filename
-            line (int): line
 
         Returns:
-            Optional[bytes]: line of code
+            List[bytes]: lines of code
         """
         if isinstance(filename, str):
             file = self.filename_lookup(filename)
         else:
             file = filename
-            
+
         if file not in self._cached_line_to_code:
             self._get_cached_line_to_code(file)
+        return self._cached_line_to_code[file]
 
-        lines = self._cached_line_to_code[file]
+    def get_code_from_line(self, filename: Union[Filename, str], line: int) -> Optional[bytes]:
+        """Return the code from the line. Start at line = 1.
+        Return None if the line is not in the file
+
+        Args:
+            filename (Union[Filename, str]): filename
+            line (int): line
+
+        Returns:
+            Optional[bytes]: line of code
+        """
+        lines = self.get_lines(filename)
         if line - 1 < 0 or line - 1 >= len(lines):
             return None
         return lines[line - 1]
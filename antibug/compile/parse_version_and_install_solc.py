@@ -1,5 +1,6 @@
 import re
 import os
+import time
 import requests
 import json
 import shutil
@@ -15,12 +16,99 @@ else:
     
 SOLC_PARSER_DIR = HOME_DIR.joinpath(".solc-parser")
 SOLC_BINARIES_DIR = SOLC_PARSER_DIR.joinpath("artifacts")
+RELEASE_INDEX_URL = "https://binaries.soliditylang.org/macosx-amd64/list.json"
+RELEASE_INDEX_PATH = SOLC_PARSER_DIR.joinpath("list.json")
+# Age (in seconds) after which the on-disk release index is downloaded again
+RELEASE_INDEX_TTL = int(os.environ.get("SOLC_PARSER_INDEX_TTL", 24 * 60 * 60))
+# Never use the network: versions are resolved from the installed binaries only
+SOLC_PARSER_OFFLINE = os.environ.get("SOLC_PARSER_OFFLINE", "").lower() in ("1", "true", "yes")
+
+# offline mode -> release index, shared by all the SolcParser instances of the process
+_release_index_cache: Dict[bool, Dict[str, str]] = {}
+
+
+def _version_key(version: str):
+    return tuple(int(x) for x in version.split("."))
+
+
+def installed_release_index() -> Dict[str, str]:
+    """Build a release index (version -> artifact) from the installed binaries
+    Versions are sorted from the newest to the oldest, like list.json
+    """
+    if not SOLC_BINARIES_DIR.is_dir():
+        return {}
+    versions = [
+        p.name.replace("solc-", "")
+        for p in SOLC_BINARIES_DIR.iterdir()
+        if p.is_dir() and p.joinpath(p.name).is_file()
+    ]
+    versions = sorted(versions, key=_version_key, reverse=True)
+    return {version: f"solc-{version}" for version in versions}
+
+
+def _download_release_index() -> Dict[str, str]:
+    response = requests.get(RELEASE_INDEX_URL, timeout=30)
+    response.raise_for_status()
+    releases = json.loads(response.content)["releases"]
+
+    # Write then rename: parallel workers may refresh the index at the same time
+    Path.mkdir(SOLC_PARSER_DIR, parents=True, exist_ok=True)
+    tmp_path = RELEASE_INDEX_PATH.with_name(f"list.json.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(releases, f)
+    os.replace(tmp_path, RELEASE_INDEX_PATH)
+    return releases
+
+
+def _read_release_index() -> Optional[Dict[str, str]]:
+    try:
+        with open(RELEASE_INDEX_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def load_release_index(offline: bool = SOLC_PARSER_OFFLINE, ttl: int = RELEASE_INDEX_TTL) -> Dict[str, str]:
+    """Return the solc release index (version -> artifact), newest version first
+
+    The index is read at most once per process. It is downloaded only if the copy stored in
+    SOLC_PARSER_DIR is missing or older than ttl seconds; if the download fails, the stale copy
+    is used, and then the installed binaries. In offline mode, only the installed binaries are used.
+
+    Args:
+        offline (bool): resolve the versions from the installed binaries only
+        ttl (int): maximum age of the on-disk index, in seconds
+
+    Returns:
+        Dict[str, str]: version -> artifact name
+    """
+    if offline in _release_index_cache:
+        return _release_index_cache[offline]
+
+    if offline:
+        releases = installed_release_index()
+    else:
+        releases = None
+        if RELEASE_INDEX_PATH.is_file() and time.time() - RELEASE_INDEX_PATH.stat().st_mtime < ttl:
+            releases = _read_release_index()
+        if releases is None:
+            try:
+                releases = _download_release_index()
+            except (requests.RequestException, ValueError, KeyError, OSError):
+                releases = _read_release_index()
+        if releases is None:
+            releases = installed_release_index()
+
+    _release_index_cache[offline] = releases
+    return releases
+
 
 class SolcParser:
-    def __init__(self, target:str):
+    def __init__(self, target:str, offline: bool = SOLC_PARSER_OFFLINE):
         self._target = target
         self._file_name= os.path.basename(target)
         self._file_contents = None
+        self._offline = offline
         self._release_version_list = self.release_version_list()
         
         self._version_list = self.version_list
@@ -41,9 +129,7 @@ class SolcParser:
         return self._file_contents
     
     def release_version_list(self) -> Dict[str, str]:
-        url = f"https://binaries.soliditylang.org/macosx-amd64/list.json"
-        list_json = requests.get(url).content
-        self._release_version_list = json.loads(list_json)["releases"]
+        self._release_version_list = load_release_index(self._offline)
         return self._release_version_list
     
     @property
@@ -139,10 +225,17 @@ class SolcParser:
     #########################################################
     def install_solc(self):
         artifact_file_dir = SOLC_BINARIES_DIR.joinpath(f"solc-{self._solc_binary_version}")
-        if os.path.exists(artifact_file_dir):
+        binary_path = artifact_file_dir.joinpath(f"solc-{self._solc_binary_version}")
+        # Check the binary itself and not only its directory: another process
+        # (see SafeDevAnalyzer jobs) may have created the directory and still be downloading
+        if os.path.exists(binary_path):
             # print(f"'{self._solc_binary_version}' is already installed.")
             return False
         
+        if self._offline:
+            raise argparse.ArgumentTypeError(
+                f"'{self._solc_binary_version}' is not installed and cannot be downloaded in offline mode.")
+
         artifacts = self._release_version_list
         url = f"https://binaries.soliditylang.org/macosx-amd64/" + \
             artifacts.get(self._solc_binary_version)
@@ -150,11 +243,14 @@ class SolcParser:
         print(f"Installing solc '{self._solc_binary_version}'...")
 
         response = requests.get(url)
-        with open(artifact_file_dir.joinpath(f"solc-{self._solc_binary_version}"), "wb") as file:
+        # Write to a per-process file and rename it, so a concurrent install never exposes a partial binary
+        tmp_path = artifact_file_dir.joinpath(f"solc-{self._solc_binary_version}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as file:
             file.write(response.content)
+        os.chmod(tmp_path, 0o775)
+        os.replace(tmp_path, binary_path)
 
-        self._solc_binary_path = artifact_file_dir.joinpath(f"solc-{self._solc_binary_version}")
-        os.chmod(self._solc_binary_path, 0o775)
+        self._solc_binary_path = binary_path
         print(f"Version '{self._solc_binary_version}' installed.")
         return True
 
@@ -188,8 +284,49 @@ class SolcParser:
         else:
             raise argparse.ArgumentTypeError(f"Unknown version '{self._solc_binary_version}'")
    
+    @staticmethod
+    def _matches(installed: str, sign: str, version: str) -> bool:
+        key = _version_key(installed)
+        target = _version_key(version)
+        if sign in ('^', '~'):
+            return key[:2] == target[:2] and key >= target
+        if sign == '>':
+            return key > target
+        if sign == '>=':
+            return key >= target
+        if sign == '<':
+            return key < target
+        if sign == '<=':
+            return key <= target
+        return key == target
+
+    def select_installed_version(self, sign: List[str], version: List[str]) -> Optional[str]:
+        """Return the newest installed version matching every constraint of the pragmas (offline mode)
+
+        Args:
+            sign (List[str]): operators of the constraints ("" for an exact version)
+            version (List[str]): versions of the constraints
+
+        Returns:
+            Optional[str]: the version, None if no installed version matches
+        """
+        for installed in self._version_list:
+            if all(self._matches(installed, s, v) for s, v in zip(sign, version)):
+                return installed
+        return None
+
     def run_parser(self):
         sign, version = self.parse_version_in_file_contents()
+
+        if self._offline and version:
+            solc_version = self.select_installed_version(sign, version)
+            if solc_version is None:
+                constraints = " ".join(f"{s}{v}" for s, v in zip(sign, version))
+                print(f"no installed solc matches {constraints}")
+                return
+            self._solc_binary_version = solc_version
+            self.switch_global_version(False)
+            return
         
         if self.check_version(version) == False:
             print("incorrect version")
@@ -1,13 +1,122 @@
 import os
-from typing import Dict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Tuple, Union
 
 from slither_core.slither import Slither
+from slither_core.utils.incremental import IncrementalState
+from slither_core.utils.profiling import Profiler
+from slither_core.utils.snapshot import compute_snapshot_key, load_snapshot, save_snapshot, snapshot_path
 from antibug.compile.antibug_compile import AntibugCompile
 from antibug.compile.exceptions import InvalidCompilation
-from antibug.compile.parse_version_and_install_solc import SolcParser
+from antibug.compile.parse_version_and_install_solc import SOLC_PARSER_OFFLINE, SolcParser
+
+
+def _resolve_version(
+    file: str, offline: bool = SOLC_PARSER_OFFLINE, solc_version: Optional[str] = None
+) -> Tuple[str, Optional[str], Optional[str]]:
+    """Resolve (and install if needed) the solc version of a single file
+
+    Args:
+        file (str): path to the solidity file
+        offline (bool): resolve the solc version from the installed binaries only
+        solc_version (Optional[str]): installed solc version to use instead of resolving it
+
+    Returns:
+        Tuple[str, Optional[str], Optional[str]]: (file, solc version, error)
+    """
+    if solc_version is not None:
+        return file, solc_version, None
+    try:
+        solc_parse = SolcParser(file, offline)
+        solc_parse.run_parser()
+        if solc_parse._solc_binary_version is None:
+            return file, None, "unable to resolve the solc version"
+        return file, solc_parse._solc_binary_version, None
+    except Exception as e:  # pylint: disable=broad-except
+        return file, None, f"{type(e).__name__}: {e}"
+
+
+def _compile_target(
+    target: Union[str, List[str]], version: str, **compile_kwargs
+) -> Tuple[Union[str, List[str]], Optional[AntibugCompile], Optional[str]]:
+    """Compile a file, or a group of files in a single solc call
+
+    Args:
+        target (Union[str, List[str]]): solidity file(s)
+        version (str): solc version
+        **compile_kwargs: AntibugCompile arguments (solc_cache, solc_standard_json, ...)
+
+    Returns:
+        Tuple[Union[str, List[str]], Optional[AntibugCompile], Optional[str]]: (target, compilation, error)
+    """
+    try:
+        return target, AntibugCompile(target, version, **compile_kwargs), None
+    except Exception as e:  # pylint: disable=broad-except
+        return target, None, f"{type(e).__name__}: {e}"
+
+
+def _compile_file(
+    file: str, offline: bool = SOLC_PARSER_OFFLINE, solc_version: Optional[str] = None, **compile_kwargs
+) -> Tuple[str, Optional[AntibugCompile], Optional[str]]:
+    """Resolve the solc version of a single file and compile it
+    Runs in a worker process when SafeDevAnalyzer is used with jobs > 1
+
+    Args:
+        file (str): path to the solidity file
+        offline (bool): resolve the solc version from the installed binaries only
+        solc_version (Optional[str]): installed solc version to use instead of resolving it
+        **compile_kwargs: AntibugCompile arguments
+
+    Returns:
+        Tuple[str, Optional[AntibugCompile], Optional[str]]: (file, compilation, error)
+    """
+    _, version, error = _resolve_version(file, offline, solc_version)
+    if version is None:
+        return file, None, error
+    return _compile_target(file, version, **compile_kwargs)  # type: ignore
+
+
+def _compile_group(
+    version: str, files: List[str], **compile_kwargs
+) -> List[Tuple[Union[str, List[str]], Optional[AntibugCompile], Optional[str]]]:
+    """Compile all the files using the same solc version in a single solc call
+    If the group does not compile, fall back to one call per file to report the failing ones
+
+    Returns:
+        List[Tuple[Union[str, List[str]], Optional[AntibugCompile], Optional[str]]]: (target, compilation, error)
+    """
+    if len(files) == 1:
+        return [_compile_target(files[0], version, **compile_kwargs)]
+    result = _compile_target(files, version, **compile_kwargs)
+    if result[1] is not None:
+        return [result]
+    return [_compile_target(file, version, **compile_kwargs) for file in files]
+
 
 class SafeDevAnalyzer():
     def __init__(self, file: str, **kwargs) -> None:
+        """
+        Args:
+            file (str): solidity file or directory
+        Keyword Args:
+            jobs (int): number of worker processes used to compile the files of a directory,
+                and to run the detectors. 1 (default) runs in the current process, None uses every available core
+            offline (bool): never download the solc release index or binaries
+            solc_version (str): installed solc version used for every file, instead of
+                resolving it from the pragma of each file
+            compile_cache (bool): reuse the solc artifacts of previous identical compilations (default True)
+            batch (bool): compile all the files of a directory that need the same solc version
+                in a single solc call, producing one compilation unit per version
+            standard_json (str): compile through solc --standard-json, requesting only the outputs
+                needed by the command ("detect": ASTs, "compile": ASTs, ABIs and bytecodes)
+            snapshot (bool): reuse the analyzed Slither objects saved by previous runs on the same
+                compilation artifacts, and save the new ones (default False)
+            incremental (bool): only analyze and check again the contracts changed since the
+                previous run (and the contracts depending on them), reusing the other results
+            profile (bool): record the time and memory of the compilation, the analysis,
+                the detectors and the printers in self.profiler (default False)
+        """
         self.file_path = os.path.abspath(file)
         self.file_basename = os.path.basename(file)
         self.file_name = []
@@ -17,36 +126,91 @@ class SafeDevAnalyzer():
         self.abi_list = []
         self.bytecode_list = []
         self.solc_parse = None
-        
+        self.jobs: Optional[int] = kwargs.get("jobs", 1)
+        self.offline: bool = kwargs.get("offline", SOLC_PARSER_OFFLINE)
+        self.solc_version: Optional[str] = kwargs.get("solc_version", None)
+        self.compile_cache: bool = kwargs.get("compile_cache", True)
+        self.batch: bool = kwargs.get("batch", False)
+        self.standard_json: Optional[str] = kwargs.get("standard_json", None)
+        self.snapshot: bool = kwargs.get("snapshot", False)
+        self.incremental: bool = kwargs.get("incremental", False)
+        self.profiler = Profiler(enabled=kwargs.get("profile", False))
+        # compilation unit name -> state of the previous run, when incremental
+        self.incremental_states: Dict[str, IncrementalState] = {}
+        self.compile_kwargs = {"solc_cache": self.compile_cache, "solc_standard_json": self.standard_json}
+        # file -> error message, for every file that failed to compile or to be analyzed
+        self.compile_errors: Dict[str, str] = {}
+
         try:
             if os.path.isdir(self.file_path):
                 self.file_list = self.find_all_solidity_files('.sol')
-                self.antibug_compile.extend(self.get_antibug_compile_list())
+                with self.profiler.phase("compile", self.file_path):
+                    self.antibug_compile.extend(self.get_antibug_compile_list())
                 for crytic, filename in zip(self.antibug_compile, self.file_name):
-                    self.compilation_units[filename] = Slither(crytic)
+                    try:
+                        self.compilation_units[filename] = self._analyze(filename, crytic)
+                    except Exception as e:  # pylint: disable=broad-except
+                        self._report_error(crytic.targets, f"{type(e).__name__}: {e}")
             elif os.path.isfile(self.file_path):
                 if self.file_path.endswith('.sol'):
                     self.file_list.append(self.file_path)
-                    if self.solc_parse is None:
-                        self.solc_parse = SolcParser(self.file_list[0])
-                    self.solc_parse.run_parser()   
-                    self.antibug_compile.append(AntibugCompile(self.file_list[0], self.solc_parse._solc_binary_version))
-                    
-                    self.compilation_units[os.path.basename(self.file_path)] = Slither(self.antibug_compile[0]) 
-                    
+                    version = self.solc_version
+                    if version is None:
+                        with self.profiler.phase("compile", "solc version"):
+                            if self.solc_parse is None:
+                                self.solc_parse = SolcParser(self.file_list[0], self.offline)
+                            self.solc_parse.run_parser()
+                        version = self.solc_parse._solc_binary_version
+                    with self.profiler.phase("compile", self.file_path):
+                        self.antibug_compile.append(AntibugCompile(self.file_list[0], version, **self.compile_kwargs))
+
+                    self.compilation_units[os.path.basename(self.file_path)] = self._analyze(os.path.basename(self.file_path), self.antibug_compile[0])
+
         except InvalidCompilation:
             return
 
-    def to_compile(self): 
-        file_path = self.file_list
-        i = 0
+    def _analyze(self, name: str, antibug_compile: AntibugCompile) -> Slither:
+        """Parse and analyze a compilation, or load its snapshot
+
+        Args:
+            name (str): name of the compilation unit
+            antibug_compile (AntibugCompile): compilation
+
+        Returns:
+            Slither: analyzed compilation
+        """
+        contracts_to_analyze = None
+        if self.incremental:
+            state = IncrementalState(antibug_compile)
+            self.incremental_states[name] = state
+            contracts_to_analyze = state.contracts_to_analyze
+
+        if not self.snapshot:
+            return Slither(antibug_compile, contracts_to_analyze=contracts_to_analyze, profiler=self.profiler)
+
+        path = snapshot_path(compute_snapshot_key(antibug_compile))
+        with self.profiler.phase("analysis", "snapshot load"):
+            slither = load_snapshot(path)
+        if slither is not None:
+            slither.profiler = self.profiler
+        else:
+            slither = Slither(antibug_compile, contracts_to_analyze=contracts_to_analyze, profiler=self.profiler)
+            # A partial analysis must not be reused by a complete run
+            if contracts_to_analyze is None:
+                with self.profiler.phase("analysis", "snapshot save"):
+                    save_snapshot(slither, path)
+        return slither
+
+    def to_compile(self):
         for antibug_compile in self.antibug_compile:
-            filename_object = antibug_compile.filename_lookup(file_path[i])
-            self.abi_list.append(antibug_compile._compilation_units[file_path[i]]._source_units[filename_object].abis)
-            self.bytecode_list.append(antibug_compile._compilation_units[file_path[i]]._source_units[filename_object]._init_bytecodes)
-            i += 1
+            compilation_unit = antibug_compile._compilation_units[antibug_compile.target]
+            for target in antibug_compile.targets:
+                filename_object = compilation_unit.filename_lookup(target)
+                source_unit = compilation_unit._source_units[filename_object]
+                self.abi_list.append(source_unit.abis)
+                self.bytecode_list.append(source_unit._init_bytecodes)
         return self.abi_list, self.bytecode_list
-    
+
     def find_all_solidity_files(self, extension: str):
         file_list = []
         for root, dirs, files in os.walk(self.file_path):
@@ -55,15 +219,50 @@ class SafeDevAnalyzer():
                     file_path = os.path.join(root, file)
                     file_list.append(file_path)
         return file_list
-    
-    def get_antibug_compile_list(self):
+
+    def _map(self, function, *iterables) -> list:
+        """Run function over the iterables, in a process pool if jobs != 1. The order is preserved"""
+        if self.jobs == 1 or len(iterables[0]) <= 1:
+            return list(map(function, *iterables))
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            return list(executor.map(function, *iterables))
+
+    def get_antibug_compile_list(self) -> List[AntibugCompile]:
+        if self.batch:
+            results = self._batch_compile()
+        else:
+            compile_file = partial(_compile_file, offline=self.offline, solc_version=self.solc_version, **self.compile_kwargs)
+            results = self._map(compile_file, self.file_list)
+
         compilation_units = []
-        for file in self.file_list:
-            try:
-                self.file_name.append(os.path.basename(file))
-                self.solc_parse = SolcParser(file)
-                self.solc_parse.run_parser()
-                compilation_units.append(AntibugCompile(file, self.solc_parse._solc_binary_version))
-            except:
-                print('compile error')
-        return compilation_units
\ No newline at end of file
+        for target, antibug_compile, error in results:
+            if antibug_compile is None:
+                self._report_error(target, error)
+                continue
+            if isinstance(target, str):
+                self.file_name.append(os.path.basename(target))
+            else:
+                self.file_name.append(f"solc-{antibug_compile.compiler_version}")
+            compilation_units.append(antibug_compile)
+        return compilation_units
+
+    def _batch_compile(self) -> List[Tuple[Union[str, List[str]], Optional[AntibugCompile], Optional[str]]]:
+        # Resolve the versions first: installing the same solc from several workers is wasteful
+        versions: Dict[str, List[str]] = {}
+        results = []
+        resolve_version = partial(_resolve_version, offline=self.offline, solc_version=self.solc_version)
+        for file, version, error in map(resolve_version, self.file_list):
+            if version is None:
+                results.append((file, None, error))
+            else:
+                versions.setdefault(version, []).append(file)
+
+        compile_group = partial(_compile_group, **self.compile_kwargs)
+        for group_results in self._map(compile_group, list(versions.keys()), list(versions.values())):
+            results.extend(group_results)
+        return results
+
+    def _report_error(self, target: Union[str, List[str]], error: str) -> None:
+        file = target if isinstance(target, str) else " ".join(target)
+        self.compile_errors[file] = error
+        print(f"compile error: {file}: {error}")
@@ -15,6 +15,7 @@ from antibug.compile.compilation_unit import CompilationUnit
 # from antibug.antibug_compile.compiler import CompilerVersion
 from antibug.compile.parse_version_and_install_solc import SolcParser
 from antibug.compile.exceptions import InvalidCompilation
+from antibug.compile.utils.artifact_cache import compute_cache_key, load_artifacts, store_artifacts
 from antibug.compile.utils.naming import (
     combine_filename_name,
     convert_filename,
@@ -140,8 +141,14 @@ class Solc():
     NAME = "solc"
     PROJECT_URL = "https://github.com/ethereum/solidity"
     
-    def __init__(self, target: str, binary:str, **kwargs: str):
-        self.target = target
+    def __init__(self, target: Union[str, List[str]], binary:str, **kwargs: str):
+        # A list of files is compiled with a single solc call (batch mode)
+        if isinstance(target, str):
+            self.targets: List[str] = [target]
+            self.target = target
+        else:
+            self.targets = list(target)
+            self.target = os.path.commonpath(self.targets) if len(self.targets) > 1 else self.targets[0]
         self.compiler_version = binary
 
 
@@ -159,15 +166,20 @@ class Solc():
         solc_working_dir = kwargs.get("solc_working_dir", None)
         force_legacy_json = kwargs.get("solc_force_legacy_json", False)
         compilation_unit = CompilationUnit(antibug_compile, str(self.target), self.compiler_version)
-        targets_json = _get_targets_json(compilation_unit, self.target, **kwargs)
-
-        # there have been a couple of changes in solc starting from 0.8.x,
-        if force_legacy_json and _is_at_or_above_minor_version(compilation_unit, 8):
-            raise InvalidCompilation("legacy JSON not supported from 0.8.x onwards")
 
         skip_filename = compilation_unit.compiler_version in [
             f"0.4.{x}" for x in range(0, 10)
         ]
+        if skip_filename and len(self.targets) > 1:
+            raise InvalidCompilation(
+                f"solc {compilation_unit.compiler_version} does not report filenames, files must be compiled one by one"
+            )
+
+        targets_json = _get_targets_json(compilation_unit, self.targets, **kwargs)
+
+        # there have been a couple of changes in solc starting from 0.8.x,
+        if force_legacy_json and _is_at_or_above_minor_version(compilation_unit, 8):
+            raise InvalidCompilation("legacy JSON not supported from 0.8.x onwards")
         if "sources" in targets_json:
             for path, info in targets_json["sources"].items():
                 if skip_filename:
@@ -214,14 +226,15 @@ class Solc():
         return False
 
 
-def _get_targets_json(compilation_unit: "CompilationUnit", target: str, **kwargs: Any) -> Dict:
+def _get_targets_json(compilation_unit: "CompilationUnit", target: Union[str, List[str]], **kwargs: Any) -> Dict:
     """Run the compilation, population the compilation info, and returns the json compilation artifacts
 
     Args:
         compilation_unit (CompilationUnit): Compilation unit
-        target (str): path to the solidity file
+        target (Union[str, List[str]]): path to the solidity file(s)
         **kwargs: optional arguments. Used: "solc", "solc_disable_warnings", "solc_args", "solc_remaps",
-            "solc_solcs_bin", "solc_solcs_select", "solc_working_dir", "solc_force_legacy_json"
+            "solc_solcs_bin", "solc_solcs_select", "solc_working_dir", "solc_force_legacy_json", "solc_cache",
+            "solc_standard_json"
 
     Returns:
         Dict: Json of the compilation artifacts
@@ -244,6 +257,22 @@ def _get_targets_json(compilation_unit: "CompilationUnit", target: str, **kwargs
     # solcs_env is always a list. It matches solc-select list
     solc_working_dir = kwargs.get("solc_working_dir", None)
     force_legacy_json = kwargs.get("solc_force_legacy_json", False)
+    use_cache: bool = kwargs.get("solc_cache", True)
+    # Name of the output selection (see STANDARD_JSON_OUTPUTS), None to use --combined-json
+    standard_json: Optional[str] = kwargs.get("solc_standard_json", None)
+
+    if standard_json and _supports_standard_json(compilation_unit.compiler_version, solc_arguments):
+        return _run_solc_standard_json(
+            compilation_unit,
+            target,
+            solc_disable_warnings,
+            solc_arguments,
+            STANDARD_JSON_OUTPUTS[standard_json],
+            solc_remaps=solc_remaps,
+            working_dir=solc_working_dir,
+            use_cache=use_cache,
+            selection_name=standard_json,
+        )
 
     return _run_solc(
         compilation_unit,
@@ -254,6 +283,7 @@ def _get_targets_json(compilation_unit: "CompilationUnit", target: str, **kwargs
         solc_remaps=solc_remaps,
         working_dir=solc_working_dir,
         force_legacy_json=force_legacy_json,
+        use_cache=use_cache,
     )
 
 
@@ -370,7 +400,7 @@ def _build_options(compiler_version: SolcParser, force_legacy_json: bool) -> str
 # pylint: disable=too-many-arguments,too-many-locals,too-many-branches,too-many-statements
 def _run_solc(
     compilation_unit: "CompilationUnit",
-    filename: str,
+    filename: Union[str, List[str]],
     solc: str,
     solc_disable_warnings: bool,
     solc_arguments: Optional[str],
@@ -378,13 +408,14 @@ def _run_solc(
     env: Optional[Dict] = None,
     working_dir: Optional[Union[Path, str]] = None,
     force_legacy_json: bool = False,
+    use_cache: bool = True,
 ) -> Dict:
     """Run solc.
     Ensure that antibug_compile.compiler_version is set prior calling _run_solc
 
     Args:
         compilation_unit (CompilationUnit): Associated compilation unit
-        filename (str): Solidity file to compile
+        filename (Union[str, List[str]]): Solidity file(s) to compile, in a single solc call
         solc (str): Solc binary
         solc_disable_warnings (bool): If True, disable solc warnings
         solc_arguments (Optional[str]): Additional solc cli arguments
@@ -392,6 +423,7 @@ def _run_solc(
         env (Optional[Dict]): Environement variable when solc is run. Defaults to None.
         working_dir (Optional[Union[Path, str]]): Working directory when solc is run. Defaults to None.
         force_legacy_json (bool): Force to use the legacy json format. Defaults to False.
+        use_cache (bool): Reuse the artifacts of a previous identical compilation. Defaults to True.
 
     Raises:
         InvalidCompilation: If solc failed to run or file is not a solidity file
@@ -411,7 +443,8 @@ def _run_solc(
         if isinstance(solc_remaps, str):
             solc_remaps = solc_remaps.split(" ")
         cmd += solc_remaps
-    cmd += [filename, "--combined-json", options]
+    filenames = [filename] if isinstance(filename, str) else list(filename)
+    cmd += filenames + ["--combined-json", options]
     if solc_arguments:
         # To parse, we first split the string on each '--'
         solc_args = solc_arguments.split("--")
@@ -424,6 +457,17 @@ def _run_solc(
         solc_args = [item.strip() for sublist in solc_args_ for item in sublist if item]
         cmd += solc_args
 
+    cache_key = None
+    if use_cache:
+        cache_key = compute_cache_key(
+            filenames, compiler_version, options, cmd, solc_remaps, working_dir
+        )
+        if cache_key is not None:
+            cached = load_artifacts(cache_key)
+            if cached is not None:
+                LOGGER.info("'%s' loaded from the compilation cache", " ".join(filenames))
+                return cached
+
     try:
         LOGGER.info(
             "'%s' running",
@@ -458,11 +502,219 @@ def _run_solc(
         
     try:
         ret: Dict = json.loads(stdout)
-        return ret
+    except json.decoder.JSONDecodeError:
+        # pylint: disable=raise-missing-from
+        raise InvalidCompilation(f"Invalid solc compilation {stderr}")
+    if cache_key is not None:
+        store_artifacts(cache_key, ret)
+    return ret
+
+
+
+# Outputs requested to solc --standard-json, per command
+# "detect" only needs the ASTs, "compile" also needs the ABIs and the bytecodes
+STANDARD_JSON_OUTPUTS: Dict[str, Dict[str, List[str]]] = {
+    "detect": {"": ["ast"]},
+    "compile": {
+        "": ["ast"],
+        "*": ["abi", "evm.bytecode.object", "evm.deployedBytecode.object"],
+    },
+}
+
+
+def _supports_standard_json(compiler_version: str, solc_arguments: Optional[str]) -> bool:
+    """Check if the compilation can go through --standard-json
+    The compact AST is only available from 0.4.12, and the only cli argument
+    translated into the standard json settings is --optimize
+
+    Args:
+        compiler_version (str): solc version
+        solc_arguments (Optional[str]): additional solc cli arguments
+
+    Returns:
+        bool: True if --standard-json can be used
+    """
+    old_versions = [f"0.4.{x}" for x in range(0, 12)]
+    if compiler_version in old_versions or compiler_version.startswith("0.3"):
+        return False
+    if solc_arguments and solc_arguments.strip() not in ("--optimize",):
+        return False
+    return True
+
+
+def _build_standard_json_input(
+    filenames: List[str],
+    outputs: Dict[str, List[str]],
+    solc_remaps: Optional[List[str]],
+    solc_arguments: Optional[str],
+) -> Dict:
+    """Build the solc --standard-json input
+
+    Args:
+        filenames (List[str]): Solidity files to compile
+        outputs (Dict[str, List[str]]): contract name ("" for the file level) -> requested outputs
+        solc_remaps (Optional[List[str]]): Solc remaps
+        solc_arguments (Optional[str]): Additional solc cli arguments
+
+    Returns:
+        Dict: standard json input
+    """
+    settings: Dict[str, Any] = {"outputSelection": {"*": outputs}}
+    if solc_remaps:
+        settings["remappings"] = solc_remaps
+    if is_optimized(solc_arguments):
+        settings["optimizer"] = {"enabled": True}
+    return {
+        "language": "Solidity",
+        "sources": {filename: {"urls": [filename]} for filename in filenames},
+        "settings": settings,
+    }
+
+
+def _standard_json_to_combined_json(compilation_unit: "CompilationUnit", output: Dict) -> Dict:
+    """Convert the solc --standard-json output to the --combined-json layout
+    expected by Solc.compile and solc_handle_contracts
+
+    Args:
+        compilation_unit (CompilationUnit): Associated compilation unit
+        output (Dict): standard json output
+
+    Returns:
+        Dict: combined json artifacts
+    """
+    is_above_0_8 = _is_at_or_above_minor_version(compilation_unit, 8)
+    sources = {
+        path: {"AST": info["ast"]} for path, info in output.get("sources", {}).items() if "ast" in info
+    }
+    contracts = {}
+    for path, file_contracts in output.get("contracts", {}).items():
+        for contract_name, info in file_contracts.items():
+            if "abi" not in info and "evm" not in info:
+                continue
+            evm = info.get("evm", {})
+            abi = info.get("abi", [])
+            contracts[combine_filename_name(path, contract_name)] = {
+                # Before 0.8, --combined-json gives the abi as a string
+                "abi": abi if is_above_0_8 else json.dumps(abi),
+                "bin": evm.get("bytecode", {}).get("object", ""),
+                "bin-runtime": evm.get("deployedBytecode", {}).get("object", ""),
+                "srcmap": evm.get("bytecode", {}).get("sourceMap", ""),
+                "srcmap-runtime": evm.get("deployedBytecode", {}).get("sourceMap", ""),
+            }
+    ret: Dict = {"sources": sources, "sourceList": list(sources.keys())}
+    if contracts:
+        ret["contracts"] = contracts
+    return ret
+
+
+# pylint: disable=too-many-arguments,too-many-locals
+def _run_solc_standard_json(
+    compilation_unit: "CompilationUnit",
+    filename: Union[str, List[str]],
+    solc_disable_warnings: bool,
+    solc_arguments: Optional[str],
+    outputs: Dict[str, List[str]],
+    solc_remaps: Optional[Union[str, List[str]]] = None,
+    working_dir: Optional[Union[Path, str]] = None,
+    use_cache: bool = True,
+    selection_name: str = "",
+) -> Dict:
+    """Run solc --standard-json, requesting only the given outputs.
+    Unlike --combined-json, the unused outputs (asm, natspec, srcmaps...) are never generated
+
+    Args:
+        compilation_unit (CompilationUnit): Associated compilation unit
+        filename (Union[str, List[str]]): Solidity file(s) to compile, in a single solc call
+        solc_disable_warnings (bool): If True, disable solc warnings
+        solc_arguments (Optional[str]): Additional solc cli arguments (only --optimize is supported)
+        outputs (Dict[str, List[str]]): requested outputs (see STANDARD_JSON_OUTPUTS)
+        solc_remaps (Optional[Union[str, List[str]]], optional): Solc remaps. Defaults to None.
+        working_dir (Optional[Union[Path, str]]): Working directory when solc is run. Defaults to None.
+        use_cache (bool): Reuse the artifacts of a previous identical compilation. Defaults to True.
+        selection_name (str): Name of the output selection, part of the cache key
+
+    Raises:
+        InvalidCompilation: If solc failed to run or reported an error
+
+    Returns:
+        Dict: Json compilation artifacts, in the --combined-json layout
+    """
+    compiler_version = compilation_unit.compiler_version
+    compiler_path = str(SOLC_BINARIES_DIR.joinpath(f"solc-{compiler_version}/solc-{compiler_version}"))
+
+    filenames = [filename] if isinstance(filename, str) else list(filename)
+    if isinstance(solc_remaps, str):
+        solc_remaps = solc_remaps.split(" ")
+
+    # solc only reads the files (and their imports) located in the allowed paths
+    cwd = Path(working_dir) if working_dir else Path.cwd()
+    allowed_paths = {str(cwd.absolute())} | {os.path.dirname(os.path.abspath(f)) for f in filenames}
+    allowed_paths |= {os.path.abspath(remap.split("=", 1)[1]) for remap in solc_remaps or [] if "=" in remap}
+    allowed_paths = sorted(allowed_paths)
+    cmd = [compiler_path, "--standard-json", "--allow-paths", ",".join(allowed_paths)]
+
+    standard_json_input = _build_standard_json_input(filenames, outputs, solc_remaps, solc_arguments)
+
+    cache_key = None
+    if use_cache:
+        cache_key = compute_cache_key(
+            filenames,
+            compiler_version,
+            f"standard-json:{selection_name}:{json.dumps(standard_json_input['settings'], sort_keys=True)}",
+            cmd,
+            solc_remaps,
+            working_dir,
+        )
+        if cache_key is not None:
+            cached = load_artifacts(cache_key)
+            if cached is not None:
+                LOGGER.info("'%s' loaded from the compilation cache", " ".join(filenames))
+                return cached
+
+    try:
+        LOGGER.info(
+            "'%s' running",
+            " ".join(cmd),
+        )
+
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            executable=shutil.which(cmd[0]),
+        )
+    except OSError as error:
+        # pylint: disable=raise-missing-from
+        raise InvalidCompilation(error)
+    stdout_, stderr_ = process.communicate(json.dumps(standard_json_input).encode("utf-8"))
+    stdout, stderr = (
+        stdout_.decode(encoding="utf-8", errors="ignore"),
+        stderr_.decode(encoding="utf-8", errors="ignore"),
+    )  # convert bytestrings to unicode strings
+
+    if stderr and (not solc_disable_warnings):
+        LOGGER.error(stderr)
+
+    try:
+        output: Dict = json.loads(stdout)
     except json.decoder.JSONDecodeError:
         # pylint: disable=raise-missing-from
         raise InvalidCompilation(f"Invalid solc compilation {stderr}")
 
+    errors = [e for e in output.get("errors", []) if e.get("severity") == "error"]
+    if errors:
+        raise InvalidCompilation(
+            "Invalid solc compilation " + "\n".join(e.get("formattedMessage", e.get("message", "")) for e in errors)
+        )
+    if not solc_disable_warnings:
+        for warning in output.get("errors", []):
+            LOGGER.warning(warning.get("formattedMessage", warning.get("message", "")))
+
+    ret = _standard_json_to_combined_json(compilation_unit, output)
+    if cache_key is not None:
+        store_artifacts(cache_key, ret)
+    return ret
 
 
 PATTERN = re.compile(r"pragma solidity\s*(?:\^|>=|<=)?\s*(\d+\.\d+\.\d+)")
@@ -0,0 +1,180 @@
+"""
+Content-addressed cache of the solc compilation artifacts
+The key covers everything that can change the output of solc:
+the content of the target and of all the files it imports (transitively),
+the compiler version, the remappings and the command line options
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Union
+
+from antibug.compile.parse_version_and_install_solc import SOLC_PARSER_DIR
+
+LOGGER = logging.getLogger("AntibugCompile")
+
+COMPILE_CACHE_DIR = SOLC_PARSER_DIR.joinpath("compile-cache")
+
+# Bump when the format of the stored artifacts changes
+CACHE_FORMAT_VERSION = 1
+
+COMMENTS_PATTERN = re.compile(rb"//[^\n]*|/\*.*?\*/", re.DOTALL)
+IMPORT_PATTERN = re.compile(rb"\bimport\b[^;]*?[\"']([^\"']+)[\"']")
+
+
+def _parse_remappings(solc_remaps: Optional[List[str]]) -> List[List[str]]:
+    """Convert "[context:]prefix=target" remappings to [prefix, target]
+
+    Args:
+        solc_remaps (Optional[List[str]]): remappings
+
+    Returns:
+        List[List[str]]: [prefix, target], longest prefix first
+    """
+    remappings = []
+    for remap in solc_remaps or []:
+        if "=" not in remap:
+            continue
+        prefix, target = remap.split("=", 1)
+        prefix = prefix.split(":", 1)[-1]
+        remappings.append([prefix, target])
+    return sorted(remappings, key=lambda x: len(x[0]), reverse=True)
+
+
+def _resolve_import(
+    import_path: str, importer: Path, cwd: Path, remappings: List[List[str]]
+) -> Optional[Path]:
+    """Find the file imported by importer, following the same heuristics as solc and
+    naming._verify_filename_existence
+
+    Returns:
+        Optional[Path]: the imported file, None if it cannot be found
+    """
+    for prefix, target in remappings:
+        if import_path.startswith(prefix):
+            import_path = target + import_path[len(prefix) :]
+            break
+
+    candidates = []
+    if import_path.startswith("."):
+        candidates.append(importer.parent.joinpath(import_path))
+    candidates += [
+        Path(import_path),
+        cwd.joinpath(import_path),
+        cwd.joinpath("contracts", import_path),
+        cwd.joinpath("node_modules", import_path),
+    ]
+    candidates += [parent.joinpath("node_modules", import_path) for parent in cwd.parents]
+
+    for candidate in candidates:
+        if candidate.is_file():
+            return Path(os.path.normpath(candidate.absolute()))
+    return None
+
+
+def collect_sources(
+    filename: Union[str, List[str]], solc_remaps: Optional[List[str]], working_dir: Optional[str]
+) -> Optional[Dict[Path, bytes]]:
+    """Return the content of the target(s) and of all their transitive imports
+
+    Args:
+        filename (Union[str, List[str]]): solidity file(s)
+        solc_remaps (Optional[List[str]]): remappings
+        working_dir (Optional[str]): working directory of solc
+
+    Returns:
+        Optional[Dict[Path, bytes]]: file -> content. None if an import cannot be resolved,
+            in which case the compilation must not be cached
+    """
+    cwd = Path(working_dir).absolute() if working_dir else Path.cwd()
+    remappings = _parse_remappings(solc_remaps)
+
+    filenames = [filename] if isinstance(filename, str) else filename
+    sources: Dict[Path, bytes] = {}
+    to_explore: List[Path] = [Path(os.path.normpath(cwd.joinpath(f))) for f in filenames]
+    seen: Set[Path] = set(to_explore)
+    while to_explore:
+        current = to_explore.pop()
+        try:
+            with open(current, "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+        sources[current] = content
+
+        for import_path in IMPORT_PATTERN.findall(COMMENTS_PATTERN.sub(b"", content)):
+            imported = _resolve_import(
+                import_path.decode("utf-8", errors="replace"), current, cwd, remappings
+            )
+            if imported is None:
+                LOGGER.info("%s: cannot resolve %s, compilation not cached", current, import_path)
+                return None
+            if imported not in seen:
+                seen.add(imported)
+                to_explore.append(imported)
+    return sources
+
+
+def compute_cache_key(
+    filename: Union[str, List[str]],
+    compiler_version: str,
+    options: str,
+    cmd: List[str],
+    solc_remaps: Optional[List[str]],
+    working_dir: Optional[str],
+) -> Optional[str]:
+    """Compute the cache key of a solc run
+
+    Args:
+        filename (Union[str, List[str]]): solidity file(s)
+        compiler_version (str): solc version
+        options (str): --combined-json outputs (see solc._build_options)
+        cmd (List[str]): full solc command line
+        solc_remaps (Optional[List[str]]): remappings
+        working_dir (Optional[str]): working directory of solc
+
+    Returns:
+        Optional[str]: hex digest, None if the compilation cannot be cached
+    """
+    sources = collect_sources(filename, solc_remaps, working_dir)
+    if sources is None:
+        return None
+
+    sha = hashlib.sha256()
+    # The used filenames and the working directory end up in the artifacts
+    header = [str(CACHE_FORMAT_VERSION), compiler_version, options, str(working_dir or Path.cwd())]
+    for item in header + cmd[1:]:
+        sha.update(item.encode("utf-8"))
+        sha.update(b"\0")
+    for path in sorted(sources):
+        sha.update(str(path).encode("utf-8"))
+        sha.update(b"\0")
+        sha.update(hashlib.sha256(sources[path]).digest())
+    return sha.hexdigest()
+
+
+def load_artifacts(key: str, cache_dir: Path = COMPILE_CACHE_DIR) -> Optional[Dict]:
+    """Return the artifacts stored for the key, None on cache miss"""
+    path = cache_dir.joinpath(key[:2], f"{key}.pickle")
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def store_artifacts(key: str, artifacts: Dict, cache_dir: Path = COMPILE_CACHE_DIR) -> None:
+    """Store the decoded --combined-json output of solc for the key"""
+    directory = cache_dir.joinpath(key[:2])
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = directory.joinpath(f"{key}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(artifacts, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, directory.joinpath(f"{key}.pickle"))
+    except OSError as error:
+        LOGGER.info("Cannot store the compilation artifacts: %s", error)
@@ -0,0 +1,59 @@
+"""
+Compact offset -> (line, column) index of a source file
+
+A file is indexed by the offsets at which its lines start, stored in an array.
+An offset is converted to its line by a binary search over that array:
+the index takes 8 bytes per line instead of a tuple per byte.
+"""
+
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Tuple
+
+
+def compute_line_starts(lines: List[bytes]) -> array:
+    """Compute the line start offsets of a file
+
+    Args:
+        lines (List[bytes]): lines of the file, line endings included
+
+    Returns:
+        array: offset of the start of each line (line 1 at index 0),
+            followed by the size of the file
+    """
+    return array("Q", accumulate((len(line) for line in lines), initial=0))
+
+
+def offset_to_line(line_starts: array, offset: int) -> Tuple[int, int]:
+    """Return the line and column of an offset. Both start at 1.
+    The end of the file is (number of lines + 1, 0)
+
+    Args:
+        line_starts (array): index computed by compute_line_starts
+        offset (int): offset in the file
+
+    Returns:
+        Tuple[int, int]: (line, column)
+    """
+    if offset < 0 or offset > line_starts[-1]:
+        raise KeyError(offset)
+    line = bisect_right(line_starts, offset)
+    if line == len(line_starts):
+        return line, 0
+    return line, offset - line_starts[line - 1] + 1
+
+
+def line_to_offset(line_starts: array, line: int) -> int:
+    """Return the offset of the start of a line. Lines start at 1
+
+    Args:
+        line_starts (array): index computed by compute_line_starts
+        line (int): line
+
+    Returns:
+        int: offset
+    """
+    if line < 1 or line >= len(line_starts):
+        raise KeyError(line)
+    return line_starts[line - 1]
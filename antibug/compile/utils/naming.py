@@ -138,8 +138,30 @@ def convert_filename(
         working_dir (Optional[Union[str, Path]], optional): Working directory. Defaults to None.
 
     Returns:
-        Filename: Filename converted
+        Filename: Filename converted. The conversions are cached by antibug_compile:
+            a file used by several sources and contracts is looked up once
     """
+    # The relative path depends on the cwd of the process
+    key = (
+        str(used_filename),
+        None if working_dir is None else str(working_dir),
+        os.getcwd(),
+        relative_to_short,
+    )
+    cached = antibug_compile._cached_filenames.get(key)  # pylint: disable=protected-access
+    if cached is not None:
+        return cached
+
+    filename = _convert_filename(used_filename, relative_to_short, working_dir)
+    antibug_compile._cached_filenames[key] = filename  # pylint: disable=protected-access
+    return filename
+
+
+def _convert_filename(
+    used_filename: Union[str, Path],
+    relative_to_short: Callable[[Path], Path],
+    working_dir: Optional[Union[str, Path]] = None,
+) -> Filename:
     filename_txt = used_filename
     # if platform.system() == "Windows":
     #     elements = list(Path(filename_txt).parts)
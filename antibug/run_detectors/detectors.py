@@ -3,10 +3,12 @@ import logging
 import traceback
 import inspect
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 from antibug.compile.safe_dev_analyzer import SafeDevAnalyzer
 from slither_core.exceptions import SlitherException
+from slither_core.slither import Slither
+from slither_core.utils.parallel import detect_raw
 from slither_core.detectors import all_detectors
 from slither_core.detectors.abstract_detector import AbstractDetector
 
@@ -20,6 +22,8 @@ class RunDetector():
         self.json_results: Dict[str, Any] = {}
         self.selected_detectors = detectors if detectors is not None else []
         self.safe_dev_analyzer = safe_dev_analyzer
+        # number of worker processes running the detectors, None uses every core
+        self.jobs: Optional[int] = safe_dev_analyzer.jobs
 
     def get_all_detectors_import_list(self):
         import_list_ = [getattr(all_detectors, name) for name in dir(all_detectors)]
@@ -38,34 +42,31 @@ class RunDetector():
 
 
     def register_and_run_detectors(self):
+        if self.safe_dev_analyzer.incremental:
+            return self.register_and_run_detectors_incremental()
         try: 
             compilation_unit_list = list(self.safe_dev_analyzer.compilation_units.values())
             results = []
             result=[]
         
             compilation_units_detect_results=[]
-            for compilnation_unit in compilation_unit_list:
-                if not self.selected_detectors:
-                    for item in self.import_list:
-                        compilnation_unit.register_detector(item)
-                    results=compilnation_unit.run_detectors()
-                elif self.selected_detectors:
+            if not self.selected_detectors:
+                results = self.run_all_detectors(compilation_unit_list)
+            else:
+                for compilnation_unit in compilation_unit_list:
                     for detector in self.selected_detectors:
                         if detector in self.category_list:
                             for item in self.available_detector[detector]:
                                 compilnation_unit.register_detector(item)
-                            results.append(compilnation_unit.run_detectors())
+                            results.append(compilnation_unit.run_detectors(self.jobs))
                         elif detector in self.available_detector.keys():
                             compilnation_unit.register_detector(
                                 self.available_detector[detector])
-                            results.append(compilnation_unit.run_detectors())
+                            results.append(compilnation_unit.run_detectors(self.jobs))
                         else:
                             print(f'Error: {self.selected_detectors} is not available')
                             return
                         
-                else:
-                    print(f'Error: {self.selected_detectors} is not available')
-                    return
             # if all((not inner_list for inner_list in sublist) for sublist in results):
             #     self.output_error.append("No detection results")
             #     compilation_units_detect_results.append(None)
@@ -81,6 +82,66 @@ class RunDetector():
         
         return result, self.file, self.output_error
 
+    def run_all_detectors(self, compilation_unit_list: List[Slither]) -> List[List[Dict]]:
+        """Register every detector on the compilation units, and run them all in a single
+        pool of workers when jobs != 1
+
+        Args:
+            compilation_unit_list (List[Slither]): analyzed compilation units
+
+        Returns:
+            List[List[Dict]]: results of every detector, compilation unit after compilation unit
+        """
+        for compilnation_unit in compilation_unit_list:
+            for item in self.import_list:
+                compilnation_unit.register_detector(item)
+        raw_results = detect_raw(
+            [d for compilnation_unit in compilation_unit_list for d in compilnation_unit.detectors], self.jobs,
+            self.safe_dev_analyzer.profiler)
+
+        results = []
+        start = 0
+        for compilnation_unit in compilation_unit_list:
+            end = start + len(compilnation_unit.detectors)
+            results.extend(compilnation_unit.filter_detectors_results(raw_results[start:end]))
+            start = end
+        return results
+
+    def register_and_run_detectors_incremental(self):
+        selected_arguments = set()
+        for detector in self.selected_detectors:
+            if detector in self.category_list:
+                selected_arguments |= {item.ARGUMENT for item in self.available_detector[detector]}
+            elif detector in self.available_detector.keys():
+                selected_arguments.add(self.available_detector[detector].ARGUMENT)
+            else:
+                print(f'Error: {self.selected_detectors} is not available')
+                return [], self.file, [f'{detector} is not available']
+
+        result = []
+        try:
+            results = []
+            for name, compilnation_unit in self.safe_dev_analyzer.compilation_units.items():
+                # Every detector runs on the changed contracts, so that the stored results
+                # are complete whatever detectors are selected by the next runs
+                for item in self.import_list:
+                    compilnation_unit.register_detector(item)
+                state = self.safe_dev_analyzer.incremental_states[name]
+                detector_results = compilnation_unit.run_detectors_incremental(state)
+                for detector, detector_result in zip(compilnation_unit.detectors, detector_results):
+                    if not selected_arguments or detector.ARGUMENT in selected_arguments:
+                        results.append(detector_result)
+            result = self.detect_result(results)
+
+            self.output_error.append(None)
+
+        except SlitherException as e:
+            self.output_error=str(e)
+            traceback.print_exc()
+            logging.error(self.output_error)
+
+        return result, self.file, self.output_error
+
     def detect_result(self, results):
         results_detectors = []
         detector_resultss = [x for x in results if x]  # remove empty results
@@ -50,8 +50,51 @@ def write_to_json(output_dir_path, combined_json, language, filename: Optional[s
             f.write(combined_json)
     except Exception as e:
         print(f"Failed to write to {output_path}. Reason: {e}")
-        
-        
+
+
+class JsonObjectWriter:
+    """Write a json object entry by entry, as json.dumps(obj, indent=2) would
+
+    Every entry is serialized once and flushed as soon as it is written,
+    the whole object is never held in memory.
+
+    Args:
+        output_path (str): path of the json file
+        ensure_ascii (bool): escape the non ASCII characters, as json.dumps
+    """
+
+    def __init__(self, output_path, ensure_ascii=True):
+        self.output_path = output_path
+        self.ensure_ascii = ensure_ascii
+        self.file = None
+        self.entries = 0
+
+    def __enter__(self):
+        try:
+            self.file = open(self.output_path, "w")
+            self.file.write("{")
+        except Exception as e:
+            self.file = None
+            print(f"Failed to write to {self.output_path}. Reason: {e}")
+        return self
+
+    def write(self, key, value):
+        if self.file is None:
+            return
+        # json.dumps only emits newlines to indent, indent the value one level more
+        value_json = json.dumps(value, indent=2, ensure_ascii=self.ensure_ascii).replace("\n", "\n  ")
+        separator = ",\n  " if self.entries else "\n  "
+        self.file.write(f"{separator}{json.dumps(key, ensure_ascii=self.ensure_ascii)}: {value_json}")
+        self.file.flush()
+        self.entries += 1
+
+    def __exit__(self, *exc):
+        if self.file is not None:
+            self.file.write("\n}" if self.entries else "}")
+            self.file.close()
+        return False
+
+
 def read_to_json(json_path):
     with open(json_path, "r") as file:
         json_str = file.read()
@@ -63,96 +106,115 @@ def convert_to_compile_info_json(abi_list, bytecode_list, analyzer: SafeDevAnaly
     output_dir_path = output_dir("compile_json_results")
     language = "compile"
     
-    for abi, bytecode, filename in zip(abi_list, bytecode_list, analyzer.file_list):
-        combined_data = {}
-        for (contract, abi_data), bytecode_data in zip(abi.items(), bytecode.values()):
-            combined_data[contract] = {
-                "abis": abi_data,
-                "bytecodes": "0x" + bytecode_data
-            }
-            result_json = json.dumps(combined_data, indent=2)
-            write_to_json(output_dir_path, result_json, language, filename)
+    compiled_files = [target for antibug_compile in analyzer.antibug_compile for target in antibug_compile.targets]
+    for abi, bytecode, filename in zip(abi_list, bytecode_list, compiled_files):
+        contracts = list(zip(abi.items(), bytecode.values()))
+        if not contracts:
+            continue
+        output_path = get_output_path(filename, output_dir_path, language, "json")
+        with JsonObjectWriter(output_path) as writer:
+            for (contract, abi_data), bytecode_data in contracts:
+                writer.write(contract, {
+                    "abis": abi_data,
+                    "bytecodes": "0x" + bytecode_data
+                })
     print("Output Directory:",os.path.dirname(output_dir_path))
 
 
 
+def get_detect_result(data, safe_dev_analyzer:"SafeDevAnalyzer"):
+    """Fields of a finding shared by the korean and english results
+
+    Args:
+        data (dict): finding of a detector
+        safe_dev_analyzer (SafeDevAnalyzer): analyzer of the finding
+
+    Returns:
+        dict: the finding, with the texts of both languages
+    """
+    combined_data = {}
+    combined_data['filename'] = data["elements"][0]["source_mapping"]["filename_absolute"]
+    combined_data['detector'] = data["check"]
+    combined_data['impact'] = data["impact"]
+    combined_data['confidence'] = data["confidence"]
+    combined_data['element'] = []
+
+    for element in data["elements"]:
+        source_mapping = safe_dev_analyzer.antibug_compile[0].get_code_from_line(safe_dev_analyzer.file_path, element['source_mapping']['lines'][0])
+        element_data = {
+            'type': element['type'],
+            'name': element['name'],
+            'line': element['source_mapping']['lines'][0],
+            'code': source_mapping.decode("utf-8"),
+        }
+        if "type_specific_fields" in element and "parent" in element["type_specific_fields"]:
+            parent = element["type_specific_fields"]["parent"]
+            element_data["parent_type"] = parent.get("type", None)
+            element_data["parent_name"] = parent.get("name", None)
+
+        combined_data['element'].append(element_data)
+    return combined_data
+
+
+DETECT_RESULT_TEXTS = ["info", "description", "background", "exploit_scenario", "examples", "recommendation"]
+
+
 def convert_to_detect_result_json(result_list, filename, error, safe_dev_analyzer:"SafeDevAnalyzer") -> None:
     output_dir_path = output_dir("detector_json_results")
-    combined_data_list = [] 
-    json_result = {}  
     result_list = [item for item in result_list if item is not None and item != '' and item != []]
-    for language in ["korean", "english"]:
-        for data in result_list:
-            # for data in result:
-                combined_data = {}
-                combined_data['filename'] = data["elements"][0]["source_mapping"]["filename_absolute"]
-                combined_data['detector'] = data["check"]
-                combined_data['impact'] = data["impact"]
-                combined_data['confidence'] = data["confidence"]
-                combined_data['element'] = []
-                
-                for element in data["elements"]:
-                    source_mapping = safe_dev_analyzer.antibug_compile[0].get_code_from_line(safe_dev_analyzer.file_path, element['source_mapping']['lines'][0])
-                    element_data = {
-                        'type': element['type'],
-                        'name': element['name'],
-                        'line': element['source_mapping']['lines'][0],
-                        'code': source_mapping.decode("utf-8"),
-                    }
-                    if "type_specific_fields" in element and "parent" in element["type_specific_fields"]:
-                        parent = element["type_specific_fields"]["parent"]
-                        element_data["parent_type"] = parent.get("type", None)
-                        element_data["parent_name"] = parent.get("name", None)
-                    
-                    combined_data['element'].append(element_data)
-                    
-                combined_data['info'] = data["info"]
-                combined_data['description'] = data["description"]
-                combined_data['background'] = data["background"]
-                combined_data['exploit_scenario'] = data["exploit_scenario"]
-                combined_data['examples'] = data["examples"]
-                combined_data['recommendation'] = data["recommendation"]
-                
-                combined_data['info_korean'] = data["info_korean"]
-                combined_data['description_korean'] = data["description_korean"]
-                combined_data['background_korean'] = data["background_korean"]
-                combined_data['exploit_scenario_korean'] = data["exploit_scenario_korean"]
-                combined_data['examples_korean'] = data["examples_korean"]
-                combined_data['recommendation_korean'] = data["recommendation_korean"]
-                
-                combined_data['reference'] = data["reference"]
-                            
-                if language == "korean":
-                    del combined_data["info"]
-                    del combined_data["description"]
-                    del combined_data["background"]
-                    del combined_data["exploit_scenario"]
-                    del combined_data["examples"]
-                    del combined_data["recommendation"]
-                        
-                elif language == "english":
-                    del combined_data["info_korean"]
-                    del combined_data["description_korean"]
-                    del combined_data["background_korean"]
-                    del combined_data["exploit_scenario_korean"]
-                    del combined_data["examples_korean"]
-                    del combined_data["recommendation_korean"]
-                    
-                combined_data_list.append(combined_data)
-                
-        for combined_data in combined_data_list:
-            json_result[combined_data["detector"]] = {"success": error[0] is None, "error": error[0], "results": combined_data}
-            combined_json = json.dumps(json_result, indent=2, ensure_ascii=False)
-            write_to_json(output_dir_path, combined_json, language, filename)
+    if not result_list:
+        return
+
+    # The results are keyed by detector: the last finding of a detector is the one kept
+    last_results = {}
+    for data in result_list:
+        last_results[data["check"]] = data
+
+    success = error[0] is None
+    with JsonObjectWriter(get_output_path(filename, output_dir_path, "korean", "json"), ensure_ascii=False) as korean_writer, \
+            JsonObjectWriter(get_output_path(filename, output_dir_path, "english", "json"), ensure_ascii=False) as english_writer:
+        for detector, data in last_results.items():
+            combined_data = get_detect_result(data, safe_dev_analyzer)
+            korean_data = dict(combined_data)
+            english_data = dict(combined_data)
+            for text in DETECT_RESULT_TEXTS:
+                korean_data[f"{text}_korean"] = data[f"{text}_korean"]
+                english_data[text] = data[text]
+            korean_data['reference'] = data["reference"]
+            english_data['reference'] = data["reference"]
+
+            korean_writer.write(detector, {"success": success, "error": error[0], "results": korean_data})
+            english_writer.write(detector, {"success": success, "error": error[0], "results": english_data})
+
+
+def convert_to_profile_json(safe_dev_analyzer: "SafeDevAnalyzer") -> None:
+    """Write the profile of the run next to the detector results
+
+    Args:
+        safe_dev_analyzer (SafeDevAnalyzer): analyzer created with profile=True
+    """
+    output_dir_path = os.path.join(get_root_dir(), "result/detector_json_results")
+    os.makedirs(output_dir_path, exist_ok=True)
+    filename = os.path.splitext(safe_dev_analyzer.file_basename)[0]
+    output_path = os.path.join(output_dir_path, f"{filename}_profile.json")
+    try:
+        with open(output_path, "w") as f:
+            f.write(safe_dev_analyzer.profiler.to_json(safe_dev_analyzer.file_path))
+    except Exception as e:
+        print(f"Failed to write to {output_path}. Reason: {e}")
 
 
 def convert_to_contract_analysis_info_json(combined_json_list, safe_dev_analyzer:"SafeDevAnalyzer"):
     output_dir_path = output_dir("contract_analysis_json_results")
+    # The last analysis of a contract name is the one kept
     json_result = {}
     for combined_data in combined_json_list:
-        json_result[combined_data["Contract Name"]] = combined_data    
-        combined_json = json.dumps(json_result, indent=2)
-        write_to_json(output_dir_path, combined_json, "analysis", safe_dev_analyzer.file_basename)
+        json_result[combined_data["Contract Name"]] = combined_data
+    if json_result:
+        output_path = get_output_path(safe_dev_analyzer.file_basename, output_dir_path, "analysis", "json")
+        with JsonObjectWriter(output_path) as writer:
+            for contract_name, combined_data in json_result.items():
+                writer.write(contract_name, combined_data)
     print("Output Directory:", os.path.dirname(output_dir_path))
 
 
@@ -0,0 +1,86 @@
+"""
+Memory benchmark of the analysis of a compilation unit
+
+Analyzes a target (solidity file or directory) and reports the memory retained by the
+analysis (tracemalloc), and the shallow size of the CFG nodes, SlithIR operations, variables
+and expressions: the object itself, its attributes dictionary and its containers.
+Run it on a large compilation unit before and after a change of the object layout.
+
+Usage: python -m benchmarks.analysis_memory target.sol [--no-compile-cache]
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from antibug.compile.safe_dev_analyzer import SafeDevAnalyzer
+from slither_core.core.cfg.node import Node
+from slither_core.core.expressions.expression import Expression
+from slither_core.core.variables.variable import Variable
+from slither_core.slithir.operations.operation import Operation
+
+CATEGORIES = [Node, Operation, Variable, Expression]
+CONTAINERS = (list, tuple, set, frozenset, dict)
+
+
+def _attributes(obj: Any) -> List[Any]:
+    values = list(getattr(obj, "__dict__", {}).values())
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if slot not in ("__dict__", "__weakref__") and hasattr(obj, slot):
+                values.append(getattr(obj, slot))
+    return values
+
+
+def shallow_size(obj: Any, seen: set) -> int:
+    """Size of the object, of its attributes dictionary and of the containers it owns
+    A container shared by several objects is counted once"""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    for value in _attributes(obj):
+        if isinstance(value, CONTAINERS) and id(value) not in seen:
+            seen.add(id(value))
+            size += sys.getsizeof(value)
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("target")
+    parser.add_argument("--no-compile-cache", action="store_true")
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    analyzer = SafeDevAnalyzer(args.target, compile_cache=not args.no_compile_cache)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    counts: Dict[str, int] = defaultdict(int)
+    sizes: Dict[str, int] = defaultdict(int)
+    seen: set = set()
+    for obj in gc.get_objects():
+        for category in CATEGORIES:
+            if isinstance(obj, category):
+                counts[category.__name__] += 1
+                sizes[category.__name__] += shallow_size(obj, seen)
+                break
+
+    print(f"{args.target}: {len(analyzer.compilation_units)} compilation unit(s), analyzed in {elapsed:.2f}s")
+    print(f"retained {retained / 2 ** 20:.1f} MB, peak {peak / 2 ** 20:.1f} MB")
+    print(f"{'objects':>12} {'count':>10} {'MB':>8} {'B/object':>9}")
+    for category in CATEGORIES:
+        name = category.__name__
+        count, size = counts[name], sizes[name]
+        print(f"{name:>12} {count:>10} {size / 2 ** 20:>8.2f} {size / max(count, 1):>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Deterministic corpus of solidity files for the benchmarks
+
+Every tier is generated from its parameters and a seed, so two commits benchmarked
+with the same arguments analyze the same code. A tier is a chain of contracts,
+each inheriting from the previous one (depth), with public functions mixing state
+updates, loops, branches, low level calls, events, modifiers, weak randomness,
+tx.origin checks and inline assembly.
+"""
+import os
+import random
+from typing import Dict, List, NamedTuple
+
+
+class Tier(NamedTuple):
+    name: str
+    # number of lines to generate, approximately
+    lines: int
+    # length of the inheritance chain
+    depth: int
+    # share of the functions written in inline assembly
+    assembly: float
+
+
+TIERS = [
+    Tier("small", 120, 1, 0.1),
+    Tier("medium", 1500, 6, 0.2),
+    Tier("large", 6000, 24, 0.3),
+    Tier("assembly", 3000, 4, 0.8),
+]
+
+
+def _state(level: int) -> List[str]:
+    return [
+        f"    address internal owner{level};",
+        f"    uint256 internal total{level};",
+        f"    mapping(address => uint256) internal balances{level};",
+        f"    event Updated{level}(address indexed who, uint256 value);",
+        "",
+        f"    modifier onlyOwner{level}() {{",
+        f"        require(msg.sender == owner{level}, \"owner\");",
+        "        _;",
+        "    }",
+        "",
+    ]
+
+
+def _deposit(level: int, k: int, rng: random.Random) -> List[str]:
+    return [
+        f"    function deposit{level}_{k}(uint256 amount) public payable {{",
+        '        require(amount > 0, "amount");',
+        f"        balances{level}[msg.sender] += amount;",
+        f"        total{level} = total{level} + amount * {rng.randint(1, 100)};",
+        f"        emit Updated{level}(msg.sender, balances{level}[msg.sender]);",
+        "    }",
+        "",
+    ]
+
+
+def _loop(level: int, k: int, rng: random.Random) -> List[str]:
+    return [
+        f"    function loop{level}_{k}(uint256 n) public view returns (uint256 s) {{",
+        "        for (uint256 j = 0; j < n; j++) {",
+        f"            if (j % {rng.randint(2, 9)} == 0) {{",
+        f"                s += j * total{level};",
+        "            } else if (j > s) {",
+        "                s ^= j;",
+        "            } else {",
+        f"                s = s / 2 + balances{level}[msg.sender];",
+        "            }",
+        "        }",
+        "    }",
+        "",
+    ]
+
+
+def _withdraw(level: int, k: int, _rng: random.Random) -> List[str]:
+    return [
+        f"    function withdraw{level}_{k}(uint256 amount) public onlyOwner{level} {{",
+        f"        require(balances{level}[msg.sender] >= amount);",
+        '        (bool ok, ) = msg.sender.call{value: amount}("");',
+        "        require(ok);",
+        f"        balances{level}[msg.sender] -= amount;",
+        "    }",
+        "",
+    ]
+
+
+def _random(level: int, k: int, rng: random.Random) -> List[str]:
+    return [
+        f"    function random{level}_{k}() public view returns (uint256) {{",
+        "        uint256 seed = uint256(keccak256(abi.encodePacked(block.timestamp, msg.sender)));",
+        f"        return seed % {rng.randint(10, 1000)};",
+        "    }",
+        "",
+    ]
+
+
+def _origin(level: int, k: int, _rng: random.Random) -> List[str]:
+    return [
+        f"    function setOwner{level}_{k}(address next) public {{",
+        f"        require(tx.origin == owner{level});",
+        f"        owner{level} = next;",
+        "    }",
+        "",
+    ]
+
+
+def _assembly(level: int, k: int, rng: random.Random) -> List[str]:
+    return [
+        f"    function asm{level}_{k}(uint256 x, uint256 y) public pure returns (uint256 r) {{",
+        "        assembly {",
+        "            let t := add(x, y)",
+        f"            for {{ let j := 0 }} lt(j, {rng.randint(2, 16)}) {{ j := add(j, 1) }} {{",
+        f"                t := xor(shl({rng.randint(1, 8)}, t), shr({rng.randint(1, 8)}, y))",
+        "            }",
+        "            if gt(t, x) { t := sub(t, x) }",
+        "            mstore(0x00, t)",
+        "            r := keccak256(0x00, 0x20)",
+        "        }",
+        "    }",
+        "",
+    ]
+
+
+SOLIDITY_FUNCTIONS = [_deposit, _loop, _withdraw, _random, _origin]
+
+
+def generate(tier: Tier, solc_version: str, seed: int = 0) -> str:
+    """
+    Generate the source code of a tier
+
+    :param tier: parameters of the file
+    :param solc_version: version of the pragma
+    :param seed: seed of the generation
+    :return: the source code
+    """
+    rng = random.Random(f"{tier.name}-{seed}")
+    lines_per_level = max(tier.lines // tier.depth, 40)
+    out = ["// SPDX-License-Identifier: MIT", f"pragma solidity {solc_version};", ""]
+    for level in range(tier.depth):
+        parent = f" is Level{level - 1}" if level else ""
+        body = _state(level)
+        k = 0
+        while len(body) < lines_per_level:
+            if rng.random() < tier.assembly:
+                body += _assembly(level, k, rng)
+            else:
+                body += rng.choice(SOLIDITY_FUNCTIONS)(level, k, rng)
+            k += 1
+        out += [f"contract Level{level}{parent} {{"] + body[:-1] + ["}", ""]
+    return "\n".join(out)
+
+
+def write_corpus(directory: str, solc_version: str, seed: int = 0) -> Dict[str, str]:
+    """
+    Write every tier in the directory
+
+    :return: tier name -> path of its file
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = {}
+    for tier in TIERS:
+        path = os.path.join(directory, f"{tier.name}.sol")
+        with open(path, "w", encoding="utf8") as f:
+            f.write(generate(tier, solc_version, seed))
+        paths[tier.name] = path
+    return paths
@@ -0,0 +1,100 @@
+"""
+Benchmark of the offset -> (line, column) index of the source files
+
+Compares the line start index (antibug/compile/utils/line_index.py) against the previous
+per-byte dictionary on generated flattened sources: memory of the index (tracemalloc),
+time to build it, and time of the lookups done for the source mappings.
+The answers of both indexes are checked to be identical on the looked up offsets.
+
+Usage: python -m benchmarks.line_index [--sizes 0.5 2 8 ...] [--lookups 200000] [--seed 0]
+"""
+import argparse
+import random
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from antibug.compile.utils.line_index import compute_line_starts, offset_to_line
+
+
+def per_byte_index(lines: List[bytes]) -> Dict[int, Tuple[int, int]]:
+    """The index used before the line start index"""
+    acc = 0
+    lines_delimiters: Dict[int, Tuple[int, int]] = {}
+    for line_number, x in enumerate(lines):
+        for i in range(acc, acc + len(x)):
+            lines_delimiters[i] = (line_number + 1, i - acc + 1)
+        acc += len(x)
+    lines_delimiters[acc] = (len(lines) + 1, 0)
+    return lines_delimiters
+
+
+def generate(size: int, seed: int) -> bytes:
+    """Generate about size bytes of solidity-looking code"""
+    rng = random.Random(seed)
+    chunks = []
+    total = 0
+    contract = 0
+    while total < size:
+        body = [f"contract C{contract} {{\n"]
+        for function in range(rng.randint(5, 30)):
+            body.append(f"    function f{function}(uint256 a, address b) public returns (uint256) {{\n")
+            for statement in range(rng.randint(1, 15)):
+                body.append(f"        uint256 v{statement} = a * {rng.randint(0, 10 ** 6)} + uint160(b);\n")
+            body.append("        return a;\n    }\n\n")
+        body.append("}\n\n")
+        chunk = "".join(body).encode("utf-8")
+        chunks.append(chunk)
+        total += len(chunk)
+        contract += 1
+    return b"".join(chunks)
+
+
+def measure(build: Callable[[], object]) -> Tuple[object, float, int]:
+    """Build an index, returning it with the build time and its peak memory"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    index = build()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return index, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--sizes", type=float, nargs="+", default=[0.5, 2], help="source sizes, in MB")
+    parser.add_argument("--lookups", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"{'size (MB)':>10} {'index':>10} {'build (s)':>10} {'memory (MB)':>12} {'lookups (s)':>12}"
+    )
+    for size in args.sizes:
+        lines = generate(int(size * 1024 * 1024), args.seed).splitlines(True)
+        total = sum(len(line) for line in lines)
+        rng = random.Random(args.seed)
+        offsets = [rng.randint(0, total) for _ in range(args.lookups)]
+
+        per_byte, per_byte_build, per_byte_memory = measure(lambda: per_byte_index(lines))
+        start = time.perf_counter()
+        expected = [per_byte[offset] for offset in offsets]  # type: ignore
+        per_byte_lookups = time.perf_counter() - start
+        del per_byte
+
+        line_starts, line_build, line_memory = measure(lambda: compute_line_starts(lines))
+        start = time.perf_counter()
+        result = [offset_to_line(line_starts, offset) for offset in offsets]  # type: ignore
+        line_lookups = time.perf_counter() - start
+        assert result == expected, "the line start index differs from the per-byte index"
+
+        for name, build, memory, lookups in (
+            ("per-byte", per_byte_build, per_byte_memory, per_byte_lookups),
+            ("line", line_build, line_memory, line_lookups),
+        ):
+            print(f"{size:>10} {name:>10} {build:>10.3f} {memory / 2 ** 20:>12.2f} {lookups:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Benchmark of the compile -> parse -> analyze -> detect pipeline
+
+Runs the pipeline of `antibug detect` on the generated corpus (benchmarks/corpus.py) with
+a pinned solc binary, installed beforehand: no network access is made. The phases are timed
+with the profiler (slither_core/utils/profiling.py): compilation, parsing, SlithIR, SSA,
+data dependency, every detector of all_detectors and the json export of the results.
+Every phase reports its median wall time over the runs and its throughput in lines of code
+per second. --output saves the measures with the commit and versions they were taken with,
+--compare prints the ratio against a saved run of another commit.
+
+The json export writes result/detector_json_results, as antibug detect does.
+
+Usage: python -m benchmarks.pipeline [--solc 0.8.20] [--tiers small medium ...] [--repeat 3]
+           [--seed 0] [--output run.json] [--compare baseline.json]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+from collections import defaultdict
+from typing import Dict, List
+
+from antibug.compile.safe_dev_analyzer import SafeDevAnalyzer
+from antibug.run_detectors.detectors import RunDetector
+from antibug.utils.convert_to_json import convert_to_detect_result_json
+from benchmarks.corpus import TIERS, write_corpus
+from slither_core.analyses.data_dependency.data_dependency import compute_dependency
+
+# (category, name) of the profiled phases reported, in the pipeline order
+# Phases with the same key are summed: there is one "ssa" phase per contract
+PHASES = [
+    ("compile", "compile"),
+    ("parse", "parse"),
+    ("analysis", "analysis"),
+    ("analysis", "slithir"),
+    ("analysis", "ssa"),
+    ("analysis", "data dependency"),
+]
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_pipeline(path: str, solc_version: str) -> Dict[str, float]:
+    """Run the pipeline once on a file, returning the wall time of every phase"""
+    analyzer = SafeDevAnalyzer(
+        path, solc_version=solc_version, offline=True, compile_cache=False, profile=True
+    )
+    if not analyzer.compilation_units:
+        raise RuntimeError(f"{path} did not compile with solc {solc_version}")
+    profiler = analyzer.profiler
+
+    with profiler.phase("analysis", "data dependency"):
+        for slither in analyzer.compilation_units.values():
+            for compilation_unit in slither.compilation_units:
+                compute_dependency(compilation_unit)
+
+    result_list, filename, error = RunDetector(analyzer).register_and_run_detectors()
+    with profiler.phase("export", "detector json"):
+        convert_to_detect_result_json(result_list, filename, error, analyzer)
+
+    times: Dict[str, float] = defaultdict(float)
+    for record in profiler.records:
+        category, name = record["category"], record["name"]
+        if category == "compile":
+            times["compile"] += record["wall_time"]
+        elif category == "parse" and record["depth"] == 0:
+            times["parse"] += record["wall_time"]
+        elif category == "analysis":
+            # "contracts" is the whole analysis, slithir and ssa included
+            times["analysis" if name == "contracts" else name] += record["wall_time"]
+        elif category == "detector":
+            times[f"detector {name}"] += record["wall_time"]
+        elif category == "export":
+            times["json export"] += record["wall_time"]
+    times["total"] = sum(
+        record["wall_time"] for record in profiler.records if record["depth"] == 0
+    )
+    return times
+
+
+def measure(paths: Dict[str, str], solc_version: str, repeat: int) -> Dict[str, Dict]:
+    """tier -> lines of code and median wall time of every phase"""
+    measures = {}
+    for tier, path in paths.items():
+        with open(path, encoding="utf8") as f:
+            lines = sum(1 for line in f if line.strip())
+        runs = [run_pipeline(path, solc_version) for _ in range(repeat)]
+        phases = {phase: statistics.median(run.get(phase, 0.0) for run in runs) for phase in runs[0]}
+        measures[tier] = {"lines": lines, "phases": phases}
+    return measures
+
+
+def ordered_phases(phases: Dict[str, float]) -> List[str]:
+    first = [name for _, name in PHASES if name in phases]
+    first += [name for name in phases if name not in first and name.startswith("detector ")]
+    return first + [name for name in phases if name not in first]
+
+
+def report(measures: Dict[str, Dict], baseline: Dict[str, Dict]) -> None:
+    for tier, measure in measures.items():
+        lines = measure["lines"]
+        print(f"\n{tier}: {lines} lines")
+        header = f"{'phase':>34} {'wall (s)':>10} {'lines/s':>12}"
+        print(header + (f" {'vs baseline':>12}" if baseline else ""))
+        for phase in ordered_phases(measure["phases"]):
+            wall = measure["phases"][phase]
+            throughput = f"{lines / wall:>12.0f}" if wall > 0 else f"{'-':>12}"
+            row = f"{phase:>34} {wall:>10.4f} {throughput}"
+            previous = baseline.get(tier, {}).get("phases", {}).get(phase)
+            if previous:
+                row += f" {wall / previous:>11.2f}x"
+            print(row)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--solc", default="0.8.20", help="installed solc version used for every file")
+    parser.add_argument("--tiers", nargs="+", default=[tier.name for tier in TIERS])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--corpus", help="directory of the generated files (default: temporary)")
+    parser.add_argument("--output", help="save the measures as json")
+    parser.add_argument("--compare", help="json saved by --output on another commit")
+    args = parser.parse_args()
+
+    baseline: Dict[str, Dict] = {}
+    if args.compare:
+        with open(args.compare, encoding="utf8") as f:
+            saved = json.load(f)
+        if (saved["solc"], saved["seed"]) != (args.solc, args.seed):
+            print(f"warning: {args.compare} was measured with another solc version or seed")
+        baseline = saved["tiers"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_corpus(args.corpus or tmp, args.solc, args.seed)
+        paths = {tier: path for tier, path in paths.items() if tier in args.tiers}
+        measures = measure(paths, args.solc, args.repeat)
+
+    report(measures, baseline)
+
+    if args.output:
+        saved = {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "solc": args.solc,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "tiers": measures,
+        }
+        with open(args.output, "w", encoding="utf8") as f:
+            json.dump(saved, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
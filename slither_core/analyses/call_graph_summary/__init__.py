@@ -0,0 +1,3 @@
+"""
+    Transitive properties of the functions of a compilation unit, see call_graph_summary.CallGraphSummary
+"""
@@ -0,0 +1,128 @@
+"""
+    Summaries of the transitive properties of the functions (Function.all_*)
+
+    A function reaches the functions it calls internally, the library functions it calls
+    and its modifiers, transitively. The functions calling each other (strongly connected
+    components of the call graph) reach the same functions, so a property is summarized
+    once per component: the values of its members, plus the summaries of the components
+    they call. The components are computed with Tarjan's algorithm, which completes the
+    callees before their callers, so the summaries are built bottom-up.
+"""
+from typing import Any, Callable, Dict, FrozenSet, List, Set, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from slither_core.core.declarations import Function
+
+
+def callees(function: "Function") -> List["Function"]:
+    """
+        Return the functions explored from a function by the transitive properties
+    Args:
+        function (Function)
+    Returns:
+        list(Function): internal calls, library calls and modifiers
+    """
+    # pylint: disable=import-outside-toplevel
+    from slither_core.core.declarations import Function
+
+    ret = [c for c in function.internal_calls if isinstance(c, Function)]
+    ret += [c for (_, c) in function.library_calls if isinstance(c, Function)]
+    ret += function.modifiers
+    return ret
+
+
+class CallGraphSummary:
+    """
+    Transitive properties of the functions of a compilation unit.
+    Built once the SlithIR is generated; the components are computed on first use
+    """
+
+    def __init__(self) -> None:
+        # function -> index of its component. The callees of a component have lower indexes
+        self._component: Dict["Function", int] = {}
+        self._members: List[List["Function"]] = []
+        self._successors: List[List[int]] = []
+        # property -> component -> values of the functions reached
+        self._summaries: Dict[str, Dict[int, FrozenSet[Any]]] = {}
+
+    def _add_component(self, members: List["Function"]) -> None:
+        component = len(self._members)
+        for member in members:
+            self._component[member] = component
+        successors: Set[int] = {self._component[c] for m in members for c in callees(m)}
+        successors.discard(component)
+        self._members.append(members)
+        self._successors.append(sorted(successors))
+
+    def _compute_components(self, root: "Function") -> None:
+        """Tarjan's algorithm from root, over the functions without a component"""
+        index: Dict["Function", int] = {root: 0}
+        lowlink: Dict["Function", int] = {root: 0}
+        stack = [root]
+        on_stack = {root}
+        work = [(root, iter(callees(root)))]
+        while work:
+            function, to_visit = work[-1]
+            for callee in to_visit:
+                if callee in self._component:
+                    continue
+                if callee not in index:
+                    index[callee] = lowlink[callee] = len(index)
+                    stack.append(callee)
+                    on_stack.add(callee)
+                    work.append((callee, iter(callees(callee))))
+                    break
+                if callee in on_stack:
+                    lowlink[function] = min(lowlink[function], index[callee])
+            else:
+                work.pop()
+                if work:
+                    caller = work[-1][0]
+                    lowlink[caller] = min(lowlink[caller], lowlink[function])
+                if lowlink[function] == index[function]:
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        members.append(member)
+                        if member is function:
+                            break
+                    self._add_component(members)
+
+    def component(self, function: "Function") -> int:
+        if function not in self._component:
+            self._compute_components(function)
+        return self._component[function]
+
+    def values(
+        self, function: "Function", name: str, f_new_values: Callable[["Function"], List]
+    ) -> FrozenSet[Any]:
+        """
+            Return the values of a property over the functions reached by a function
+        Args:
+            function (Function)
+            name (str): name of the property, the key of its summaries
+            f_new_values (Callable): values of the property for one function
+        Returns:
+            frozenset: values of function and of the functions it reaches
+        """
+        component = self.component(function)
+        summaries = self._summaries.setdefault(name, {})
+        if component not in summaries:
+            # the components reached without a summary
+            missing = {component}
+            to_explore = [component]
+            while to_explore:
+                for successor in self._successors[to_explore.pop()]:
+                    if successor not in summaries and successor not in missing:
+                        missing.add(successor)
+                        to_explore.append(successor)
+            # callees first
+            for c in sorted(missing):
+                values: Set[Any] = set()
+                for member in self._members[c]:
+                    values.update(f_new_values(member))
+                for successor in self._successors[c]:
+                    values |= summaries[successor]
+                summaries[c] = frozenset(values)
+        return summaries[component]
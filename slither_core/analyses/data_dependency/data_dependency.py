@@ -1,8 +1,7 @@
 """
     Compute the data depenency between all the SSA variables
 """
-from collections import defaultdict
-from typing import Union, Set, Dict, TYPE_CHECKING, List
+from typing import Union, Set, Dict, TYPE_CHECKING, List, Optional
 
 from slither_core.core.cfg.node import Node
 from slither_core.core.declarations import (
@@ -31,6 +30,7 @@ from slither_core.slithir.variables import (
     TupleVariableSSA,
 )
 from slither_core.slithir.variables.variable import SlithIRVariable
+from slither_core.utils.graph import strongly_connected_components
 
 if TYPE_CHECKING:
     from slither_core.core.compilation_unit import SlitherCompilationUnit
@@ -52,6 +52,24 @@ Context_types_API = Union[Contract, Function, Node]
 Context_types = Union[Contract, Function]
 
 
+def _dependency_context(context: Context_types_API) -> Context_types:
+    """
+    Return the context holding the dependencies: a node is replaced by its contract,
+    or by its function if it is a top level function.
+    The data dependency of the context is computed the first time it is needed
+    """
+    if isinstance(context, Node):
+        func = context.function
+        context = func.contract if isinstance(func, FunctionContract) else func
+    if isinstance(context, Contract):
+        compute_dependency_contract(context, context.compilation_unit)
+    elif isinstance(context, FunctionContract):
+        compute_dependency_contract(context.contract, context.compilation_unit)
+    else:
+        compute_dependency_top_level_function(context)
+    return context
+
+
 def is_dependent(
     variable: SUPPORTED_TYPES,
     source: SUPPORTED_TYPES,
@@ -71,9 +89,7 @@ def is_dependent(
         bool
     """
     assert isinstance(context, (Contract, Function, Node))
-    if isinstance(context, Node):
-        func = context.function
-        context = func.contract if isinstance(func, FunctionContract) else func
+    context = _dependency_context(context)
 
     if isinstance(variable, Constant):
         return False
@@ -108,9 +124,7 @@ def is_dependent_ssa(
         bool
     """
     assert isinstance(context, (Contract, Function, Node))
-    if isinstance(context, Node):
-        func = context.function
-        context = func.contract if isinstance(func, FunctionContract) else func
+    context = _dependency_context(context)
     context_dict = context.context
     if isinstance(variable, Constant):
         return False
@@ -151,13 +165,12 @@ def is_tainted(
         bool
     """
     assert isinstance(context, (Contract, Function, Node))
-    if isinstance(context, Node):
-        func = context.function
-        context = func.contract if isinstance(func, FunctionContract) else func
+    context = _dependency_context(context)
     assert isinstance(only_unprotected, bool)
     if isinstance(variable, Constant):
         return False
     compilation_unit = context.compilation_unit
+    compute_dependency_inputs(compilation_unit)
     taints = compilation_unit.context[KEY_INPUT]
     if not ignore_generic_taint:
         taints |= GENERIC_TAINT
@@ -184,13 +197,12 @@ def is_tainted_ssa(
         bool
     """
     assert isinstance(context, (Contract, Function, Node))
-    if isinstance(context, Node):
-        func = context.function
-        context = func.contract if isinstance(func, FunctionContract) else func
+    context = _dependency_context(context)
     assert isinstance(only_unprotected, bool)
     if isinstance(variable, Constant):
         return False
     compilation_unit = context.compilation_unit
+    compute_dependency_inputs(compilation_unit)
     taints = compilation_unit.context[KEY_INPUT_SSA]
     if not ignore_generic_taint:
         taints |= GENERIC_TAINT
@@ -215,9 +227,7 @@ def get_dependencies(
     :return: set(Variable)
     """
     assert isinstance(context, (Contract, Function, Node))
-    if isinstance(context, Node):
-        func = context.function
-        context = func.contract if isinstance(func, FunctionContract) else func
+    context = _dependency_context(context)
     assert isinstance(only_unprotected, bool)
     if only_unprotected:
         return context.context[KEY_NON_SSA_UNPROTECTED].get(variable, set())
@@ -237,9 +247,7 @@ def get_all_dependencies(
     :return: Dict(Variable, set(Variable))
     """
     assert isinstance(context, (Contract, Function, Node))
-    if isinstance(context, Node):
-        func = context.function
-        context = func.contract if isinstance(func, FunctionContract) else func
+    context = _dependency_context(context)
     assert isinstance(only_unprotected, bool)
     if only_unprotected:
         return context.context[KEY_NON_SSA_UNPROTECTED]
@@ -262,9 +270,7 @@ def get_dependencies_ssa(
     :return: set(Variable)
     """
     assert isinstance(context, (Contract, Function, Node))
-    if isinstance(context, Node):
-        func = context.function
-        context = func.contract if isinstance(func, FunctionContract) else func
+    context = _dependency_context(context)
     assert isinstance(only_unprotected, bool)
     if only_unprotected:
         return context.context[KEY_SSA_UNPROTECTED].get(variable, set())
@@ -284,9 +290,7 @@ def get_all_dependencies_ssa(
     :return: Dict(Variable, set(Variable))
     """
     assert isinstance(context, (Contract, Function, Node))
-    if isinstance(context, Node):
-        func = context.function
-        context = func.contract if isinstance(func, FunctionContract) else func
+    context = _dependency_context(context)
     assert isinstance(only_unprotected, bool)
     if only_unprotected:
         return context.context[KEY_SSA_UNPROTECTED]
@@ -342,12 +346,36 @@ def pprint_dependency(caller_context: Context_types) -> None:
 ###################################################################################
 
 
-def compute_dependency(compilation_unit: "SlitherCompilationUnit") -> None:
+def compute_dependency(
+    compilation_unit: "SlitherCompilationUnit", contracts: Optional[List[Contract]] = None
+) -> None:
+    """
+    Compute the data dependency of every contract upfront.
+    The user APIs compute the dependency of a context the first time it is used,
+    so calling this function is not required
+    """
+    compilation_unit.context.pop(KEY_INPUT, None)
+    compute_dependency_inputs(compilation_unit)
+
+    if contracts is None:
+        contracts = compilation_unit.contracts
+    for contract in contracts:
+        compute_dependency_contract(contract, compilation_unit)
+
+
+def compute_dependency_inputs(compilation_unit: "SlitherCompilationUnit") -> None:
+    if KEY_INPUT in compilation_unit.context:
+        return
+
     compilation_unit.context[KEY_INPUT] = set()
     compilation_unit.context[KEY_INPUT_SSA] = set()
 
     for contract in compilation_unit.contracts:
-        compute_dependency_contract(contract, compilation_unit)
+        for function in contract.functions + list(contract.modifiers):
+            # pylint: disable=expression-not-assigned
+            if function.visibility in ["public", "external"]:
+                [compilation_unit.context[KEY_INPUT].add(p) for p in function.parameters]
+                [compilation_unit.context[KEY_INPUT_SSA].add(p) for p in function.parameters_ssa]
 
 
 def compute_dependency_contract(
@@ -365,15 +393,19 @@ def compute_dependency_contract(
         propagate_function(contract, function, KEY_SSA, KEY_NON_SSA)
         propagate_function(contract, function, KEY_SSA_UNPROTECTED, KEY_NON_SSA_UNPROTECTED)
 
-        # pylint: disable=expression-not-assigned
-        if function.visibility in ["public", "external"]:
-            [compilation_unit.context[KEY_INPUT].add(p) for p in function.parameters]
-            [compilation_unit.context[KEY_INPUT_SSA].add(p) for p in function.parameters_ssa]
-
     propagate_contract(contract, KEY_SSA, KEY_NON_SSA)
     propagate_contract(contract, KEY_SSA_UNPROTECTED, KEY_NON_SSA_UNPROTECTED)
 
 
+def compute_dependency_top_level_function(function: Function) -> None:
+    if KEY_SSA in function.context:
+        return
+
+    compute_dependency_function(function)
+    transitive_close_dependencies(function, KEY_SSA, KEY_NON_SSA)
+    transitive_close_dependencies(function, KEY_SSA_UNPROTECTED, KEY_NON_SSA_UNPROTECTED)
+
+
 def propagate_function(
     contract: Contract, function: Function, context_key: str, context_key_non_ssa: str
 ) -> None:
@@ -390,24 +422,52 @@ def propagate_function(
 def transitive_close_dependencies(
     context: Context_types, context_key: str, context_key_non_ssa: str
 ) -> None:
-    # transitive closure
-    changed = True
-    keys = context.context[context_key].keys()
-    while changed:
-        changed = False
-        to_add = defaultdict(set)
-        for key, items in context.context[context_key].items():
-            for item in items & keys:
-                to_add[key].update(context.context[context_key][item] - {key} - items)
-        for k, v in to_add.items():
-            # Because we dont have any check on the update operation
-            # We might update an empty set with an empty set
-            if v:
-                changed = True
-                context.context[context_key][k] |= v
+    compute_transitive_closure(context.context[context_key])
     context.context[context_key_non_ssa] = convert_to_non_ssa(context.context[context_key])
 
 
+def compute_transitive_closure(dependencies: Dict[SUPPORTED_TYPES, Set[SUPPORTED_TYPES]]) -> None:
+    """
+    Close the dependencies in place: a variable depends on everything reachable from it.
+    A variable only depends on itself if it did before.
+
+    The strongly connected components of the dependency graph are closed once,
+    in reverse topological order, so every set is built from the final sets of its successors.
+    The result is the same as iterating until nothing changes.
+    """
+    successors: Dict[SUPPORTED_TYPES, List[SUPPORTED_TYPES]] = {
+        key: [item for item in items if item in dependencies]
+        for key, items in dependencies.items()
+    }
+    closures: Dict[SUPPORTED_TYPES, Set[SUPPORTED_TYPES]] = {}
+
+    for component in strongly_connected_components(successors, successors.__getitem__):
+        if len(component) == 1:
+            key = component[0]
+            items = dependencies[key]
+            for item in successors[key]:
+                # Every successor but the key itself is in an already closed component
+                if item in closures:
+                    items |= closures[item]
+            closures[key] = items
+            continue
+
+        members = set(component)
+        closure: Set[SUPPORTED_TYPES] = set()
+        for key in component:
+            closure |= dependencies[key]
+            for item in successors[key]:
+                if item not in members:
+                    closure |= closures[item]
+        for key in component:
+            items = dependencies[key]
+            is_self_dependent = key in items
+            items |= closure
+            if not is_self_dependent:
+                items.discard(key)
+            closures[key] = closure
+
+
 def propagate_contract(contract: Contract, context_key: str, context_key_non_ssa: str) -> None:
     transitive_close_dependencies(contract, context_key, context_key_non_ssa)
 
@@ -0,0 +1,3 @@
+"""
+    Index of the SlithIR operations of a compilation unit, see ir_index.IRIndex
+"""
@@ -0,0 +1,156 @@
+"""
+    Index of the SlithIR operations of a compilation unit
+
+    Built in one pass over the IR after its generation, it maps the operation types,
+    the solidity variables read, the solidity functions called and the names of the
+    called functions to their (function, node, ir) locations.
+    The detectors query it instead of walking every contract, function, node and IR.
+"""
+from heapq import merge
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Type, TYPE_CHECKING
+
+from slither_core.core.declarations.solidity_variables import SolidityVariable
+from slither_core.slithir.operations import (
+    HighLevelCall,
+    InternalCall,
+    LowLevelCall,
+    Operation,
+    SolidityCall,
+)
+
+if TYPE_CHECKING:
+    from slither_core.core.cfg.node import Node
+    from slither_core.core.compilation_unit import SlitherCompilationUnit
+    from slither_core.core.declarations import Function
+
+
+class IRLocation(NamedTuple):
+    function: "Function"
+    node: "Node"
+    ir: Operation
+
+
+# key -> function -> positions of the locations, in increasing order
+_Table = Dict[object, Dict["Function", List[int]]]
+
+
+def _add(table: _Table, key: object, function: "Function", position: int) -> None:
+    positions = table.setdefault(key, {}).setdefault(function, [])
+    # An operation reading the same variable twice is recorded once
+    if not positions or positions[-1] != position:
+        positions.append(position)
+
+
+class IRIndex:
+    """
+    Locations of the SlithIR operations (non SSA) of a compilation unit.
+    The locations are returned in the order of the IR walk: contract, function
+    (functions then modifiers), node and operation
+    """
+
+    def __init__(self, functions: Iterable["Function"]) -> None:
+        self._locations: List[IRLocation] = []
+        self._by_type: _Table = {}
+        self._by_solidity_variable_read: _Table = {}
+        self._by_solidity_call: _Table = {}
+        self._by_call_target: _Table = {}
+        # tuple of operation types -> types indexed that are subclasses of them
+        self._subtypes: Dict[Tuple[Type[Operation], ...], List[Type[Operation]]] = {}
+
+        for function in functions:
+            for node in function.nodes:
+                for ir in node.irs:
+                    self._add_operation(function, node, ir)
+
+    @staticmethod
+    def from_compilation_unit(compilation_unit: "SlitherCompilationUnit") -> "IRIndex":
+        functions: List["Function"] = []
+        for contract in compilation_unit.contracts:
+            functions += contract.functions_and_modifiers
+        functions += compilation_unit.functions_top_level
+        return IRIndex(functions)
+
+    def _add_operation(self, function: "Function", node: "Node", ir: Operation) -> None:
+        position = len(self._locations)
+        self._locations.append(IRLocation(function, node, ir))
+
+        _add(self._by_type, type(ir), function, position)
+        for var in ir.read:
+            if isinstance(var, SolidityVariable):
+                _add(self._by_solidity_variable_read, var.name, function, position)
+        if isinstance(ir, SolidityCall):
+            _add(self._by_solidity_call, ir.function.name, function, position)
+        elif isinstance(ir, (HighLevelCall, LowLevelCall, InternalCall)):
+            _add(self._by_call_target, str(ir.function_name), function, position)
+
+    def _query(
+        self, table: _Table, keys: Iterable[object], function: Optional["Function"]
+    ) -> List[IRLocation]:
+        if function is None:
+            lists = [
+                positions
+                for key in keys
+                if key in table
+                for positions in table[key].values()
+            ]
+        else:
+            lists = [
+                table[key][function]
+                for key in keys
+                if key in table and function in table[key]
+            ]
+        if len(lists) == 1:
+            return [self._locations[position] for position in lists[0]]
+        return [self._locations[position] for position in merge(*lists)]
+
+    def operations(
+        self, *ir_types: Type[Operation], function: Optional["Function"] = None
+    ) -> List[IRLocation]:
+        """
+            Return the operations that are instances of one of the types
+        Args:
+            ir_types (Type[Operation]): operation types, subclasses included
+            function (Function): restrict to the operations of the function
+        Returns:
+            list(IRLocation)
+        """
+        if ir_types not in self._subtypes:
+            self._subtypes[ir_types] = [t for t in self._by_type if issubclass(t, ir_types)]
+        return self._query(self._by_type, self._subtypes[ir_types], function)
+
+    def solidity_variable_reads(
+        self, name: str, function: Optional["Function"] = None
+    ) -> List[IRLocation]:
+        """
+            Return the operations reading a solidity variable
+        Args:
+            name (str): name of the solidity variable (ex: "tx.origin", "block.timestamp")
+            function (Function): restrict to the operations of the function
+        Returns:
+            list(IRLocation)
+        """
+        return self._query(self._by_solidity_variable_read, [name], function)
+
+    def solidity_calls(
+        self, *names: str, function: Optional["Function"] = None
+    ) -> List[IRLocation]:
+        """
+            Return the calls to solidity functions
+        Args:
+            names (str): full names of the solidity functions (ex: "blockhash(uint256)")
+            function (Function): restrict to the operations of the function
+        Returns:
+            list(IRLocation)
+        """
+        return self._query(self._by_solidity_call, names, function)
+
+    def calls_to(self, *names: str, function: Optional["Function"] = None) -> List[IRLocation]:
+        """
+            Return the high level, low level and internal calls to functions
+        Args:
+            names (str): names of the called functions (ex: "transfer", "delegatecall")
+            function (Function): restrict to the operations of the function
+        Returns:
+            list(IRLocation)
+        """
+        return self._query(self._by_call_target, names, function)
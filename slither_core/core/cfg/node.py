@@ -2,7 +2,20 @@
     Node module
 """
 from enum import Enum
-from typing import Optional, List, Set, Dict, Tuple, Union, TYPE_CHECKING
+from types import MappingProxyType
+from typing import (
+    AbstractSet,
+    Optional,
+    List,
+    Set,
+    Dict,
+    FrozenSet,
+    Mapping,
+    Sequence,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
 
 from slither_core.all_exceptions import SlitherException
 from slither_core.core.declarations import Contract, Function, FunctionContract
@@ -105,6 +118,21 @@ class NodeType(Enum):
 
 # endregion
 
+# Most of the nodes have no call, no phi origin, no dominance frontier, ...
+# The empty containers are shared by all the nodes; they are immutable,
+# and replaced by a new container on the first addition. The getters of these
+# containers return them as is: they are read-only (Sequence, AbstractSet, Mapping)
+_EMPTY_TUPLE: Tuple = ()
+_EMPTY_SET: FrozenSet = frozenset()
+# A mappingproxy cannot be pickled (snapshots): the phi origins start as None
+# and only the getters return this mapping
+_EMPTY_DICT: Mapping = MappingProxyType({})
+
+
+def _compact(items: List) -> Sequence:
+    return items if items else _EMPTY_TUPLE
+
+
 # I am not sure why, but pylint reports a lot of "no-member" issue that are not real (Josselin)
 # pylint: disable=no-member
 class Node(SourceMapping):  # pylint: disable=too-many-public-methods
@@ -113,6 +141,54 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
 
     """
 
+    __slots__ = (
+        "_node_type",
+        "_sons",
+        "_fathers",
+        "_immediate_dominator",
+        "_dom_successors",
+        "_dominance_frontier",
+        "_phi_origins_state_variables",
+        "_phi_origins_local_variables",
+        "_expression",
+        "_variable_declaration",
+        "_node_id",
+        "_vars_written",
+        "_vars_read",
+        "_ssa_vars_written",
+        "_ssa_vars_read",
+        "_internal_calls",
+        "_solidity_calls",
+        "_high_level_calls",
+        "_library_calls",
+        "_low_level_calls",
+        "_external_calls_as_expressions",
+        "_internal_calls_as_expressions",
+        "_irs",
+        "_all_slithir_operations",
+        "_irs_ssa",
+        "_state_vars_written",
+        "_state_vars_read",
+        "_solidity_vars_read",
+        "_ssa_state_vars_written",
+        "_ssa_state_vars_read",
+        "_local_vars_read",
+        "_local_vars_written",
+        "_slithir_vars",
+        "_ssa_local_vars_read",
+        "_ssa_local_vars_written",
+        "_expression_vars_written",
+        "_expression_vars_read",
+        "_expression_calls",
+        "_can_reenter",
+        "_can_send_eth",
+        "_asm_source_code",
+        "scope",
+        "file_scope",
+        "_function",
+        "_is_reachable",
+    )
+
     def __init__(
         self,
         node_type: NodeType,
@@ -128,61 +204,65 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
         self._fathers: List["Node"] = []
 
         ## Dominators info
-        # Dominators nodes
-        self._dominators: Set["Node"] = set()
+        # The dominators are derived from the immediate dominators (see dominators)
         self._immediate_dominator: Optional["Node"] = None
         ## Nodes of the dominators tree
         # self._dom_predecessors = set()
-        self._dom_successors: Set["Node"] = set()
+        self._dom_successors: Set["Node"] = _EMPTY_SET
         # Dominance frontier
-        self._dominance_frontier: Set["Node"] = set()
+        self._dominance_frontier: Set["Node"] = _EMPTY_SET
         # Phi origin
         # key are variable name
-        self._phi_origins_state_variables: Dict[str, Tuple[StateVariable, Set["Node"]]] = {}
-        self._phi_origins_local_variables: Dict[str, Tuple[LocalVariable, Set["Node"]]] = {}
+        self._phi_origins_state_variables: Optional[
+            Dict[str, Tuple[StateVariable, Set["Node"]]]
+        ] = None
+        self._phi_origins_local_variables: Optional[
+            Dict[str, Tuple[LocalVariable, Set["Node"]]]
+        ] = None
         # self._phi_origins_member_variables: Dict[str, Tuple[MemberVariable, Set["Node"]]] = {}
 
         self._expression: Optional[Expression] = None
         self._variable_declaration: Optional[LocalVariable] = None
         self._node_id: int = node_id
 
-        self._vars_written: List[Variable] = []
-        self._vars_read: List[Union[Variable, SolidityVariable]] = []
+        self._vars_written: Sequence[Variable] = _EMPTY_TUPLE
+        self._vars_read: Sequence[Union[Variable, SolidityVariable]] = _EMPTY_TUPLE
 
-        self._ssa_vars_written: List["SlithIRVariable"] = []
-        self._ssa_vars_read: List["SlithIRVariable"] = []
+        self._ssa_vars_written: Sequence["SlithIRVariable"] = _EMPTY_TUPLE
+        self._ssa_vars_read: Sequence["SlithIRVariable"] = _EMPTY_TUPLE
 
-        self._internal_calls: List[Union["Function", "SolidityFunction"]] = []
-        self._solidity_calls: List[SolidityFunction] = []
-        self._high_level_calls: List["HighLevelCallType"] = []  # contains library calls
-        self._library_calls: List["LibraryCallType"] = []
-        self._low_level_calls: List["LowLevelCallType"] = []
-        self._external_calls_as_expressions: List[Expression] = []
-        self._internal_calls_as_expressions: List[Expression] = []
+        self._internal_calls: Sequence[Union["Function", "SolidityFunction"]] = _EMPTY_TUPLE
+        self._solidity_calls: Sequence[SolidityFunction] = _EMPTY_TUPLE
+        # contains library calls
+        self._high_level_calls: Sequence["HighLevelCallType"] = _EMPTY_TUPLE
+        self._library_calls: Sequence["LibraryCallType"] = _EMPTY_TUPLE
+        self._low_level_calls: Sequence["LowLevelCallType"] = _EMPTY_TUPLE
+        self._external_calls_as_expressions: Sequence[Expression] = _EMPTY_TUPLE
+        self._internal_calls_as_expressions: Sequence[Expression] = _EMPTY_TUPLE
         self._irs: List[Operation] = []
         self._all_slithir_operations: Optional[List[Operation]] = None
         self._irs_ssa: List[Operation] = []
 
-        self._state_vars_written: List[StateVariable] = []
-        self._state_vars_read: List[StateVariable] = []
-        self._solidity_vars_read: List[SolidityVariable] = []
+        self._state_vars_written: Sequence[StateVariable] = _EMPTY_TUPLE
+        self._state_vars_read: Sequence[StateVariable] = _EMPTY_TUPLE
+        self._solidity_vars_read: Sequence[SolidityVariable] = _EMPTY_TUPLE
 
-        self._ssa_state_vars_written: List[StateIRVariable] = []
-        self._ssa_state_vars_read: List[StateIRVariable] = []
+        self._ssa_state_vars_written: Sequence[StateIRVariable] = _EMPTY_TUPLE
+        self._ssa_state_vars_read: Sequence[StateIRVariable] = _EMPTY_TUPLE
 
-        self._local_vars_read: List[LocalVariable] = []
-        self._local_vars_written: List[LocalVariable] = []
+        self._local_vars_read: Sequence[LocalVariable] = _EMPTY_TUPLE
+        self._local_vars_written: Sequence[LocalVariable] = _EMPTY_TUPLE
 
         self._slithir_vars: Set[
             Union["SlithIRVariable", ReferenceVariable, TemporaryVariable, TupleVariable]
-        ] = set()  # non SSA
+        ] = _EMPTY_SET  # non SSA
 
-        self._ssa_local_vars_read: List[LocalIRVariable] = []
-        self._ssa_local_vars_written: List[LocalIRVariable] = []
+        self._ssa_local_vars_read: Sequence[LocalIRVariable] = _EMPTY_TUPLE
+        self._ssa_local_vars_written: Sequence[LocalIRVariable] = _EMPTY_TUPLE
 
-        self._expression_vars_written: List[Expression] = []
-        self._expression_vars_read: List[Expression] = []
-        self._expression_calls: List[Expression] = []
+        self._expression_vars_written: Sequence[Expression] = _EMPTY_TUPLE
+        self._expression_vars_read: Sequence[Expression] = _EMPTY_TUPLE
+        self._expression_calls: Sequence[Expression] = _EMPTY_TUPLE
 
         # Computed on the fly, can be True of False
         self._can_reenter: Optional[bool] = None
@@ -301,12 +381,12 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
         return list(self._ssa_local_vars_read)
 
     @property
-    def variables_read_as_expression(self) -> List[Expression]:
+    def variables_read_as_expression(self) -> Sequence[Expression]:
         return self._expression_vars_read
 
     @variables_read_as_expression.setter
     def variables_read_as_expression(self, exprs: List[Expression]) -> None:
-        self._expression_vars_read = exprs
+        self._expression_vars_read = _compact(exprs)
 
     @property
     def slithir_variables(
@@ -357,12 +437,12 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
         return list(self._ssa_local_vars_written)
 
     @property
-    def variables_written_as_expression(self) -> List[Expression]:
+    def variables_written_as_expression(self) -> Sequence[Expression]:
         return self._expression_vars_written
 
     @variables_written_as_expression.setter
     def variables_written_as_expression(self, exprs: List[Expression]) -> None:
-        self._expression_vars_written = exprs
+        self._expression_vars_written = _compact(exprs)
 
     # endregion
     ###################################################################################
@@ -414,7 +494,7 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
         return list(self._low_level_calls)
 
     @property
-    def external_calls_as_expressions(self) -> List[Expression]:
+    def external_calls_as_expressions(self) -> Sequence[Expression]:
         """
         list(CallExpression): List of message calls (that creates a transaction)
         """
@@ -422,10 +502,10 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
 
     @external_calls_as_expressions.setter
     def external_calls_as_expressions(self, exprs: List[Expression]) -> None:
-        self._external_calls_as_expressions = exprs
+        self._external_calls_as_expressions = _compact(exprs)
 
     @property
-    def internal_calls_as_expressions(self) -> List[Expression]:
+    def internal_calls_as_expressions(self) -> Sequence[Expression]:
         """
         list(CallExpression): List of internal calls (that dont create a transaction)
         """
@@ -433,7 +513,7 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
 
     @internal_calls_as_expressions.setter
     def internal_calls_as_expressions(self, exprs: List[Expression]) -> None:
-        self._internal_calls_as_expressions = exprs
+        self._internal_calls_as_expressions = _compact(exprs)
 
     @property
     def calls_as_expression(self) -> List[Expression]:
@@ -441,7 +521,7 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
 
     @calls_as_expression.setter
     def calls_as_expression(self, exprs: List[Expression]) -> None:
-        self._expression_calls = exprs
+        self._expression_calls = _compact(exprs)
 
     def can_reenter(self, callstack: Optional[List[Union[Function, Variable]]] = None) -> bool:
         """
@@ -503,8 +583,8 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
         assert self._variable_declaration is None
         self._variable_declaration = var
         if var.expression:
-            self._vars_written += [var]
-            self._local_vars_written += [var]
+            self._vars_written = list(self._vars_written) + [var]
+            self._local_vars_written = list(self._local_vars_written) + [var]
 
     @property
     def variable_declaration(self) -> Optional[LocalVariable]:
@@ -743,14 +823,16 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
     @property
     def dominators(self) -> Set["Node"]:
         """
+        The node and its ancestors in the dominator tree
         Returns:
             set(Node)
         """
-        return self._dominators
-
-    @dominators.setter
-    def dominators(self, dom: Set["Node"]) -> None:
-        self._dominators = dom
+        dominators = {self}
+        node = self._immediate_dominator
+        while node is not None and node not in dominators:
+            dominators.add(node)
+            node = node.immediate_dominator
+        return dominators
 
     @property
     def immediate_dominator(self) -> Optional["Node"]:
@@ -765,10 +847,10 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
         self._immediate_dominator = idom
 
     @property
-    def dominance_frontier(self) -> Set["Node"]:
+    def dominance_frontier(self) -> AbstractSet["Node"]:
         """
         Returns:
-            set(Node)
+            set(Node): read-only, use add_dominance_frontier
         """
         return self._dominance_frontier
 
@@ -780,10 +862,20 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
         """
         self._dominance_frontier = doms
 
+    def add_dominance_frontier(self, node: "Node") -> None:
+        if not self._dominance_frontier:
+            self._dominance_frontier = set()
+        self._dominance_frontier.add(node)
+
     @property
-    def dominator_successors(self) -> Set["Node"]:
+    def dominator_successors(self) -> AbstractSet["Node"]:
         return self._dom_successors
 
+    def add_dominator_successor(self, node: "Node") -> None:
+        if not self._dom_successors:
+            self._dom_successors = set()
+        self._dom_successors.add(node)
+
     @property
     def dominance_exploration_ordered(self) -> List["Node"]:
         """
@@ -810,13 +902,17 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
     @property
     def phi_origins_local_variables(
         self,
-    ) -> Dict[str, Tuple[LocalVariable, Set["Node"]]]:
+    ) -> Mapping[str, Tuple[LocalVariable, Set["Node"]]]:
+        if self._phi_origins_local_variables is None:
+            return _EMPTY_DICT
         return self._phi_origins_local_variables
 
     @property
     def phi_origins_state_variables(
         self,
-    ) -> Dict[str, Tuple[StateVariable, Set["Node"]]]:
+    ) -> Mapping[str, Tuple[StateVariable, Set["Node"]]]:
+        if self._phi_origins_state_variables is None:
+            return _EMPTY_DICT
         return self._phi_origins_state_variables
 
     # @property
@@ -824,6 +920,8 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
     #     return self._phi_origins_member_variables
 
     def add_phi_origin_local_variable(self, variable: LocalVariable, node: "Node") -> None:
+        if self._phi_origins_local_variables is None:
+            self._phi_origins_local_variables = {}
         if variable.name not in self._phi_origins_local_variables:
             assert variable.name
             self._phi_origins_local_variables[variable.name] = (variable, set())
@@ -832,6 +930,8 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
         nodes.add(node)
 
     def add_phi_origin_state_variable(self, variable: StateVariable, node: "Node") -> None:
+        if self._phi_origins_state_variables is None:
+            self._phi_origins_state_variables = {}
         if variable.canonical_name not in self._phi_origins_state_variables:
             self._phi_origins_state_variables[variable.canonical_name] = (
                 variable,
@@ -855,32 +955,40 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
     ###################################################################################
     ###################################################################################
 
-    def _find_read_write_call(self) -> None:  # pylint: disable=too-many-statements
+    def _find_read_write_call(self) -> None:  # pylint: disable=too-many-statements,too-many-locals
+        slithir_vars = set(self._slithir_vars)
+        vars_read = list(self._vars_read)
+        vars_written = list(self._vars_written)
+        internal_calls = list(self._internal_calls)
+        solidity_calls = list(self._solidity_calls)
+        high_level_calls = list(self._high_level_calls)
+        library_calls = list(self._library_calls)
+        low_level_calls = list(self._low_level_calls)
 
         for ir in self.irs:
 
-            self._slithir_vars |= {v for v in ir.read if self._is_valid_slithir_var(v)}
+            slithir_vars |= {v for v in ir.read if self._is_valid_slithir_var(v)}
 
             if isinstance(ir, OperationWithLValue):
                 var = ir.lvalue
                 if var and self._is_valid_slithir_var(var):
                     # The type is checked by is_valid_slithir_var
-                    self._slithir_vars.add(var)  # type: ignore
+                    slithir_vars.add(var)  # type: ignore
 
             if not isinstance(ir, (Phi, Index, Member)):
-                self._vars_read += [v for v in ir.read if self._is_non_slithir_var(v)]
+                vars_read += [v for v in ir.read if self._is_non_slithir_var(v)]
                 for var in ir.read:
                     if isinstance(var, ReferenceVariable):
-                        self._vars_read.append(var.points_to_origin)
+                        vars_read.append(var.points_to_origin)
             elif isinstance(ir, (Member, Index)):
                 # TODO investigate types for member variable left
                 var = ir.variable_left if isinstance(ir, Member) else ir.variable_right
                 if var and self._is_non_slithir_var(var):
-                    self._vars_read.append(var)
+                    vars_read.append(var)
                 if isinstance(var, ReferenceVariable):
                     origin = var.points_to_origin
                     if self._is_non_slithir_var(origin):
-                        self._vars_read.append(origin)
+                        vars_read.append(origin)
 
             if isinstance(ir, OperationWithLValue):
                 if isinstance(ir, (Index, Member, Length)):
@@ -889,32 +997,32 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
                 if isinstance(var, ReferenceVariable):
                     var = var.points_to_origin
                 if var and self._is_non_slithir_var(var):
-                    self._vars_written.append(var)
+                    vars_written.append(var)
 
             if isinstance(ir, InternalCall):
-                self._internal_calls.append(ir.function)
+                internal_calls.append(ir.function)
             if isinstance(ir, SolidityCall):
                 # TODO: consider removing dependancy of solidity_call to internal_call
-                self._solidity_calls.append(ir.function)
-                self._internal_calls.append(ir.function)
+                solidity_calls.append(ir.function)
+                internal_calls.append(ir.function)
             if isinstance(ir, LowLevelCall):
                 assert isinstance(ir.destination, (Variable, SolidityVariable))
-                self._low_level_calls.append((ir.destination, str(ir.function_name.value)))
+                low_level_calls.append((ir.destination, str(ir.function_name.value)))
             elif isinstance(ir, HighLevelCall) and not isinstance(ir, LibraryCall):
                 # Todo investigate this if condition
                 # It does seem right to compare against a contract
                 # This might need a refactoring
                 if isinstance(ir.destination.type, Contract):
-                    self._high_level_calls.append((ir.destination.type, ir.function))
+                    high_level_calls.append((ir.destination.type, ir.function))
                 elif ir.destination == SolidityVariable("this"):
                     func = self.function
                     # Can't use this in a top level function
                     assert isinstance(func, FunctionContract)
-                    self._high_level_calls.append((func.contract, ir.function))
+                    high_level_calls.append((func.contract, ir.function))
                 else:
                     try:
                         # Todo this part needs more tests and documentation
-                        self._high_level_calls.append((ir.destination.type.type, ir.function))
+                        high_level_calls.append((ir.destination.type.type, ir.function))
                     except AttributeError as error:
                         #  pylint: disable=raise-missing-from
                         raise SlitherException(
@@ -923,23 +1031,28 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
             elif isinstance(ir, LibraryCall):
                 assert isinstance(ir.destination, Contract)
                 assert isinstance(ir.function, Function)
-                self._high_level_calls.append((ir.destination, ir.function))
-                self._library_calls.append((ir.destination, ir.function))
-
-        self._vars_read = list(set(self._vars_read))
-        self._state_vars_read = [v for v in self._vars_read if isinstance(v, StateVariable)]
-        self._local_vars_read = [v for v in self._vars_read if isinstance(v, LocalVariable)]
-        self._solidity_vars_read = [
-            v_ for v_ in self._vars_read if isinstance(v_, SolidityVariable)
-        ]
-        self._vars_written = list(set(self._vars_written))
-        self._state_vars_written = [v for v in self._vars_written if isinstance(v, StateVariable)]
-        self._local_vars_written = [v for v in self._vars_written if isinstance(v, LocalVariable)]
-        self._internal_calls = list(set(self._internal_calls))
-        self._solidity_calls = list(set(self._solidity_calls))
-        self._high_level_calls = list(set(self._high_level_calls))
-        self._library_calls = list(set(self._library_calls))
-        self._low_level_calls = list(set(self._low_level_calls))
+                high_level_calls.append((ir.destination, ir.function))
+                library_calls.append((ir.destination, ir.function))
+
+        self._slithir_vars = slithir_vars if slithir_vars else _EMPTY_SET
+        self._vars_read = _compact(list(set(vars_read)))
+        self._state_vars_read = _compact([v for v in self._vars_read if isinstance(v, StateVariable)])
+        self._local_vars_read = _compact([v for v in self._vars_read if isinstance(v, LocalVariable)])
+        self._solidity_vars_read = _compact(
+            [v_ for v_ in self._vars_read if isinstance(v_, SolidityVariable)]
+        )
+        self._vars_written = _compact(list(set(vars_written)))
+        self._state_vars_written = _compact(
+            [v for v in self._vars_written if isinstance(v, StateVariable)]
+        )
+        self._local_vars_written = _compact(
+            [v for v in self._vars_written if isinstance(v, LocalVariable)]
+        )
+        self._internal_calls = _compact(list(set(internal_calls)))
+        self._solidity_calls = _compact(list(set(solidity_calls)))
+        self._high_level_calls = _compact(list(set(high_level_calls)))
+        self._library_calls = _compact(list(set(library_calls)))
+        self._low_level_calls = _compact(list(set(low_level_calls)))
 
     @staticmethod
     def _convert_ssa(v: Variable) -> Optional[Union[StateVariable, LocalVariable]]:
@@ -958,27 +1071,29 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
     def update_read_write_using_ssa(self) -> None:
         if not self.expression:
             return
+        ssa_vars_read = list(self._ssa_vars_read)
+        ssa_vars_written = list(self._ssa_vars_written)
         for ir in self.irs_ssa:
             if isinstance(ir, PhiCallback):
                 continue
             if not isinstance(ir, (Phi, Index, Member)):
-                self._ssa_vars_read += [
+                ssa_vars_read += [
                     v for v in ir.read if isinstance(v, (StateIRVariable, LocalIRVariable))
                 ]
                 for var in ir.read:
                     if isinstance(var, ReferenceVariable):
                         origin = var.points_to_origin
                         if isinstance(origin, (StateIRVariable, LocalIRVariable)):
-                            self._ssa_vars_read.append(origin)
+                            ssa_vars_read.append(origin)
 
             elif isinstance(ir, (Member, Index)):
                 variable_right: RVALUE = ir.variable_right
                 if isinstance(variable_right, (StateIRVariable, LocalIRVariable)):
-                    self._ssa_vars_read.append(variable_right)
+                    ssa_vars_read.append(variable_right)
                 if isinstance(variable_right, ReferenceVariable):
                     origin = variable_right.points_to_origin
                     if isinstance(origin, (StateIRVariable, LocalIRVariable)):
-                        self._ssa_vars_read.append(origin)
+                        ssa_vars_read.append(origin)
 
             if isinstance(ir, OperationWithLValue):
                 if isinstance(ir, (Index, Member, Length)):
@@ -990,28 +1105,38 @@ class Node(SourceMapping):  # pylint: disable=too-many-public-methods
                 if var and isinstance(var, (StateIRVariable, LocalIRVariable)):
                     if isinstance(ir, PhiCallback):
                         continue
-                    self._ssa_vars_written.append(var)
-        self._ssa_vars_read = list(set(self._ssa_vars_read))
-        self._ssa_state_vars_read = [v for v in self._ssa_vars_read if isinstance(v, StateVariable)]
-        self._ssa_local_vars_read = [v for v in self._ssa_vars_read if isinstance(v, LocalVariable)]
-        self._ssa_vars_written = list(set(self._ssa_vars_written))
-        self._ssa_state_vars_written = [
-            v for v in self._ssa_vars_written if v and isinstance(v, StateIRVariable)
-        ]
-        self._ssa_local_vars_written = [
-            v for v in self._ssa_vars_written if v and isinstance(v, LocalIRVariable)
-        ]
+                    ssa_vars_written.append(var)
+        self._ssa_vars_read = _compact(list(set(ssa_vars_read)))
+        self._ssa_state_vars_read = _compact(
+            [v for v in self._ssa_vars_read if isinstance(v, StateVariable)]
+        )
+        self._ssa_local_vars_read = _compact(
+            [v for v in self._ssa_vars_read if isinstance(v, LocalVariable)]
+        )
+        self._ssa_vars_written = _compact(list(set(ssa_vars_written)))
+        self._ssa_state_vars_written = _compact(
+            [v for v in self._ssa_vars_written if v and isinstance(v, StateIRVariable)]
+        )
+        self._ssa_local_vars_written = _compact(
+            [v for v in self._ssa_vars_written if v and isinstance(v, LocalIRVariable)]
+        )
 
         vars_read = [self._convert_ssa(x) for x in self._ssa_vars_read]
         vars_written = [self._convert_ssa(x) for x in self._ssa_vars_written]
 
-        self._vars_read += [v_ for v_ in vars_read if v_ and v_ not in self._vars_read]
-        self._state_vars_read = [v for v in self._vars_read if isinstance(v, StateVariable)]
-        self._local_vars_read = [v for v in self._vars_read if isinstance(v, LocalVariable)]
+        vars_read = [v_ for v_ in vars_read if v_ and v_ not in self._vars_read]
+        self._vars_read = _compact(list(self._vars_read) + vars_read)
+        self._state_vars_read = _compact([v for v in self._vars_read if isinstance(v, StateVariable)])
+        self._local_vars_read = _compact([v for v in self._vars_read if isinstance(v, LocalVariable)])
 
-        self._vars_written += [v_ for v_ in vars_written if v_ and v_ not in self._vars_written]
-        self._state_vars_written = [v for v in self._vars_written if isinstance(v, StateVariable)]
-        self._local_vars_written = [v for v in self._vars_written if isinstance(v, LocalVariable)]
+        vars_written = [v_ for v_ in vars_written if v_ and v_ not in self._vars_written]
+        self._vars_written = _compact(list(self._vars_written) + vars_written)
+        self._state_vars_written = _compact(
+            [v for v in self._vars_written if isinstance(v, StateVariable)]
+        )
+        self._local_vars_written = _compact(
+            [v for v in self._vars_written if isinstance(v, LocalVariable)]
+        )
 
     # endregion
     ###################################################################################
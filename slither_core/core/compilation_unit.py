@@ -5,6 +5,8 @@ from typing import Optional, Dict, List, Set, Union, TYPE_CHECKING, Tuple
 from antibug.compile.antibug_compile import CompilationUnit, AntibugCompile
 from antibug.compile.utils.naming import Filename
 
+from slither_core.analyses.call_graph_summary.call_graph_summary import CallGraphSummary
+from slither_core.analyses.ir_index.ir_index import IRIndex
 from slither_core.core.context.context import Context
 from slither_core.core.declarations import (
     Contract,
@@ -24,9 +26,11 @@ from slither_core.core.variables.state_variable import StateVariable
 from slither_core.core.variables.top_level_variable import TopLevelVariable
 from slither_core.slithir.operations import InternalCall
 from slither_core.slithir.variables import Constant
+from slither_core.utils.inheritance_analysis import inheritance_order
 
 if TYPE_CHECKING:
     from slither_core.core.slither_core import SlitherCore
+    from slither_core.core.source_mapping.source_mapping import Source
 
 
 # class Language(Enum):
@@ -69,12 +73,25 @@ class SlitherCompilationUnit(Context):
 
         # Memoize
         self._all_state_variables: Optional[Set[StateVariable]] = None
+        self._contracts_in_inheritance_order: Optional[List[Contract]] = None
+        # Contract -> contracts inheriting from it, and name -> contracts
+        # Rebuilt when contracts are added or an inheritance is set
+        self._derived_contracts: Optional[Dict[Contract, List[Contract]]] = None
+        self._contracts_by_name: Optional[Dict[str, List[Contract]]] = None
+        self._contracts_indexed: int = 0
 
         self._storage_layouts: Dict[str, Dict[str, Tuple[int, int]]] = {}
 
+        self._ir_index: Optional[IRIndex] = None
+        self._call_graph_summary: Optional[CallGraphSummary] = None
+
         self._contract_with_missing_inheritance: Set[Contract] = set()
 
         self._source_units: Dict[int, str] = {}
+        # Memoize source unit index -> Filename
+        self._source_unit_filenames: Dict[int, Filename] = {}
+        # Interned source mappings: "start:length:file" -> Source
+        self._source_mappings: Dict[str, "Source"] = {}
 
         self.counter_slithir_tuple = 0
         self.counter_slithir_temporary = 0
@@ -90,6 +107,20 @@ class SlitherCompilationUnit(Context):
     def source_units(self) -> Dict[int, str]:
         return self._source_units
 
+    def source_unit_filename(self, index: int) -> Optional[Filename]:
+        """
+        Return the Filename of a source unit index, None if the index is unknown
+        """
+        filename = self._source_unit_filenames.get(index)
+        if filename is None and index in self._source_units:
+            filename = self.core.antibug_compile.filename_lookup(self._source_units[index])
+            self._source_unit_filenames[index] = filename
+        return filename
+
+    @property
+    def source_mappings(self) -> Dict[str, "Source"]:
+        return self._source_mappings
+
     # endregion
     ###################################################################################
     ###################################################################################
@@ -144,6 +175,14 @@ class SlitherCompilationUnit(Context):
         inheritance = [item for sublist in inheritances for item in sublist]
         return [c for c in self.contracts if c not in inheritance]
 
+    @property
+    def contracts_in_inheritance_order(self) -> List[Contract]:
+        """list(Contract): Contracts sorted so that every contract comes after its parents.
+        Computed once, the inheritance must be set"""
+        if self._contracts_in_inheritance_order is None:
+            self._contracts_in_inheritance_order = inheritance_order(self.contracts)
+        return self._contracts_in_inheritance_order
+
     def get_contract_from_name(self, contract_name: Union[str, Constant]) -> List[Contract]:
         """
             Return a list of contract from a name
@@ -152,7 +191,38 @@ class SlitherCompilationUnit(Context):
         Returns:
             List[Contract]
         """
-        return [c for c in self.contracts if c.name == contract_name]
+        self._check_contracts_indexes()
+        if self._contracts_by_name is None:
+            self._contracts_by_name = {}
+            for c in self.contracts:
+                self._contracts_by_name.setdefault(c.name, []).append(c)
+        return list(self._contracts_by_name.get(contract_name, []))
+
+    def get_derived_contracts(self, contract: Contract) -> List[Contract]:
+        """
+            Return the contracts inheriting from a contract
+        Args:
+            contract (Contract): base contract
+        Returns:
+            List[Contract]: in the order of the contracts
+        """
+        self._check_contracts_indexes()
+        if self._derived_contracts is None:
+            self._derived_contracts = {}
+            for c in self.contracts:
+                for base in set(c.inheritance):
+                    self._derived_contracts.setdefault(base, []).append(c)
+        return list(self._derived_contracts.get(contract, []))
+
+    def reset_derived_contracts(self) -> None:
+        self._derived_contracts = None
+
+    def _check_contracts_indexes(self) -> None:
+        # contracts is a public list, only ever appended to
+        if self._contracts_indexed != len(self.contracts):
+            self._contracts_indexed = len(self.contracts)
+            self._derived_contracts = None
+            self._contracts_by_name = None
 
     # endregion
     ###################################################################################
@@ -311,3 +381,43 @@ class SlitherCompilationUnit(Context):
         return self._storage_layouts[contract.name][var.canonical_name]
 
     # endregion
+    ###################################################################################
+    ###################################################################################
+    # region IR index
+    ###################################################################################
+    ###################################################################################
+
+    def compute_ir_index(self) -> None:
+        """Index the SlithIR operations, once the IR is generated"""
+        self._ir_index = IRIndex.from_compilation_unit(self)
+
+    @property
+    def ir_index(self) -> IRIndex:
+        """
+        Locations of the SlithIR operations by type, solidity variable read,
+        solidity function called and called function name, see IRIndex
+        """
+        if self._ir_index is None:
+            self.compute_ir_index()
+        assert self._ir_index
+        return self._ir_index
+
+    # endregion
+    ###################################################################################
+    ###################################################################################
+    # region Call graph summary
+    ###################################################################################
+    ###################################################################################
+
+    def compute_call_graph_summary(self) -> None:
+        """Summarize the transitive properties of the functions, once the IR is generated"""
+        self._call_graph_summary = CallGraphSummary()
+
+    @property
+    def call_graph_summary(self) -> Optional[CallGraphSummary]:
+        """
+        Summaries of the Function.all_* properties, None before the IR is generated
+        """
+        return self._call_graph_summary
+
+    # endregion
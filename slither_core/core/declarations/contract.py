@@ -4,7 +4,7 @@
 import logging
 from collections import defaultdict
 from pathlib import Path
-from typing import Optional, List, Dict, Callable, Tuple, TYPE_CHECKING, Union, Set, Any
+from typing import Optional, List, Dict, Callable, Iterator, Tuple, TYPE_CHECKING, Union, Set, Any
 
 # from antibug_compile.platform import Type as PlatformType
 
@@ -26,6 +26,7 @@ from slither_core.utils.erc import (
     ERC4524_signatures,
     ERC4626_signatures,
 )
+from slither_core.utils.function import get_function_id
 from slither_core.utils.tests_pattern import is_test_contract
 
 # pylint: disable=too-many-lines,too-many-instance-attributes,import-outside-toplevel,too-many-nested-blocks
@@ -53,6 +54,17 @@ LOGGER = logging.getLogger("Contract")
 USING_FOR_KEY = Union[str, Type]
 USING_FOR_ITEM = List[Union[Type, Function]]
 
+# Lookup indexes reset when the functions, modifiers, state variables or events change
+_FUNCTION_INDEXES = (
+    "function_full_name",
+    "function_signature",
+    "function_selector",
+    "function_canonical_name",
+)
+_MODIFIER_INDEXES = ("modifier_full_name", "modifier_canonical_name")
+_VARIABLE_INDEXES = ("variable_name", "variable_canonical_name")
+_EVENT_INDEXES = ("event_full_name", "event_canonical_name")
+
 
 class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
     """
@@ -96,6 +108,10 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
 
         self._signatures: Optional[List[str]] = None
         self._signatures_declared: Optional[List[str]] = None
+        self._signatures_set: Optional[Set[str]] = None
+
+        # Lookup indexes (kind -> key -> element), built on first use, see _lookup_index
+        self._indexes: Dict[str, Dict[Any, Any]] = {}
 
         self._fallback_function: Optional["FunctionContract"] = None
         self._receive_function: Optional["FunctionContract"] = None
@@ -275,6 +291,8 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
 
     @property
     def events_as_dict(self) -> Dict[str, "Event"]:
+        # The dict can be updated by the caller
+        self._reset_indexes(_EVENT_INDEXES)
         return self._events
 
     # endregion
@@ -399,6 +417,8 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
 
     @property
     def variables_as_dict(self) -> Dict[str, "StateVariable"]:
+        # The dict can be updated by the caller
+        self._reset_indexes(_VARIABLE_INDEXES)
         return self._variables
 
     @property
@@ -427,6 +447,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
 
     def add_variables_ordered(self, new_vars: List["StateVariable"]) -> None:
         self._variables_ordered += new_vars
+        self._reset_indexes(_VARIABLE_INDEXES)
 
     @property
     def state_variables_inherited(self) -> List["StateVariable"]:
@@ -556,6 +577,12 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
             self._signatures = list(set(sigs))
         return self._signatures
 
+    @property
+    def _functions_signatures_set(self) -> Set[str]:
+        if self._signatures_set is None:
+            self._signatures_set = set(self.functions_signatures)
+        return self._signatures_set
+
     @property
     def functions_signatures_declared(self) -> List[str]:
         """
@@ -593,6 +620,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
 
     def add_function(self, func: "FunctionContract") -> None:
         self._functions[func.canonical_name] = func
+        self._reset_indexes(_FUNCTION_INDEXES)
 
     def set_functions(self, functions: Dict[str, "FunctionContract"]) -> None:
         """
@@ -602,6 +630,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         :return:
         """
         self._functions = functions
+        self._reset_indexes(_FUNCTION_INDEXES)
 
     @property
     def functions_inherited(self) -> List["FunctionContract"]:
@@ -646,6 +675,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         :return:
         """
         self._modifiers = modifiers
+        self._reset_indexes(_MODIFIER_INDEXES)
 
     @property
     def modifiers_inherited(self) -> List["Modifier"]:
@@ -769,14 +799,14 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         self._inheritance = inheritance
         self._immediate_inheritance = immediate_inheritance
         self._explicit_base_constructor_calls = called_base_constructor_contracts
+        self.compilation_unit.reset_derived_contracts()
 
     @property
     def derived_contracts(self) -> List["Contract"]:
         """
         list(Contract): Return the list of contracts derived from self
         """
-        candidates = self.compilation_unit.contracts
-        return [c for c in candidates if self in c.inheritance]  # type: ignore
+        return self.compilation_unit.get_derived_contracts(self)
 
     # endregion
     ###################################################################################
@@ -807,10 +837,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         Returns:
             Function
         """
-        return next(
-            (f for f in self.functions if f.full_name == full_name and not f.is_shadowed),
-            None,
-        )
+        return self._lookup_index("function_full_name").get(full_name)
 
     def get_function_from_signature(self, function_signature: str) -> Optional["Function"]:
         """
@@ -820,14 +847,17 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         Returns:
             Function
         """
-        return next(
-            (
-                f
-                for f in self.functions
-                if f.solidity_signature == function_signature and not f.is_shadowed
-            ),
-            None,
-        )
+        return self._lookup_index("function_signature").get(function_signature)
+
+    def get_function_from_selector(self, selector: int) -> Optional["Function"]:
+        """
+            Return a function from its selector
+        Args:
+            selector (int): first four bytes of the keccak of the solidity signature
+        Returns:
+            Function
+        """
+        return self._lookup_index("function_selector").get(selector)
 
     def get_modifier_from_signature(self, modifier_signature: str) -> Optional["Modifier"]:
         """
@@ -835,10 +865,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
 
         :param modifier_signature:
         """
-        return next(
-            (m for m in self.modifiers if m.full_name == modifier_signature and not m.is_shadowed),
-            None,
-        )
+        return self._lookup_index("modifier_full_name").get(modifier_signature)
 
     def get_function_from_canonical_name(self, canonical_name: str) -> Optional["Function"]:
         """
@@ -848,7 +875,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         Returns:
             Function
         """
-        return next((f for f in self.functions if f.canonical_name == canonical_name), None)
+        return self._lookup_index("function_canonical_name").get(canonical_name)
 
     def get_modifier_from_canonical_name(self, canonical_name: str) -> Optional["Modifier"]:
         """
@@ -858,7 +885,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         Returns:
             Modifier
         """
-        return next((m for m in self.modifiers if m.canonical_name == canonical_name), None)
+        return self._lookup_index("modifier_canonical_name").get(canonical_name)
 
     def get_state_variable_from_name(self, variable_name: str) -> Optional["StateVariable"]:
         """
@@ -866,7 +893,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
 
         :param variable_name:
         """
-        return next((v for v in self.state_variables if v.name == variable_name), None)
+        return self._lookup_index("variable_name").get(variable_name)
 
     def get_state_variable_from_canonical_name(
         self, canonical_name: str
@@ -878,7 +905,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         Returns:
             StateVariable
         """
-        return next((v for v in self.state_variables if v.canonical_name == canonical_name), None)
+        return self._lookup_index("variable_canonical_name").get(canonical_name)
 
     def get_structure_from_name(self, structure_name: str) -> Optional["StructureContract"]:
         """
@@ -910,7 +937,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         Returns:
             Event
         """
-        return next((e for e in self.events if e.full_name == event_signature), None)
+        return self._lookup_index("event_full_name").get(event_signature)
 
     def get_event_from_canonical_name(self, event_canonical_name: str) -> Optional["Event"]:
         """
@@ -920,7 +947,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         Returns:
             Event
         """
-        return next((e for e in self.events if e.canonical_name == event_canonical_name), None)
+        return self._lookup_index("event_canonical_name").get(event_canonical_name)
 
     def get_enum_from_name(self, enum_name: str) -> Optional["Enum"]:
         """
@@ -942,6 +969,56 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         """
         return next((e for e in self.enums if e.canonical_name == enum_name), None)
 
+    def _index_items(self, kind: str) -> Iterator[Tuple[Any, Any]]:
+        # pylint: disable=too-many-return-statements
+        if kind == "function_full_name":
+            return ((f.full_name, f) for f in self.functions if not f.is_shadowed)
+        if kind == "function_signature":
+            return ((f.solidity_signature, f) for f in self.functions if not f.is_shadowed)
+        if kind == "function_selector":
+            return (
+                (get_function_id(f.solidity_signature), f)
+                for f in self.functions
+                if not f.is_shadowed
+            )
+        if kind == "function_canonical_name":
+            return ((f.canonical_name, f) for f in self.functions)
+        if kind == "modifier_full_name":
+            return ((m.full_name, m) for m in self.modifiers if not m.is_shadowed)
+        if kind == "modifier_canonical_name":
+            return ((m.canonical_name, m) for m in self.modifiers)
+        if kind == "variable_name":
+            return ((v.name, v) for v in self.state_variables)
+        if kind == "variable_canonical_name":
+            return ((v.canonical_name, v) for v in self.state_variables)
+        if kind == "event_full_name":
+            return ((e.full_name, e) for e in self.events)
+        if kind == "event_canonical_name":
+            return ((e.canonical_name, e) for e in self.events)
+        raise KeyError(kind)
+
+    def _lookup_index(self, kind: str) -> Dict[Any, Any]:
+        """
+        Return the index of a lookup, built on first use.
+        The first element of a key is kept, as the linear lookups did
+        """
+        index = self._indexes.get(kind)
+        if index is None:
+            index = {}
+            for key, element in self._index_items(kind):
+                index.setdefault(key, element)
+            self._indexes[kind] = index
+        return index
+
+    def _reset_indexes(self, kinds: Tuple[str, ...]) -> None:
+        for kind in kinds:
+            self._indexes.pop(kind, None)
+        if kinds in (_FUNCTION_INDEXES, _VARIABLE_INDEXES):
+            # the signatures are the ones of the public functions and variables
+            self._signatures = None
+            self._signatures_declared = None
+            self._signatures_set = None
+
     def get_functions_overridden_by(self, function: "Function") -> List["Function"]:
         """
             Return the list of functions overriden by the function
@@ -1097,7 +1174,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
             Note: it does not check for correct return values
         :return: Returns a true if the contract is an erc20
         """
-        full_names = self.functions_signatures
+        full_names = self._functions_signatures_set
         return all(s in full_names for s in ERC20_signatures)
 
     def is_erc165(self) -> bool:
@@ -1107,7 +1184,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
             Note: it does not check for correct return values
         :return: Returns a true if the contract is an erc165
         """
-        full_names = self.functions_signatures
+        full_names = self._functions_signatures_set
         return all(s in full_names for s in ERC165_signatures)
 
     def is_erc1820(self) -> bool:
@@ -1117,7 +1194,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
             Note: it does not check for correct return values
         :return: Returns a true if the contract is an erc165
         """
-        full_names = self.functions_signatures
+        full_names = self._functions_signatures_set
         return all(s in full_names for s in ERC1820_signatures)
 
     def is_erc223(self) -> bool:
@@ -1127,7 +1204,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
             Note: it does not check for correct return values
         :return: Returns a true if the contract is an erc223
         """
-        full_names = self.functions_signatures
+        full_names = self._functions_signatures_set
         return all(s in full_names for s in ERC223_signatures)
 
     def is_erc721(self) -> bool:
@@ -1137,7 +1214,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
             Note: it does not check for correct return values
         :return: Returns a true if the contract is an erc721
         """
-        full_names = self.functions_signatures
+        full_names = self._functions_signatures_set
         return all(s in full_names for s in ERC721_signatures)
 
     def is_erc777(self) -> bool:
@@ -1147,7 +1224,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
             Note: it does not check for correct return values
         :return: Returns a true if the contract is an erc165
         """
-        full_names = self.functions_signatures
+        full_names = self._functions_signatures_set
         return all(s in full_names for s in ERC777_signatures)
 
     def is_erc1155(self) -> bool:
@@ -1157,7 +1234,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
             Note: it does not check for correct return values
         :return: Returns a true if the contract is an erc1155
         """
-        full_names = self.functions_signatures
+        full_names = self._functions_signatures_set
         return all(s in full_names for s in ERC1155_signatures)
 
     def is_erc4626(self) -> bool:
@@ -1167,7 +1244,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
             Note: it does not check for correct return values
         :return: Returns a true if the contract is an erc4626
         """
-        full_names = self.functions_signatures
+        full_names = self._functions_signatures_set
         return all(s in full_names for s in ERC4626_signatures)
 
     def is_erc2612(self) -> bool:
@@ -1177,7 +1254,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
             Note: it does not check for correct return values
         :return: Returns a true if the contract is an erc2612
         """
-        full_names = self.functions_signatures
+        full_names = self._functions_signatures_set
         return all(s in full_names for s in ERC2612_signatures)
 
     def is_erc1363(self) -> bool:
@@ -1187,7 +1264,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
             Note: it does not check for correct return values
         :return: Returns a true if the contract is an erc1363
         """
-        full_names = self.functions_signatures
+        full_names = self._functions_signatures_set
         return all(s in full_names for s in ERC1363_signatures)
 
     def is_erc4524(self) -> bool:
@@ -1197,7 +1274,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
             Note: it does not check for correct return values
         :return: Returns a true if the contract is an erc4524
         """
-        full_names = self.functions_signatures
+        full_names = self._functions_signatures_set
         return all(s in full_names for s in ERC4524_signatures)
 
     @property
@@ -1222,7 +1299,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         :return: Returns a boolean indicating if the provided contract met the token standard.
         """
         # We do not check for all the functions, as name(), symbol(), might give too many FPs
-        full_names = self.functions_signatures
+        full_names = self._functions_signatures_set
         return (
             "transfer(address,uint256)" in full_names
             or "transferFrom(address,address,uint256)" in full_names
@@ -1236,7 +1313,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
         :return: Returns a boolean indicating if the provided contract met the token standard.
         """
         # We do not check for all the functions, as name(), symbol(), might give too many FPs
-        full_names = self.functions_signatures
+        full_names = self._functions_signatures_set
         return (
             "ownerOf(uint256)" in full_names
             or "safeTransferFrom(address,address,uint256,bytes)" in full_names
@@ -1395,6 +1472,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
                     # Could be improved with a targeted source mapping
                     constructor_variable.set_offset(self.source_mapping, self.compilation_unit)
                     self._functions[constructor_variable.canonical_name] = constructor_variable
+                    self._reset_indexes(_FUNCTION_INDEXES)
 
                     prev_node = self._create_node(
                         constructor_variable, 0, variable_candidate, constructor_variable
@@ -1427,6 +1505,7 @@ class Contract(SourceMapping):  # pylint: disable=too-many-public-methods
                     # Could be improved with a targeted source mapping
                     constructor_variable.set_offset(self.source_mapping, self.compilation_unit)
                     self._functions[constructor_variable.canonical_name] = constructor_variable
+                    self._reset_indexes(_FUNCTION_INDEXES)
 
                     prev_node = self._create_node(
                         constructor_variable, 0, variable_candidate, constructor_variable
@@ -13,6 +13,10 @@ class ContractLevel(SourceMapping):
 
     """
 
+    # _contract is declared by the slotted subclasses (StateVariable), the declarations
+    # keep it in their __dict__. Variable already adds slots to SourceMapping
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
         # TODO remove all the setters for the child objects
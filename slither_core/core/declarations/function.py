@@ -3,11 +3,12 @@
 """
 import logging
 from abc import abstractmethod, ABCMeta
-from collections import namedtuple
+from collections import deque, namedtuple
 from enum import Enum
 from itertools import groupby
 from typing import Any, Dict, TYPE_CHECKING, List, Optional, Set, Union, Callable, Tuple
 
+from slither_core.analyses.call_graph_summary.call_graph_summary import callees
 from slither_core.core.cfg.scope import Scope
 from slither_core.core.declarations.solidity_variables import (
     SolidityFunction,
@@ -1070,37 +1071,30 @@ class Function(SourceMapping, metaclass=ABCMeta):  # pylint: disable=too-many-pu
     ###################################################################################
     ###################################################################################
 
-    def _explore_functions(self, f_new_values: Callable[["Function"], List]) -> List[Any]:
-        values = f_new_values(self)
-        explored = [self]
-        to_explore = [
-            c for c in self.internal_calls if isinstance(c, Function) and c not in explored
-        ]
-        to_explore += [
-            c for (_, c) in self.library_calls if isinstance(c, Function) and c not in explored
-        ]
-        to_explore += [m for m in self.modifiers if m not in explored]
+    def _explore_functions(
+        self, name: str, f_new_values: Callable[["Function"], List]
+    ) -> List[Any]:
+        """
+        Return the values of f_new_values over the function and the functions it reaches
+        (internal calls, library calls and modifiers), without duplicates
 
+        :param name: name of the property, the key of its summaries in the compilation unit
+        """
+        summary = self.compilation_unit.call_graph_summary
+        if summary is not None:
+            return list(summary.values(self, name, f_new_values))
+
+        # The SlithIR is not generated yet, walk the call graph
+        values = list(f_new_values(self))
+        explored = {self}
+        to_explore = deque(callees(self))
         while to_explore:
-            f = to_explore[0]
-            to_explore = to_explore[1:]
+            f = to_explore.popleft()
             if f in explored:
                 continue
-            explored.append(f)
-
+            explored.add(f)
             values += f_new_values(f)
-
-            to_explore += [
-                c
-                for c in f.internal_calls
-                if isinstance(c, Function) and c not in explored and c not in to_explore
-            ]
-            to_explore += [
-                c
-                for (_, c) in f.library_calls
-                if isinstance(c, Function) and c not in explored and c not in to_explore
-            ]
-            to_explore += [m for m in f.modifiers if m not in explored and m not in to_explore]
+            to_explore += [c for c in callees(f) if c not in explored]
 
         return list(set(values))
 
@@ -1108,7 +1102,7 @@ class Function(SourceMapping, metaclass=ABCMeta):  # pylint: disable=too-many-pu
         """recursive version of variables_read"""
         if self._all_state_variables_read is None:
             self._all_state_variables_read = self._explore_functions(
-                lambda x: x.state_variables_read
+                "state_variables_read", lambda x: x.state_variables_read
             )
         return self._all_state_variables_read
 
@@ -1116,69 +1110,83 @@ class Function(SourceMapping, metaclass=ABCMeta):  # pylint: disable=too-many-pu
         """recursive version of solidity_read"""
         if self._all_solidity_variables_read is None:
             self._all_solidity_variables_read = self._explore_functions(
-                lambda x: x.solidity_variables_read
+                "solidity_variables_read", lambda x: x.solidity_variables_read
             )
         return self._all_solidity_variables_read
 
     def all_slithir_variables(self) -> List["SlithIRVariable"]:
         """recursive version of slithir_variables"""
         if self._all_slithir_variables is None:
-            self._all_slithir_variables = self._explore_functions(lambda x: x.slithir_variables)
+            self._all_slithir_variables = self._explore_functions(
+                "slithir_variables", lambda x: x.slithir_variables
+            )
         return self._all_slithir_variables
 
     def all_nodes(self) -> List["Node"]:
         """recursive version of nodes"""
         if self._all_nodes is None:
-            self._all_nodes = self._explore_functions(lambda x: x.nodes)
+            self._all_nodes = self._explore_functions("nodes", lambda x: x.nodes)
         return self._all_nodes
 
     def all_expressions(self) -> List["Expression"]:
         """recursive version of variables_read"""
         if self._all_expressions is None:
-            self._all_expressions = self._explore_functions(lambda x: x.expressions)
+            self._all_expressions = self._explore_functions("expressions", lambda x: x.expressions)
         return self._all_expressions
 
     def all_slithir_operations(self) -> List["Operation"]:
         if self._all_slithir_operations is None:
-            self._all_slithir_operations = self._explore_functions(lambda x: x.slithir_operations)
+            self._all_slithir_operations = self._explore_functions(
+                "slithir_operations", lambda x: x.slithir_operations
+            )
         return self._all_slithir_operations
 
     def all_state_variables_written(self) -> List[StateVariable]:
         """recursive version of variables_written"""
         if self._all_state_variables_written is None:
             self._all_state_variables_written = self._explore_functions(
-                lambda x: x.state_variables_written
+                "state_variables_written", lambda x: x.state_variables_written
             )
         return self._all_state_variables_written
 
     def all_internal_calls(self) -> List["InternalCallType"]:
         """recursive version of internal_calls"""
         if self._all_internals_calls is None:
-            self._all_internals_calls = self._explore_functions(lambda x: x.internal_calls)
+            self._all_internals_calls = self._explore_functions(
+                "internal_calls", lambda x: x.internal_calls
+            )
         return self._all_internals_calls
 
     def all_low_level_calls(self) -> List["LowLevelCallType"]:
         """recursive version of low_level calls"""
         if self._all_low_level_calls is None:
-            self._all_low_level_calls = self._explore_functions(lambda x: x.low_level_calls)
+            self._all_low_level_calls = self._explore_functions(
+                "low_level_calls", lambda x: x.low_level_calls
+            )
         return self._all_low_level_calls
 
     def all_high_level_calls(self) -> List["HighLevelCallType"]:
         """recursive version of high_level calls"""
         if self._all_high_level_calls is None:
-            self._all_high_level_calls = self._explore_functions(lambda x: x.high_level_calls)
+            self._all_high_level_calls = self._explore_functions(
+                "high_level_calls", lambda x: x.high_level_calls
+            )
         return self._all_high_level_calls
 
     def all_library_calls(self) -> List["LibraryCallType"]:
         """recursive version of library calls"""
         if self._all_library_calls is None:
-            self._all_library_calls = self._explore_functions(lambda x: x.library_calls)
+            self._all_library_calls = self._explore_functions(
+                "library_calls", lambda x: x.library_calls
+            )
         return self._all_library_calls
 
     def all_solidity_calls(self) -> List[SolidityFunction]:
         """recursive version of solidity calls"""
         if self._all_solidity_calls is None:
-            self._all_solidity_calls = self._explore_functions(lambda x: x.solidity_calls)
+            self._all_solidity_calls = self._explore_functions(
+                "solidity_calls", lambda x: x.solidity_calls
+            )
         return self._all_solidity_calls
 
     @staticmethod
@@ -1196,12 +1204,14 @@ class Function(SourceMapping, metaclass=ABCMeta):  # pylint: disable=too-many-pu
         if include_loop:
             if self._all_conditional_state_variables_read_with_loop is None:
                 self._all_conditional_state_variables_read_with_loop = self._explore_functions(
-                    lambda x: self._explore_func_cond_read(x, include_loop)
+                    "conditional_state_variables_read_with_loop",
+                    lambda x: self._explore_func_cond_read(x, include_loop),
                 )
             return self._all_conditional_state_variables_read_with_loop
         if self._all_conditional_state_variables_read is None:
             self._all_conditional_state_variables_read = self._explore_functions(
-                lambda x: self._explore_func_cond_read(x, include_loop)
+                "conditional_state_variables_read",
+                lambda x: self._explore_func_cond_read(x, include_loop),
             )
         return self._all_conditional_state_variables_read
 
@@ -1237,17 +1247,19 @@ class Function(SourceMapping, metaclass=ABCMeta):  # pylint: disable=too-many-pu
         if include_loop:
             if self._all_conditional_solidity_variables_read_with_loop is None:
                 self._all_conditional_solidity_variables_read_with_loop = self._explore_functions(
+                    "conditional_solidity_variables_read_with_loop",
                     lambda x: self._explore_func_conditional(
                         x, self._solidity_variable_in_binary, include_loop
-                    )
+                    ),
                 )
             return self._all_conditional_solidity_variables_read_with_loop
 
         if self._all_conditional_solidity_variables_read is None:
             self._all_conditional_solidity_variables_read = self._explore_functions(
+                "conditional_solidity_variables_read",
                 lambda x: self._explore_func_conditional(
                     x, self._solidity_variable_in_binary, include_loop
-                )
+                ),
             )
         return self._all_conditional_solidity_variables_read
 
@@ -1277,7 +1289,8 @@ class Function(SourceMapping, metaclass=ABCMeta):  # pylint: disable=too-many-pu
         """
         if self._all_solidity_variables_used_as_args is None:
             self._all_solidity_variables_used_as_args = self._explore_functions(
-                lambda x: self._explore_func_nodes(x, self._solidity_variable_in_internal_calls)
+                "solidity_variables_used_as_args",
+                lambda x: self._explore_func_nodes(x, self._solidity_variable_in_internal_calls),
             )
         return self._all_solidity_variables_used_as_args
 
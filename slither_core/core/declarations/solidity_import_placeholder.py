@@ -17,6 +17,8 @@ class SolidityImportPlaceHolder(Variable):
     In the long term we should remove this and better integrate import aliases
     """
 
+    __slots__ = ("_import_directive",)
+
     def __init__(self, import_directive: Import) -> None:
         super().__init__()
         assert import_directive.alias is not None
@@ -7,3 +7,5 @@ class TopLevel(SourceMapping):
     The opposite is ContractLevel
 
     """
+
+    __slots__ = ()
@@ -1,4 +1,4 @@
-from typing import Set, List, TYPE_CHECKING
+from typing import Dict, List, TYPE_CHECKING
 
 from slither_core.core.cfg.node import NodeType
 
@@ -6,91 +6,104 @@ if TYPE_CHECKING:
     from slither_core.core.cfg.node import Node
 
 
-def intersection_predecessor(node: "Node") -> Set["Node"]:
-    if not node.fathers:
-        return set()
-
-    ret = node.fathers[0].dominators
-    for pred in node.fathers[1:]:
-        ret = ret.intersection(pred.dominators)
-    if not any(father.is_reachable for father in node.fathers):
-        return set()
-
-    ret = set()
-    for pred in node.fathers:
-        ret = ret.union(pred.dominators)
-
-    for pred in node.fathers:
-        if pred.is_reachable:
-            ret = ret.intersection(pred.dominators)
-    return ret
-
-
-def _compute_dominators(nodes: List["Node"]) -> None:
-    changed = True
-
-    while changed:
-        changed = False
-
-        for node in nodes:
-            new_set = intersection_predecessor(node).union({node})
-            if new_set != node.dominators:
-                node.dominators = new_set
-                changed = True
-
-
-def _compute_immediate_dominators(nodes: List["Node"]) -> None:
-    for node in nodes:
-        idom_candidates = set(node.dominators)
-        idom_candidates.remove(node)
-
-        if len(idom_candidates) == 1:
-            idom = idom_candidates.pop()
-            node.immediate_dominator = idom
-            idom.dominator_successors.add(node)
+def _postorder(
+    roots: List["Node"], successors: Dict["Node", List["Node"]]
+) -> List["Node"]:
+    """
+    Iterative DFS from the roots
+    Returns the nodes reachable from the roots, in postorder
+    """
+    postorder: List["Node"] = []
+    visited = set()
+    for root in roots:
+        if root in visited:
             continue
-
-        # all_dominators contain all the dominators of all the node's dominators
-        # But self inclusion is removed
-        # The idom is then the only node that in idom_candidate that is not in all_dominators
-        all_dominators = set()
-        for d in idom_candidates:
-            # optimization: if a node is already in all_dominators, then
-            # its dominators are already in too
-            if d in all_dominators:
-                continue
-            all_dominators |= d.dominators - {d}
-
-        idom_candidates = all_dominators.symmetric_difference(idom_candidates)
-        assert len(idom_candidates) <= 1
-        if idom_candidates:
-            idom = idom_candidates.pop()
-            node.immediate_dominator = idom
-            idom.dominator_successors.add(node)
+        visited.add(root)
+        stack = [(root, iter(successors[root]))]
+        while stack:
+            node, sons = stack[-1]
+            for son in sons:
+                if son not in visited:
+                    visited.add(son)
+                    stack.append((son, iter(successors[son])))
+                    break
+            else:
+                stack.pop()
+                postorder.append(node)
+    return postorder
 
 
 def compute_dominators(nodes: List["Node"]) -> None:
     """
-    Naive implementation of Cooper, Harvey, Kennedy algo
+    Cooper, Harvey, Kennedy algo
     See 'A Simple,Fast Dominance Algorithm'
 
-    Compute strict domniators
+    Compute the immediate dominators (the dominator tree)
+    Only the reachable fathers are considered: a node without reachable father
+    is a root of the dominator tree
+    Node.dominators is derived from the tree
     """
+    predecessors: Dict["Node", List["Node"]] = {
+        node: [father for father in node.fathers if father.is_reachable] for node in nodes
+    }
+    successors: Dict["Node", List["Node"]] = {node: [] for node in nodes}
+    for node, fathers in predecessors.items():
+        for father in fathers:
+            if father in successors:
+                successors[father].append(node)
+    roots = [node for node in nodes if not predecessors[node]]
+
+    postorder = _postorder(roots, successors)
+    index: Dict["Node", int] = {node: i for i, node in enumerate(postorder)}
+
+    # The roots are the children of a virtual root, numbered after every node
+    # idom is indexed by postorder number, -1 is not computed yet
+    virtual_root = len(postorder)
+    idom = [-1] * (virtual_root + 1)
+    idom[virtual_root] = virtual_root
+    for root in roots:
+        idom[index[root]] = virtual_root
+
+    fathers_indexes = [
+        [index[father] for father in predecessors[node] if father in index] for node in postorder
+    ]
+
+    def intersect(finger1: int, finger2: int) -> int:
+        while finger1 != finger2:
+            while finger1 < finger2:
+                finger1 = idom[finger1]
+            while finger2 < finger1:
+                finger2 = idom[finger2]
+        return finger1
 
-    for n in nodes:
-        n.dominators = set(nodes)
-
-    _compute_dominators(nodes)
+    changed = True
+    while changed:
+        changed = False
+        for i in reversed(range(virtual_root)):
+            if idom[i] == virtual_root:
+                continue
+            new_idom = -1
+            for father in fathers_indexes[i]:
+                if idom[father] == -1:
+                    continue
+                new_idom = father if new_idom == -1 else intersect(father, new_idom)
+            if new_idom != idom[i]:
+                idom[i] = new_idom
+                changed = True
 
-    _compute_immediate_dominators(nodes)
+    for i, node in enumerate(postorder):
+        if idom[i] not in (-1, virtual_root):
+            dominator = postorder[idom[i]]
+            node.immediate_dominator = dominator
+            dominator.add_dominator_successor(node)
 
 
 def compute_dominance_frontier(nodes: List["Node"]) -> None:
     """
-    Naive implementation of Cooper, Harvey, Kennedy algo
+    Cooper, Harvey, Kennedy algo
     See 'A Simple,Fast Dominance Algorithm'
 
-    Compute dominance frontier
+    Compute dominance frontier, walking up the dominator tree from the fathers of the join nodes
     """
     for node in nodes:
         if len(node.fathers) >= 2:
@@ -105,8 +118,8 @@ def compute_dominance_frontier(nodes: List["Node"]) -> None:
                     and runner.type == NodeType.IF
                     and node.type == NodeType.ENDIF
                 ):
-                    runner.dominance_frontier = runner.dominance_frontier.union({node})
+                    runner.add_dominance_frontier(node)
                 while runner != node.immediate_dominator:
-                    runner.dominance_frontier = runner.dominance_frontier.union({node})
+                    runner.add_dominance_frontier(node)
                     assert runner.immediate_dominator
                     runner = runner.immediate_dominator
@@ -8,7 +8,7 @@ import pathlib
 import posixpath
 import re
 from collections import defaultdict
-from typing import Optional, Dict, List, Set, Union, Tuple
+from typing import Optional, Dict, List, Set, Union
 
 from antibug.compile.antibug_compile import AntibugCompile
 from antibug.compile.utils.naming import Filename
@@ -21,8 +21,10 @@ from slither_core.core.declarations.top_level import TopLevel
 from slither_core.core.source_mapping.source_mapping import SourceMapping, Source
 from slither_core.slithir.variables import Constant
 from slither_core.utils.colors import red
+from slither_core.utils.profiling import DISABLED_PROFILER, Profiler
 from slither_core.utils.sarif import read_triage_info
 from slither_core.utils.source_mapping import get_definition, get_references, get_implementation
+from slither_core.utils.suppression import SuppressionIndex
 
 logger = logging.getLogger("Slither")
 logging.basicConfig()
@@ -35,6 +37,11 @@ def _relative_path_format(path: str) -> str:
     return path.split("..")[-1].strip(".").strip("/")
 
 
+# Module level factories (instead of lambdas) keep SlitherCore picklable
+def _offsets_to_set() -> Dict[int, Set]:
+    return defaultdict(set)
+
+
 # pylint: disable=too-many-instance-attributes,too-many-public-methods
 class SlitherCore(Context):
     """
@@ -57,11 +64,17 @@ class SlitherCore(Context):
         self._previous_results: List = []
         # From triaged result
         self._previous_results_ids: Set[str] = set()
+        # Descriptions of the previous results, for the compatibility filtering
+        self._previous_results_descriptions: Set[str] = set()
         # Every slither object has a list of result from detector
         # Because of the multiple compilation support, we might analyze
         # Multiple time the same result, so we remove duplicates
         self._currently_seen_resuts: Set[str] = set()
         self._paths_to_filter: Set[str] = set()
+        # Compiled regexes of the paths to filter
+        self._paths_to_filter_regexes: List[re.Pattern] = []
+        # Source path -> resolved POSIX path, for the paths to filter
+        self._resolved_paths: Dict[str, str] = {}
 
         self._antibug_compile: Optional[AntibugCompile] = None
 
@@ -76,11 +89,8 @@ class SlitherCore(Context):
 
         self._show_ignored_findings = False
 
-        # Maps from file to detector name to the start/end ranges for that detector.
-        # Infinity is used to signal a detector has no end range.
-        self._ignore_ranges: Dict[str, Dict[str, List[Tuple[int, ...]]]] = defaultdict(
-            lambda: defaultdict(lambda: [(-1, -1)])
-        )
+        # Maps from file to its suppression comments (see utils.suppression)
+        self._suppression_indexes: Dict[str, SuppressionIndex] = {}
 
         self._compilation_units: List[SlitherCompilationUnit] = []
 
@@ -103,6 +113,13 @@ class SlitherCore(Context):
 
         self.skip_data_dependency = False
 
+        # Records the time and memory of the phases, see utils.profiling
+        self.profiler: Profiler = DISABLED_PROFILER
+
+        # Keys (see utils.incremental.contract_key) of the contracts to convert to SSA
+        # and to compute the data dependency of. None analyzes every contract
+        self.contracts_to_analyze: Optional[Set[str]] = None
+
     @property
     def compilation_units(self) -> List[SlitherCompilationUnit]:
         return list(self._compilation_units)
@@ -241,10 +258,10 @@ class SlitherCore(Context):
                 self._offset_to_references[ref.filename][offset] |= set(references)
 
     def _compute_offsets_to_ref_impl_decl(self):  # pylint: disable=too-many-branches
-        self._offset_to_references = defaultdict(lambda: defaultdict(lambda: set()))
-        self._offset_to_definitions = defaultdict(lambda: defaultdict(lambda: set()))
-        self._offset_to_implementations = defaultdict(lambda: defaultdict(lambda: set()))
-        self._offset_to_objects = defaultdict(lambda: defaultdict(lambda: set()))
+        self._offset_to_references = defaultdict(_offsets_to_set)
+        self._offset_to_definitions = defaultdict(_offsets_to_set)
+        self._offset_to_implementations = defaultdict(_offsets_to_set)
+        self._offset_to_objects = defaultdict(_offsets_to_set)
 
         for compilation_unit in self._compilation_units:
             for contract in compilation_unit.contracts:
@@ -304,47 +321,11 @@ class SlitherCore(Context):
     ###################################################################################
 
     def parse_ignore_comments(self, file: str) -> None: #ok
-        # The first time we check a file, find all start/end ignore comments and memoize them.
-        line_number = 1
-        while True:
-
-            line_text = self.antibug_compile.get_code_from_line(file, line_number)
-            if line_text is None:
-                break
-
-            start_regex = r"^\s*//\s*antibug-disable-start\s*([a-zA-Z0-9_,-]*)"
-            end_regex = r"^\s*//\s*antibug-disable-end\s*([a-zA-Z0-9_,-]*)"
-            start_match = re.findall(start_regex, line_text.decode("utf8"))
-            end_match = re.findall(end_regex, line_text.decode("utf8"))
-
-            if start_match:
-                ignored = start_match[0].split(",")
-                
-                if ignored:
-                    for check in ignored:
-                        vals = self._ignore_ranges[file][check]
-                        if len(vals) == 0 or vals[-1][1] != float("inf"):
-                            # First item in the array, or the prior item is fully populated.
-                            self._ignore_ranges[file][check].append((line_number, float("inf")))
-                        else:
-                            logger.error(
-                                f"Consecutive antibug-disable-starts without antibug-disable-end in {file}#{line_number}"
-                            )
-                            return
-
-            if end_match:
-                ignored = end_match[0].split(",")
-                if ignored:
-                    for check in ignored:
-                        vals = self._ignore_ranges[file][check]
-                        if len(vals) == 0 or vals[-1][1] != float("inf"):
-                            logger.error(
-                                f"antibug-disable-end without antibug-disable-start in {file}#{line_number}"
-                            )
-                            return
-                        self._ignore_ranges[file][check][-1] = (vals[-1][0], line_number)
-
-            line_number += 1
+        # The first time we check a file, find all the ignore comments and memoize them.
+        if file not in self._suppression_indexes:
+            self._suppression_indexes[file] = SuppressionIndex(
+                self.antibug_compile.get_lines(file), file
+            )
 
     def has_ignore_comment(self, r: Dict) -> bool:
         """
@@ -366,26 +347,9 @@ class SlitherCore(Context):
         )
 
         for file, lines in mapping_elements_with_lines:
-
-            # Check if result is within an ignored range.
-            ignore_ranges = self._ignore_ranges[file][r["check"]] + self._ignore_ranges[file]["all"]
-            for start, end in ignore_ranges:
-                # The full check must be within the ignore range to be ignored.
-                if start < lines[0] and end > lines[-1]:
-                    return True
-
-            # Check for next-line matchers.
-            ignore_line_index = min(lines) - 1
-            ignore_line_text = self.antibug_compile.get_code_from_line(file, ignore_line_index)
-            if ignore_line_text:
-                match = re.findall(
-                    r"^\s*//\s*slither-disable-next-line\s*([a-zA-Z0-9_,-]*)",
-                    ignore_line_text.decode("utf8"),
-                )
-                if match:
-                    ignored = match[0].split(",")
-                    if ignored and ("all" in ignored or any(r["check"] == c for c in ignored)):
-                        return True
+            self.parse_ignore_comments(file)
+            if self._suppression_indexes[file].is_suppressed(r["check"], lines):
+                return True
 
         return False
 
@@ -404,34 +368,19 @@ class SlitherCore(Context):
             return False
         self._currently_seen_resuts.add(r["id"])
 
-        source_mapping_elements = [
-            elem["source_mapping"].get("filename_absolute", "unknown")
-            for elem in r["elements"]
-            if "source_mapping" in elem
-        ]
-
-        # Use POSIX-style paths so that filter_paths works across different
-        # OSes. Convert to a list so elements don't get consumed and are lost
-        # while evaluating the first pattern
-        source_mapping_elements = list(
-            map(lambda x: pathlib.Path(x).resolve().as_posix() if x else x, source_mapping_elements)
-        )
         matching = False
-
-        for path in self._paths_to_filter:
-            try:
-                if any(
-                    bool(re.search(_relative_path_format(path), src_mapping))
-                    for src_mapping in source_mapping_elements
-                ):
-                    matching = True
-                    break
-            except re.error:
-                logger.error(
-                    f"Incorrect regular expression for --filter-paths {path}."
-                    "\nSlither supports the Python re format"
-                    ": https://docs.python.org/3/library/re.html"
-                )
+        if self._paths_to_filter_regexes:
+            # Use POSIX-style paths so that filter_paths works across different OSes
+            source_mapping_elements = [
+                self._resolve_path(elem["source_mapping"].get("filename_absolute", "unknown"))
+                for elem in r["elements"]
+                if "source_mapping" in elem
+            ]
+            matching = any(
+                regex.search(src_mapping)
+                for regex in self._paths_to_filter_regexes
+                for src_mapping in source_mapping_elements
+            )
 
         if r["elements"] and matching:
             return False
@@ -446,11 +395,20 @@ class SlitherCore(Context):
             if all(element["source_mapping"]["is_dependency"] for element in r["elements"]):
                 return False
         # Conserve previous result filtering. This is conserved for compatibility, but is meant to be removed
-        if r["description"] in [pr["description"] for pr in self._previous_results]:
+        if r["description"] in self._previous_results_descriptions:
             return False
 
         return True
 
+    def _resolve_path(self, path: Optional[str]) -> Optional[str]:
+        if not path:
+            return path
+        resolved = self._resolved_paths.get(path)
+        if resolved is None:
+            resolved = pathlib.Path(path).resolve().as_posix()
+            self._resolved_paths[path] = resolved
+        return resolved
+
     def load_previous_results(self) -> None:
         self.load_previous_results_from_sarif()
 
@@ -463,6 +421,8 @@ class SlitherCore(Context):
                         for r in self._previous_results:
                             if "id" in r:
                                 self._previous_results_ids.add(r["id"])
+                            if "description" in r:
+                                self._previous_results_descriptions.add(r["description"])
 
         except json.decoder.JSONDecodeError:
             logger.error(red(f"Impossible to decode {filename}. Consider removing the file"))
@@ -497,7 +457,17 @@ class SlitherCore(Context):
         Add path to filter
         Path are used through direct comparison (no regex)
         """
+        if path in self._paths_to_filter:
+            return
         self._paths_to_filter.add(path)
+        try:
+            self._paths_to_filter_regexes.append(re.compile(_relative_path_format(path)))
+        except re.error:
+            logger.error(
+                f"Incorrect regular expression for --filter-paths {path}."
+                "\nSlither supports the Python re format"
+                ": https://docs.python.org/3/library/re.html"
+            )
 
     # endregion
     ###################################################################################
@@ -1,8 +1,8 @@
-import re
 from abc import ABCMeta
 from typing import Dict, Union, List, Tuple, TYPE_CHECKING, Optional, Any
 
 from Crypto.Hash import SHA1
+from antibug.compile.utils.line_index import offset_to_line
 from antibug.compile.utils.naming import Filename
 from slither_core.core.context.context import Context
 
@@ -18,6 +18,20 @@ if TYPE_CHECKING:
 
 # pylint: disable=too-many-instance-attributes
 class Source:
+    __slots__ = (
+        "start",
+        "length",
+        "filename",
+        "is_dependency",
+        "lines",
+        "starting_column",
+        "ending_column",
+        "end",
+        "compilation_unit",
+        # Set by utils.source_mapping.get_definition
+        "txt",
+    )
+
     def __init__(self, compilation_unit: "SlitherCompilationUnit") -> None:
         self.start: int = 0
         self.length: int = 0
@@ -124,50 +138,35 @@ def _compute_line(
     Compute line(s) numbers and starting/ending columns
     from a start/end offset. All numbers start from 1.
 
-    Not done in an efficient way
+    Both offsets are resolved by a binary search over the line starts of the file
     """
 
-    start_line, starting_column = compilation_unit.core.antibug_compile.get_line_from_offset(
-        filename, start
-    )
-    end_line, ending_column = compilation_unit.core.antibug_compile.get_line_from_offset(
-        filename, start + length
-    )
+    line_starts = compilation_unit.core.antibug_compile.get_line_starts(filename)
+    start_line, starting_column = offset_to_line(line_starts, start)
+    end_line, ending_column = offset_to_line(line_starts, start + length)
     return list(range(start_line, end_line + 1)), starting_column, ending_column
 
 
-def _convert_source_mapping(
-    offset: str, compilation_unit: "SlitherCompilationUnit"
-) -> Source:  # pylint: disable=too-many-locals
+def _decode_source_mapping(offset: str, compilation_unit: "SlitherCompilationUnit") -> Source:
     """
-    Convert a text offset to a real offset
+    Convert a text offset to a Source
     see https://solidity.readthedocs.io/en/develop/miscellaneous.html#source-mappings
-    Returns:
-        (dict): {'start':0, 'length':0, 'filename': 'file.sol'}
     """
-    sourceUnits = compilation_unit.source_units
-
-    position = re.findall("([0-9]*):([0-9]*):([-]?[0-9]*)", offset)
-    if len(position) != 1:
+    position = offset.split(":")
+    if len(position) != 3:
+        return Source(compilation_unit)
+    try:
+        s, l, f = (int(x) for x in position)
+    except ValueError:
         return Source(compilation_unit)
 
-    s, l, f = position[0]
-    s = int(s)
-    l = int(l)
-    f = int(f)
-
-    if f not in sourceUnits:
+    # If possible, convert the filename to its absolute/relative version
+    filename = compilation_unit.source_unit_filename(f)
+    if filename is None:
         new_source = Source(compilation_unit)
         new_source.start = s
         new_source.length = l
         return new_source
-    filename_used = sourceUnits[f]
-
-    # If possible, convert the filename to its absolute/relative version
-    assert compilation_unit.core.antibug_compile
-
-    filename: Filename = compilation_unit.core.antibug_compile.filename_lookup(filename_used)
-    # is_dependency = compilation_unit.core.antibug_compile.is_dependency(filename.absolute)
 
     (lines, starting_column, ending_column) = _compute_line(compilation_unit, filename, s, l)
 
@@ -175,7 +174,6 @@ def _convert_source_mapping(
     new_source.start = s
     new_source.length = l
     new_source.filename = filename
-    # new_source.is_dependency = is_dependency
     new_source.lines = lines
     new_source.starting_column = starting_column
     new_source.ending_column = ending_column
@@ -184,11 +182,39 @@ def _convert_source_mapping(
     return new_source
 
 
+def _convert_source_mapping(offset: str, compilation_unit: "SlitherCompilationUnit") -> Source:
+    """
+    Convert a text offset to a Source
+    Identical offsets share the same Source: a Source must not be modified once created
+    """
+    source_mappings = compilation_unit.source_mappings
+    source = source_mappings.get(offset)
+    if source is None:
+        source = _decode_source_mapping(offset, compilation_unit)
+        # The source unit of an unknown file index may be registered later
+        if source.filename.absolute:
+            source_mappings[offset] = source
+    return source
+
+
 class SourceMapping(Context, metaclass=ABCMeta):
+    __slots__ = ("source_mapping", "_references")
+
     def __init__(self) -> None:
         super().__init__()
         self.source_mapping: Optional[Source] = None
-        self.references: List[Source] = []
+        # Allocated on first use
+        self._references: Optional[List[Source]] = None
+
+    @property
+    def references(self) -> List[Source]:
+        if self._references is None:
+            self._references = []
+        return self._references
+
+    @references.setter
+    def references(self, references: List[Source]) -> None:
+        self._references = references
 
     def set_offset(
         self, offset: Union["Source", str], compilation_unit: "SlitherCompilationUnit"
@@ -2,6 +2,8 @@ from slither_core.core.variables.variable import Variable
 
 
 class EventVariable(Variable):
+    __slots__ = ("_indexed",)
+
     def __init__(self) -> None:
         super().__init__()
         self._indexed = False
@@ -10,4 +10,4 @@ from .variable import Variable
 
 
 class FunctionTypeVariable(Variable):
-    pass
+    __slots__ = ()
@@ -13,6 +13,8 @@ class LocalVariableInitFromTuple(LocalVariable):
 
     """
 
+    __slots__ = ("_tuple_index",)
+
     def __init__(self) -> None:
         super().__init__()
         self._tuple_index: Optional[int] = None
@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 
 
 class StateVariable(ContractLevel, Variable):
+    __slots__ = ("_contract", "_node_initialization")
+
     def __init__(self) -> None:
         super().__init__()
         self._node_initialization: Optional["Node"] = None
@@ -7,6 +7,8 @@ if TYPE_CHECKING:
 
 
 class StructureVariable(Variable):
+    __slots__ = ("_structure",)
+
     def __init__(self) -> None:
         super().__init__()
         self._structure: Optional["Structure"] = None
@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 
 
 class TopLevelVariable(TopLevel, Variable):
+    __slots__ = ("_node_initialization", "file_scope")
+
     def __init__(self, scope: "FileScope") -> None:
         super().__init__()
         self._node_initialization: Optional["Node"] = None
@@ -1,7 +1,7 @@
 import abc
 import re
 from logging import Logger
-from typing import Optional, List, TYPE_CHECKING, Dict, Union, Callable
+from typing import Optional, List, TYPE_CHECKING, Dict, Set, Union, Callable
 
 from slither_core.core.compilation_unit import SlitherCompilationUnit#, Language
 from slither_core.core.declarations import Contract
@@ -196,18 +196,37 @@ class AbstractDetector(metaclass=abc.ABCMeta):
         """TODO Documentation"""
         return []
 
-    # pylint: disable=too-many-branches
-    def detect(self) -> List[Dict]:
-        results: List[Dict] = []
+    def detect_raw(self) -> List[Dict]:
+        """
+        Run the detector, without filtering its results
+        Only reads the analysis: it can run in a forked worker, see utils.parallel
 
+        :return: the data of the outputs of the detector
+        """
         # check solc version
         if not self._is_applicable_detector():
-            return results
+            return []
 
-        # only keep valid result, and remove duplicate
         # Keep only dictionaries
-        for r in [output.data for output in self._detect()]:
-            if self.compilation_unit.core.valid_result(r) and r not in results:
+        return [output.data for output in self._detect()]
+
+    # pylint: disable=too-many-branches
+    def detect(self, raw_results: Optional[List[Dict]] = None) -> List[Dict]:
+        """
+        :param raw_results: results of detect_raw, if already computed
+        :return: valid results, without duplicates
+        """
+        results: List[Dict] = []
+        # The id of a result is the hash of its content
+        results_ids: Set[str] = set()
+
+        if raw_results is None:
+            raw_results = self.detect_raw()
+
+        # only keep valid result, and remove duplicate
+        for r in raw_results:
+            if self.compilation_unit.core.valid_result(r) and r["id"] not in results_ids:
+                results_ids.add(r["id"])
                 results.append(r)
         if results and self.logger:
             self._log_result(results)
@@ -122,6 +122,9 @@ g 함수를 호출하여 true 값을 반환할 것을 기대했으나 f 함수
     # pylint: disable=too-many-nested-blocks
     def _detect(self) -> List[Output]:
         results: List[Output] = []
+        # No function of the compilation unit uses return in assembly
+        if not self.compilation_unit.ir_index.solidity_calls("return(uint256,uint256)"):
+            return results
         for c in self.contracts:
             for f in c.functions_and_modifiers_declared:
 
@@ -124,24 +124,23 @@ contract C {
     def _check_function(self, f: FunctionContract) -> List[Output]:
         results = []
 
-        for node in f.nodes:
-            for ir in node.irs:
-                if isinstance(ir, Binary) and ir.type in [
-                    BinaryType.LEFT_SHIFT,
-                    BinaryType.RIGHT_SHIFT,
-                ]:
-                    if not isinstance(
-                        ir.variable_right, Constant
-                    ):
-                        info: DETECTOR_INFO = [
-                            f,
-                            " contains an incorrect shift operation: ",
-                            node,
-                            "\n",
-                        ]
-                        info_kr=f" `{f.canonical_name}` 함수는 잘못된 shift 연산을 포함하고 있습니다. `{node.expression}`"
-                        json = self.generate_result(info, self.WIKI_DESCRIPTION, self.WIKI_BACKGROUND, self.WIKI_EXPLOIT_SCENARIO, self.WIKI_EXAMPLES, self.WIKI_RECOMMENDATION, info_kr, self.WIKI_DESCRIPTION_KOREAN, self.WIKI_BACKGROUND_KOREAN, self.WIKI_EXPLOIT_SCENARIO_KOREAN, self.WIKI_EXAMPLES_KOREAN, self.WIKI_RECOMMENDATION_KOREAN, self.WIKI_REFERENCE)
-                        results.append(json)
+        for _, node, ir in self.compilation_unit.ir_index.operations(Binary, function=f):
+            if ir.type in [
+                BinaryType.LEFT_SHIFT,
+                BinaryType.RIGHT_SHIFT,
+            ]:
+                if not isinstance(
+                    ir.variable_right, Constant
+                ):
+                    info: DETECTOR_INFO = [
+                        f,
+                        " contains an incorrect shift operation: ",
+                        node,
+                        "\n",
+                    ]
+                    info_kr=f" `{f.canonical_name}` 함수는 잘못된 shift 연산을 포함하고 있습니다. `{node.expression}`"
+                    json = self.generate_result(info, self.WIKI_DESCRIPTION, self.WIKI_BACKGROUND, self.WIKI_EXPLOIT_SCENARIO, self.WIKI_EXAMPLES, self.WIKI_RECOMMENDATION, info_kr, self.WIKI_DESCRIPTION_KOREAN, self.WIKI_BACKGROUND_KOREAN, self.WIKI_EXPLOIT_SCENARIO_KOREAN, self.WIKI_EXAMPLES_KOREAN, self.WIKI_RECOMMENDATION_KOREAN, self.WIKI_REFERENCE)
+                    results.append(json)
         return results
 
     def _detect(self) -> List[Output]:
@@ -2,7 +2,6 @@
 Module detecting usage of `tx.origin` in a conditional node
 """
 from typing import List, Tuple
-import re
 
 from slither_core.core.cfg.node import Node
 from slither_core.core.declarations.contract import Contract
@@ -266,40 +265,26 @@ function transfer(address payable _to, uint256 _amount) public {
 
     def detect_tx_origin(self, contract: Contract) -> List[Tuple[FunctionContract, List[Node]]]:
         ret = []
+        ir_index = self.compilation_unit.ir_index
         for f in contract.functions_and_modifiers:
-
-            nodes = f.nodes
+            # nodes reading tx.origin, in the order of f.nodes
+            nodes = list(
+                dict.fromkeys(loc.node for loc in ir_index.solidity_variable_reads("tx.origin", f))
+            )
+            if not nodes:
+                continue
             condtional_nodes = [
                 n for n in nodes if n.contains_if() or n.contains_require_or_assert()
             ]
             bad_tx_nodes = [
                 n for n in condtional_nodes if self._contains_incorrect_tx_origin_use(n)
             ]
-            incorrect_tx_origin_use = [
-                n for n in nodes if self.detect_tx_origin_in_funtion(n)]
             if bad_tx_nodes:
                 ret.append((f, bad_tx_nodes))
-            elif incorrect_tx_origin_use:
-                ret.append((f, incorrect_tx_origin_use))
-    
-            # if bad_tx_nodes or incorrect_tx_origin_use:
-            #     ret.append((f, bad_tx_nodes, incorrect_tx_origin_use))
+            else:
+                ret.append((f, nodes))
         return ret
 
-    def detect_tx_origin_in_funtion(self, node: Node) -> bool:
-        pattern = r'tx\.origin'
-        matches = []
-        for ir in node.irs:
-            matches.append(re.findall(
-                pattern, ir.node.expression.__str__()))
-        return self.isTrue(matches)
-
-    def isTrue(self,matches):
-        for match in matches:
-            if match:
-                return(True)    
-        return(False)
-
     def _detect(self) -> List[Output]:
         """Detect the functions that use tx.origin in a conditional node"""
         results = []
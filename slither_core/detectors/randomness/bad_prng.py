@@ -6,6 +6,7 @@ from typing import List, Tuple
 
 from slither_core.analyses.data_dependency.data_dependency import is_dependent_ssa
 from slither_core.analyses.data_dependency.data_dependency import is_dependent
+from slither_core.analyses.ir_index.ir_index import IRIndex
 from slither_core.core.cfg.node import Node
 from slither_core.core.declarations import Function, Contract
 from slither_core.core.declarations.solidity_variables import (
@@ -111,10 +112,25 @@ def contains_bad_PRNG_sources(func: Function) -> List[Node]:
                         results.append(ir.node)
     return results
 
-def detect_bad_PRNG(contract: Contract) -> List[Tuple[Function, List[Node]]]:
+def may_contain_bad_PRNG_sources(func: Function, ir_index: IRIndex) -> bool:
+    """
+        Check if the function has a modulo, or a hash of block variables, the operations
+        from which contains_bad_PRNG_sources starts
+    Returns:
+        (bool)
+    """
+    if ir_index.solidity_calls("keccak256(bytes)", "blockhash(uint256)", function=func):
+        return True
+    return any(
+        loc.ir.type == BinaryType.MODULO for loc in ir_index.operations(Binary, function=func)
+    )
+
+
+def detect_bad_PRNG(contract: Contract, ir_index: IRIndex) -> List[Tuple[Function, List[Node]]]:
     """
     Args:
         contract (Contract)
+        ir_index (IRIndex): index of the compilation unit of the contract
     Returns:
         list((Function), (list (Node)))
     """
@@ -123,6 +139,8 @@ def detect_bad_PRNG(contract: Contract) -> List[Tuple[Function, List[Node]]]:
     #     blockhash_ret_values += collect_return_values_of_bad_PRNG_functions(f)
     ret: List[Tuple[Function, List[Node]]] = []
     for f in contract.functions:
+        if not may_contain_bad_PRNG_sources(f, ir_index):
+            continue
         bad_prng_nodes = contains_bad_PRNG_sources(f)
         if bad_prng_nodes:
             ret.append((f, bad_prng_nodes))
@@ -397,8 +415,11 @@ contract Attack {
     def _detect(self) -> List[Output]:
         """Detect bad PRNG due to the use of block.timestamp, now or blockhash (block.blockhash) as a source of randomness"""
         results = []
-        for c in self.compilation_unit.contracts_derived:
-            values = detect_bad_PRNG(c)
+        contracts_derived = set(self.compilation_unit.contracts_derived)
+        for c in self.contracts:
+            if c not in contracts_derived:
+                continue
+            values = detect_bad_PRNG(c, self.compilation_unit.ir_index)
             for func, nodes in values:
                 for node in nodes:
                     info: List[AllSupportedOutput] = [func, ' uses a weak PRNG: "', node, '" \n']
@@ -12,7 +12,10 @@ from slither_core.detectors.abstract_detector import AbstractDetector, DetectorC
 from slither_core.exceptions import SlitherError
 from slither_core.printers.abstract_printer import AbstractPrinter
 from slither_core.solc_parsing.slither_compilation_unit_solc import SlitherCompilationUnitSolc
+from slither_core.utils.incremental import IncrementalState, contract_key
 from slither_core.utils.output import Output
+from slither_core.utils.parallel import detect_raw
+from slither_core.utils.profiling import DISABLED_PROFILER
 
 logger = logging.getLogger("Slither")
 logging.basicConfig()
@@ -66,6 +69,10 @@ class Slither(
             generate_patches (bool): if true, patches are generated (json output only)
             change_line_prefix (str): Change the line prefix (default #)
                 for the displayed source codes (i.e. file.sol#1).
+            contracts_to_analyze (set(str)): keys of the contracts converted to SSA and
+                analyzed for data dependency, the others only get SlithIR (default: all)
+            profiler (Profiler): records the time and memory of the parsing, the analysis,
+                the detectors and the printers (default: disabled)
 
         """
         super().__init__()
@@ -85,6 +92,8 @@ class Slither(
         self.codex_organization: Optional[str] = kwargs.get("codex_organization", None)
 
         self.no_fail = kwargs.get("no_fail", False)
+        self.contracts_to_analyze = kwargs.get("contracts_to_analyze", None)
+        self.profiler = kwargs.get("profiler", DISABLED_PROFILER)
 
         self._parsers: List[SlitherCompilationUnitSolc] = []
         try:
@@ -99,9 +108,10 @@ class Slither(
             self._compilation_units.append(compilation_unit_slither)
             sol_parser = SlitherCompilationUnitSolc(compilation_unit_slither)
             self._parsers.append(sol_parser)  
-            for path, ast in compilation_unit.asts.items():
-                sol_parser.parse_top_level_items(ast, path)
-                self.add_source_code(path)
+            with self.profiler.phase("parse", "top level items", antibug_compile.target):
+                for path, ast in compilation_unit.asts.items():
+                    sol_parser.parse_top_level_items(ast, path)
+                    self.add_source_code(path)
             
             _update_file_scopes(compilation_unit_slither.scopes.values())
 
@@ -131,7 +141,8 @@ class Slither(
     def _init_parsing_and_analyses(self) -> None:
         for parser in self._parsers:
             try:
-                parser.parse_contracts()
+                with self.profiler.phase("parse", "contracts", self._antibug_compile.target):
+                    parser.parse_contracts()
             except Exception as e:
                 if self.no_fail:
                     continue
@@ -140,7 +151,8 @@ class Slither(
         # skip_analyze is only used for testing
         for parser in self._parsers:
             try:
-                parser.analyze_contracts()
+                with self.profiler.phase("analysis", "contracts", self._antibug_compile.target):
+                    parser.analyze_contracts()
             except Exception as e:
                 if self.no_fail:
                     continue
@@ -208,14 +220,56 @@ class Slither(
                 self._printers.remove(obj)
                 return
 
-    def run_detectors(self) -> List[Dict]:
+    def run_detectors(self, jobs: Optional[int] = 1) -> List[Dict]:
         """
+        :param jobs: number of worker processes running the detectors, None uses every core
+        :return: List of registered detectors results.
+        """
+
+        return self.filter_detectors_results(detect_raw(self._detectors, jobs, self.profiler))
+
+    def filter_detectors_results(self, raw_results: List[List[Dict]]) -> List[Dict]:
+        """
+        Keep the valid results of the registered detectors, in their order
+
+        :param raw_results: results of AbstractDetector.detect_raw, one list per registered detector
         :return: List of registered detectors results.
         """
 
         self.load_previous_results()
-        results = [d.detect() for d in self._detectors]
-                    
+        results = [d.detect(raw) for d, raw in zip(self._detectors, raw_results)]
+
+        self.write_results_to_hide()
+        return results
+
+    def run_detectors_incremental(self, state: IncrementalState) -> List[List[Dict]]:
+        """
+        Run the registered detectors on the changed contracts only, and reuse the results
+        of the previous run for the others. The state is updated with the new results
+
+        :param state: results of the previous run and changed contracts
+        :return: List of registered detectors results.
+        """
+
+        self.load_previous_results()
+        for contract in self.contracts:
+            if not state.is_changed(contract):
+                continue
+            contract_results = state.results.setdefault(contract_key(contract), {})
+            for detector in self._detectors:
+                detector.contracts = [contract]
+                with self.profiler.phase("detector", detector.ARGUMENT, self._antibug_compile.target):
+                    contract_results[detector.ARGUMENT] = detector.detect()
+
+        results = []
+        for detector in self._detectors:
+            detector.contracts = detector.compilation_unit.contracts
+            detector_results: Dict[str, Dict] = {}
+            for contract in self.contracts:
+                for r in state.previous_results(contract, detector.ARGUMENT) or []:
+                    detector_results.setdefault(r["id"], r)
+            results.append(sorted(detector_results.values(), key=lambda x: x["id"]))
+        state.save()
 
         self.write_results_to_hide()
         return results
@@ -225,7 +279,11 @@ class Slither(
         :return: List of registered printers outputs.
         """
 
-        return [p.output(self._antibug_compile.target).data for p in self._printers]
+        results = []
+        for p in self._printers:
+            with self.profiler.phase("printer", p.ARGUMENT, self._antibug_compile.target):
+                results.append(p.output(self._antibug_compile.target).data)
+        return results
 
     @property
     def triage_mode(self) -> bool:
@@ -11,6 +11,8 @@ logger = logging.getLogger("AssignmentOperationIR")
 
 
 class Assignment(OperationWithLValue):
+    __slots__ = ("_variables", "_rvalue", "_variable_return_type")
+
     def __init__(
         self,
         left_variable: LVALUE,
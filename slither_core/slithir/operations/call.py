@@ -6,6 +6,10 @@ from slither_core.slithir.operations.operation import Operation
 
 
 class Call(Operation):
+    # The arguments are declared by the subclasses: most calls also inherit from
+    # OperationWithLValue, and only one base of a class can add slots
+    __slots__ = ()
+
     def __init__(self, names: Optional[List[str]] = None) -> None:
         """
         #### Parameters
@@ -9,6 +9,8 @@ from slither_core.slithir.variables.reference_ssa import ReferenceVariableSSA
 
 
 class CodeSize(OperationWithLValue):
+    __slots__ = ("_value",)
+
     def __init__(
         self,
         value: Union[LocalVariable, LocalIRVariable],
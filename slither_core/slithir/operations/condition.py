@@ -10,6 +10,8 @@ class Condition(Operation):
     Only present as last operation in conditional node
     """
 
+    __slots__ = ("_value",)
+
     def __init__(
         self,
         value: RVALUE,
@@ -14,6 +14,8 @@ class Delete(OperationWithLValue):
     of its operand
     """
 
+    __slots__ = ("_variable",)
+
     def __init__(
         self,
         lvalue: Union[StateIRVariable, StateVariable, ReferenceVariable],
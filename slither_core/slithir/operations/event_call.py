@@ -4,6 +4,8 @@ from slither_core.slithir.variables.constant import Constant
 
 
 class EventCall(Call):
+    __slots__ = ("_arguments", "_names", "_name")
+
     def __init__(self, name: Union[str, Constant]) -> None:
         super().__init__()
         self._name = name
@@ -20,6 +20,19 @@ class HighLevelCall(Call, OperationWithLValue):
     High level message call
     """
 
+    __slots__ = (
+        "_arguments",
+        "_names",
+        "_destination",
+        "_function_name",
+        "_nbr_arguments",
+        "_type_call",
+        "_callid",
+        "_function_instance",
+        "_call_value",
+        "_call_gas",
+    )
+
     # pylint: disable=too-many-arguments,too-many-instance-attributes
     def __init__(
         self,
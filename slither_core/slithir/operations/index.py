@@ -10,6 +10,8 @@ from slither_core.slithir.variables.reference import ReferenceVariable
 
 
 class Index(OperationWithLValue):
+    __slots__ = ("_variables",)
+
     def __init__(
         self, result: ReferenceVariable, left_variable: Variable, right_variable: RVALUE
     ) -> None:
@@ -7,6 +7,8 @@ from slither_core.slithir.variables.temporary_ssa import TemporaryVariableSSA
 
 
 class InitArray(OperationWithLValue):
+    __slots__ = ("_init_values",)
+
     def __init__(
         self, init_values: List[Constant], lvalue: Union[TemporaryVariableSSA, TemporaryVariable]
     ) -> None:
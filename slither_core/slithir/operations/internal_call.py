@@ -12,6 +12,17 @@ from slither_core.slithir.variables.tuple_ssa import TupleVariableSSA
 
 
 class InternalCall(Call, OperationWithLValue):  # pylint: disable=too-many-instance-attributes
+    __slots__ = (
+        "_arguments",
+        "_names",
+        "_contract_name",
+        "_function",
+        "_function_name",
+        "_nbr_arguments",
+        "_type_call",
+        "function_candidates",
+    )
+
     def __init__(
         self,
         function: Union[Function, Tuple[str, str]],
@@ -14,6 +14,16 @@ from slither_core.slithir.variables.temporary_ssa import TemporaryVariableSSA
 class InternalDynamicCall(
     Call, OperationWithLValue
 ):  # pylint: disable=too-many-instance-attributes
+    __slots__ = (
+        "_arguments",
+        "_names",
+        "_function",
+        "_function_type",
+        "_callid",
+        "_call_value",
+        "_call_gas",
+    )
+
     def __init__(
         self,
         lvalue: Optional[Union[TemporaryVariableSSA, TemporaryVariable]],
@@ -11,6 +11,8 @@ from slither_core.slithir.variables.state_variable import StateIRVariable
 
 
 class Length(OperationWithLValue):
+    __slots__ = ("_value",)
+
     def __init__(
         self,
         value: Union[StateVariable, LocalIRVariable, LocalVariable, StateIRVariable],
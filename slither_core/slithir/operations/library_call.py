@@ -11,6 +11,8 @@ class LibraryCall(HighLevelCall):
     High level message call
     """
 
+    __slots__ = ()
+
     # Development function, to be removed once the code is stable
     def _check_destination(self, destination: Union[Variable, SolidityVariable, Contract]) -> None:
         assert isinstance(destination, Contract)
@@ -9,6 +9,8 @@ class OperationWithLValue(Operation):
     Operation with a lvalue
     """
 
+    __slots__ = ("_lvalue",)
+
     def __init__(self) -> None:
         super().__init__()
 
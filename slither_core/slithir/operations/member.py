@@ -13,6 +13,8 @@ from slither_core.slithir.variables.reference_ssa import ReferenceVariableSSA
 
 
 class Member(OperationWithLValue):
+    __slots__ = ("_variable_left", "_variable_right", "_gas", "_value")
+
     def __init__(
         self,
         variable_left: SourceMapping,
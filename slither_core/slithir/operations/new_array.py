@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 
 
 class NewArray(Call, OperationWithLValue):
+    __slots__ = ("_arguments", "_names", "_array_type")
+
     def __init__(
         self,
         array_type: "ArrayType",
@@ -11,6 +11,8 @@ from slither_core.slithir.variables.temporary_ssa import TemporaryVariableSSA
 
 
 class NewContract(Call, OperationWithLValue):  # pylint: disable=too-many-instance-attributes
+    __slots__ = ("_arguments", "_names", "_contract_name", "_callid", "_call_value", "_call_salt")
+
     def __init__(
         self,
         contract_name: Constant,
@@ -5,6 +5,8 @@ from slither_core.slithir.utils.utils import is_valid_lvalue
 
 
 class NewElementaryType(Call, OperationWithLValue):
+    __slots__ = ("_arguments", "_names", "_type")
+
     def __init__(self, new_type, lvalue):
         assert isinstance(new_type, ElementaryType)
         assert is_valid_lvalue(lvalue)
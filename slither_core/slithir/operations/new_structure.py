@@ -13,6 +13,8 @@ from slither_core.slithir.variables.temporary_ssa import TemporaryVariableSSA
 
 
 class NewStructure(Call, OperationWithLValue):
+    __slots__ = ("_arguments", "_names", "_structure")
+
     def __init__(
         self,
         structure: StructureContract,
@@ -6,6 +6,8 @@ from slither_core.slithir.operations import Operation
 
 
 class Nop(Operation):
+    __slots__ = ()
+
     @property
     def read(self) -> List[Variable]:
         return []
@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 
 
 class AbstractOperation(abc.ABC):
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def read(self):
@@ -29,6 +31,8 @@ class AbstractOperation(abc.ABC):
 
 
 class Operation(Context, AbstractOperation):
+    __slots__ = ("_node", "_expression")
+
     def __init__(self) -> None:
         super().__init__()
         self._node: Optional["Node"] = None
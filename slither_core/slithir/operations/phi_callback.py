@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 
 class PhiCallback(Phi):
+    __slots__ = ("_call_ir", "_rvalue_no_callback")
+
     def __init__(
         self,
         left_variable: StateIRVariable,
@@ -13,6 +13,8 @@ class Return(Operation):
     Only present as last operation in RETURN node
     """
 
+    __slots__ = ("_values",)
+
     def __init__(
         self, values: Optional[Union[RVALUE, TupleVariable, Function, List[RVALUE]]]
     ) -> None:
@@ -13,6 +13,8 @@ from slither_core.slithir.variables.temporary_ssa import TemporaryVariableSSA
 
 
 class Send(Call, OperationWithLValue):
+    __slots__ = ("_arguments", "_names", "_destination", "_call_value")
+
     def __init__(
         self,
         destination: Union[LocalVariable, LocalIRVariable],
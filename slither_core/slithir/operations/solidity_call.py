@@ -6,6 +6,8 @@ from slither_core.slithir.operations.lvalue import OperationWithLValue
 
 
 class SolidityCall(Call, OperationWithLValue):
+    __slots__ = ("_arguments", "_names", "_function", "_nbr_arguments", "_type_call")
+
     def __init__(
         self,
         function: SolidityFunction,
@@ -8,6 +8,8 @@ from slither_core.slithir.variables.local_variable import LocalIRVariable
 
 
 class Transfer(Call):
+    __slots__ = ("_arguments", "_names", "_destination", "_call_value")
+
     def __init__(self, destination: Union[LocalVariable, LocalIRVariable], value: Constant) -> None:
         assert isinstance(destination, (Variable, SolidityVariable))
         self._destination = destination
@@ -13,6 +13,8 @@ from slither_core.slithir.variables.temporary_ssa import TemporaryVariableSSA
 
 
 class TypeConversion(OperationWithLValue):
+    __slots__ = ("_variable", "_type")
+
     def __init__(
         self,
         result: Union[TemporaryVariableSSA, TemporaryVariable],
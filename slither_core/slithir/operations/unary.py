@@ -30,6 +30,8 @@ class UnaryType(Enum):
 
 
 class Unary(OperationWithLValue):
+    __slots__ = ("_variable", "_type")
+
     def __init__(
         self,
         result: Union[TemporaryVariableSSA, TemporaryVariable],
@@ -9,6 +9,8 @@ from slither_core.slithir.variables.tuple_ssa import TupleVariableSSA
 
 
 class Unpack(OperationWithLValue):
+    __slots__ = ("_tuple", "_idx")
+
     def __init__(
         self,
         result: Union[LocalVariableInitFromTuple, LocalIRVariable],
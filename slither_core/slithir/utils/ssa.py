@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Callable, Dict, List, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import slither_core.slithir.variables.tuple_ssa
 from slither_core.core.cfg.node import Node, NodeType
@@ -136,11 +136,13 @@ def add_ssa_ir(
         if v.name:
             init_definition[v.name] = (v, function.entry_point)
 
+    liveness = Liveness(function)
+
     # We only add phi function for state variable at entry node if
     # The state variable is used
     # And if the state variables is written in another function (otherwise its stay at index 0)
     for (_, variable_instance) in all_state_variables_instances.items():
-        if is_used_later(function.entry_point, variable_instance):
+        if liveness.is_live(function.entry_point, variable_instance):
             # rvalues are fixed in solc_parsing.declaration.function
             function.entry_point.add_ssa_ir(Phi(StateIRVariable(variable_instance), set()))
 
@@ -150,7 +152,7 @@ def add_ssa_ir(
         for (variable, nodes) in node.phi_origins_local_variables.values():
             if len(nodes) < 2:
                 continue
-            if not is_used_later(node, variable):
+            if not liveness.is_live(node, variable):
                 continue
             node.add_ssa_ir(Phi(LocalIRVariable(variable), nodes))
         for (variable, nodes) in node.phi_origins_state_variables.values():
@@ -203,6 +205,7 @@ def add_ssa_ir(
         all_state_variables_instances,
         init_local_variables_instances,
         [],
+        liveness,
     )
 
     fix_phi_rvalues_and_storage_ref(
@@ -223,11 +226,15 @@ def generate_ssa_irs(
     all_state_variables_instances: Dict[str, StateIRVariable],
     init_local_variables_instances: Dict[str, LocalIRVariable],
     visited: List[Node],
+    liveness: Optional["Liveness"] = None,
 ) -> None:
 
     if node in visited:
         return
 
+    if liveness is None:
+        liveness = Liveness(node.function)
+
     if node.type in [NodeType.ENDIF, NodeType.ENDLOOP] and any(
         not father in visited for father in node.fathers
     ):
@@ -284,7 +291,7 @@ def generate_ssa_irs(
                 if isinstance(ir, LibraryCall):
                     continue
                 for variable in all_state_variables_instances.values():
-                    if not is_used_later(node, variable):
+                    if not liveness.is_live(node, variable):
                         continue
                     new_var = StateIRVariable(variable)
                     new_var.index = all_state_variables_instances[variable.canonical_name].index + 1
@@ -318,6 +325,7 @@ def generate_ssa_irs(
             all_state_variables_instances,
             init_local_variables_instances,
             visited,
+            liveness,
         )
 
     for dominated in node.dominance_frontier:
@@ -329,6 +337,7 @@ def generate_ssa_irs(
             all_state_variables_instances,
             init_local_variables_instances,
             visited,
+            liveness,
         )
 
 
@@ -366,10 +375,83 @@ def last_name(
     return max(candidates, key=lambda v: v.index)
 
 
+class Liveness:
+    """
+    Backward liveness of the local and state variables of a function
+    A variable is live at the entry of a node if the node reads it, or if it is live
+    at the entry of a son and the node does not write it
+    Local variables are identified by their name, state variables by their name and contract
+
+    Computed once per function: every node holds the bitset of its live variables
+    """
+
+    def __init__(self, function: Function) -> None:
+        # variable key -> bit
+        self._bits: Dict[Any, int] = {}
+        uses: Dict[Node, int] = {}
+        defs: Dict[Node, int] = {}
+        for node in function.nodes:
+            uses[node] = self._bitset(node.local_variables_read, node.state_variables_read)
+            defs[node] = self._bitset(node.local_variables_written, node.state_variables_written)
+
+        live = dict(uses)
+        # Nodes are (mostly) in control flow order: explore them backward
+        to_explore = list(function.nodes)
+        in_to_explore = set(to_explore)
+        while to_explore:
+            node = to_explore.pop()
+            in_to_explore.discard(node)
+            live_out = 0
+            for son in node.sons:
+                live_out |= live.get(son, 0)
+            live_in = uses[node] | (live_out & ~defs[node])
+            if live_in != live[node]:
+                live[node] = live_in
+                for father in node.fathers:
+                    if father in live and father not in in_to_explore:
+                        in_to_explore.add(father)
+                        to_explore.append(father)
+        self._live: Dict[Node, int] = live
+
+    @staticmethod
+    def _key(variable: Variable) -> Any:
+        if isinstance(variable, LocalVariable):
+            return variable.name
+        if isinstance(variable, StateVariable):
+            return variable.name, variable.contract
+        return None
+
+    def _bitset(self, local_variables: List[LocalVariable], state_variables: List[StateVariable]) -> int:
+        bitset = 0
+        for variable in local_variables + state_variables:
+            key = self._key(variable)
+            bit = self._bits.get(key)
+            if bit is None:
+                bit = 1 << len(self._bits)
+                self._bits[key] = bit
+            bitset |= bit
+        return bitset
+
+    def is_live(
+        self, node: Node, variable: Union[StateIRVariable, LocalVariable, TemporaryVariableSSA]
+    ) -> bool:
+        """
+        Return true if variable is read from node (included) before being written
+        """
+        bit = self._bits.get(self._key(variable))
+        if bit is None:
+            return False
+        return bool(self._live.get(node, 0) & bit)
+
+
 def is_used_later(
     initial_node: Node,
     variable: Union[StateIRVariable, LocalVariable, TemporaryVariableSSA],
 ) -> bool:
+    """
+    Return true if variable is read from initial_node (included) before being written
+    Computes the liveness of the whole function: use Liveness for repeated queries
+    """
     # TODO: does not handle the case where its read and written in the declaration node
     # It can be problematic if this happens in a loop/if structure
     # Ex:
@@ -378,33 +460,7 @@ def is_used_later(
     #     uint a = a;
     #    }
     #     ..
-    to_explore = {initial_node}
-    explored = set()
-
-    while to_explore:
-        node = to_explore.pop()
-        explored.add(node)
-        if isinstance(variable, LocalVariable):
-            if any(v.name == variable.name for v in node.local_variables_read):
-                return True
-            if any(v.name == variable.name for v in node.local_variables_written):
-                return False
-        if isinstance(variable, StateVariable):
-            if any(
-                v.name == variable.name and v.contract == variable.contract
-                for v in node.state_variables_read
-            ):
-                return True
-            if any(
-                v.name == variable.name and v.contract == variable.contract
-                for v in node.state_variables_written
-            ):
-                return False
-        for son in node.sons:
-            if not son in explored:
-                to_explore.add(son)
-
-    return False
+    return Liveness(initial_node.function).is_live(initial_node, variable)
 
 
 # endregion
@@ -9,6 +9,8 @@ from slither_core.utils.integer_conversion import convert_string_to_int
 
 @total_ordering
 class Constant(SlithIRVariable):
+    __slots__ = ("_index", "_original_value", "_subdenomination", "_val")
+
     def __init__(
         self,
         val: str,
@@ -8,6 +8,8 @@ from slither_core.slithir.variables.state_variable import StateIRVariable
 class LocalIRVariable(
     LocalVariable, SlithIRVariable
 ):  # pylint: disable=too-many-instance-attributes
+    __slots__ = ("_is_storage", "_index", "_refers_to", "_non_ssa_version")
+
     def __init__(self, local_variable: LocalVariable) -> None:
         assert isinstance(local_variable, LocalVariable)
 
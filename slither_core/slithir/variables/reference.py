@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 
 
 class ReferenceVariable(Variable):
+    __slots__ = ("_index", "_points_to", "_node")
+
     def __init__(self, node: "Node", index: Optional[int] = None) -> None:
         super().__init__()
         if index is None:
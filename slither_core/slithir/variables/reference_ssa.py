@@ -9,6 +9,8 @@ from slither_core.slithir.variables.tuple import TupleVariable
 
 
 class ReferenceVariableSSA(ReferenceVariable):  # pylint: disable=too-few-public-methods
+    __slots__ = ("_non_ssa_version",)
+
     def __init__(self, reference: ReferenceVariable) -> None:
         super().__init__(reference.node, reference.index)
 
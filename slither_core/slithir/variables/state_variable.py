@@ -5,6 +5,8 @@ from slither_core.slithir.variables.variable import SlithIRVariable
 class StateIRVariable(
     StateVariable, SlithIRVariable
 ):  # pylint: disable=too-many-instance-attributes
+    __slots__ = ("_index", "_non_ssa_version")
+
     def __init__(self, state_variable: StateVariable) -> None:
         assert isinstance(state_variable, StateVariable)
 
@@ -7,6 +7,8 @@ if TYPE_CHECKING:
 
 
 class TemporaryVariable(Variable):
+    __slots__ = ("_index", "_node")
+
     def __init__(self, node: "Node", index: Optional[int] = None) -> None:
         super().__init__()
         if index is None:
@@ -10,6 +10,8 @@ from slither_core.slithir.variables.tuple import TupleVariable
 
 
 class TemporaryVariableSSA(TemporaryVariable):  # pylint: disable=too-few-public-methods
+    __slots__ = ("_non_ssa_version",)
+
     def __init__(self, temporary: TemporaryVariable) -> None:
         super().__init__(temporary.node, temporary.index)
 
@@ -7,6 +7,8 @@ from slither_core.slithir.variables.tuple import TupleVariable
 
 
 class TupleVariableSSA(TupleVariable):  # pylint: disable=too-few-public-methods
+    __slots__ = ("_non_ssa_version",)
+
     def __init__(self, t: TupleVariable) -> None:
         super().__init__(t.node, t.index)
 
@@ -2,6 +2,10 @@ from slither_core.core.variables.variable import Variable
 
 
 class SlithIRVariable(Variable):
+    # _index is declared by the subclasses: the SSA state and local variables also
+    # inherit the slots of StateVariable and LocalVariable
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
         self._index = 0
@@ -5,7 +5,6 @@ import re
 from pathlib import Path
 from typing import List, Dict
 
-from slither_core.analyses.data_dependency.data_dependency import compute_dependency
 from slither_core.core.compilation_unit import SlitherCompilationUnit
 from slither_core.core.declarations import Contract
 from slither_core.core.declarations.custom_error_top_level import CustomErrorTopLevel
@@ -27,6 +26,7 @@ from slither_core.solc_parsing.declarations.structure_top_level import Structure
 from slither_core.solc_parsing.declarations.using_for_top_level import UsingForTopLevelSolc
 from slither_core.solc_parsing.exceptions import VariableNotFound
 from slither_core.solc_parsing.variables.top_level_variable import TopLevelVariableSolc
+from slither_core.utils.incremental import contract_key
 
 logging.basicConfig()
 logger = logging.getLogger("SlitherSolcParsing")
@@ -501,10 +501,14 @@ Please rename it, this name is reserved for Slither's internals"""
                 contract_parser.set_is_analyzed(True)
                 contract_parser.delete_content()
 
-        contracts_to_be_analyzed = list(self._underlying_contract_to_parser.values())
+        # Every phase analyzes a contract after all its parents
+        contracts_to_be_analyzed = self.contracts_in_inheritance_order
+
+        profiler = self._compilation_unit.core.profiler
 
         # Any contract can refer another contract enum without need for inheritance
-        self._analyze_all_enums(contracts_to_be_analyzed)
+        with profiler.phase("parse", "enums"):
+            self._analyze_all_enums(contracts_to_be_analyzed)
         # pylint: disable=expression-not-assigned
         [c.set_is_analyzed(False) for c in self._underlying_contract_to_parser.values()]
 
@@ -516,47 +520,54 @@ Please rename it, this name is reserved for Slither's internals"""
         ]
 
         # We first parse the struct/variables/functions/contract
-        self._analyze_first_part(contracts_to_be_analyzed, libraries)
+        with profiler.phase("parse", "declarations"):
+            self._analyze_first_part(contracts_to_be_analyzed, libraries)
         # pylint: disable=expression-not-assigned
         [c.set_is_analyzed(False) for c in self._underlying_contract_to_parser.values()]
 
         # We analyze the struct and parse and analyze the events
         # A contract can refer in the variables a struct or a event from any contract
         # (without inheritance link)
-        self._analyze_second_part(contracts_to_be_analyzed, libraries)
+        with profiler.phase("parse", "structures and events"):
+            self._analyze_second_part(contracts_to_be_analyzed, libraries)
         [c.set_is_analyzed(False) for c in self._underlying_contract_to_parser.values()]
 
         # Then we analyse state variables, functions and modifiers
-        self._analyze_third_part(contracts_to_be_analyzed, libraries)
+        with profiler.phase("parse", "variables, functions and modifiers"):
+            self._analyze_third_part(contracts_to_be_analyzed, libraries)
         [c.set_is_analyzed(False) for c in self._underlying_contract_to_parser.values()]
 
-        self._analyze_using_for(contracts_to_be_analyzed, libraries)
+        with profiler.phase("parse", "using for"):
+            self._analyze_using_for(contracts_to_be_analyzed, libraries)
 
         self._parsed = True
 
     def analyze_contracts(self) -> None:  # pylint: disable=too-many-statements,too-many-branches
         if not self._parsed:
             raise SlitherException("Parse the contract before running analyses")
-        self._convert_to_slithir()
-        if not self._compilation_unit.core.skip_data_dependency:
-            compute_dependency(self._compilation_unit)
-        self._compilation_unit.compute_storage_layout()
+        profiler = self._compilation_unit.core.profiler
+        # The data dependency is computed on demand, see analyses.data_dependency
+        with profiler.phase("analysis", "slithir"):
+            self._convert_to_slithir()
+        with profiler.phase("analysis", "ir index"):
+            self._compilation_unit.compute_ir_index()
+        self._compilation_unit.compute_call_graph_summary()
+        with profiler.phase("analysis", "storage layout"):
+            self._compilation_unit.compute_storage_layout()
         self._analyzed = True
 
-    def _analyze_all_enums(self, contracts_to_be_analyzed: List[ContractSolc]) -> None:
-        while contracts_to_be_analyzed:
-            contract = contracts_to_be_analyzed[0]
-
-            contracts_to_be_analyzed = contracts_to_be_analyzed[1:]
-            all_father_analyzed = all(
-                self._underlying_contract_to_parser[father].is_analyzed
-                for father in contract.underlying_contract.inheritance
-            )
+    @property
+    def contracts_in_inheritance_order(self) -> List[ContractSolc]:
+        """Contract parsers sorted so that every contract comes after its parents"""
+        return [
+            self._underlying_contract_to_parser[contract]
+            for contract in self._compilation_unit.contracts_in_inheritance_order
+            if contract in self._underlying_contract_to_parser
+        ]
 
-            if not contract.underlying_contract.inheritance or all_father_analyzed:
-                self._analyze_enums(contract)
-            else:
-                contracts_to_be_analyzed += [contract]
+    def _analyze_all_enums(self, contracts_to_be_analyzed: List[ContractSolc]) -> None:
+        for contract in contracts_to_be_analyzed:
+            self._analyze_enums(contract)
 
     def _analyze_first_part(
         self,
@@ -566,24 +577,10 @@ Please rename it, this name is reserved for Slither's internals"""
         for lib in libraries:
             self._parse_struct_var_modifiers_functions(lib)
 
-        # Start with the contracts without inheritance
-        # Analyze a contract only if all its fathers
-        # Were analyzed
-        while contracts_to_be_analyzed:
-
-            contract = contracts_to_be_analyzed[0]
-
-            contracts_to_be_analyzed = contracts_to_be_analyzed[1:]
-            all_father_analyzed = all(
-                self._underlying_contract_to_parser[father].is_analyzed
-                for father in contract.underlying_contract.inheritance
-            )
-
-            if not contract.underlying_contract.inheritance or all_father_analyzed:
-                self._parse_struct_var_modifiers_functions(contract)
-
-            else:
-                contracts_to_be_analyzed += [contract]
+        # contracts_to_be_analyzed is in inheritance order:
+        # a contract is analyzed after all its fathers
+        for contract in contracts_to_be_analyzed:
+            self._parse_struct_var_modifiers_functions(contract)
 
     def _analyze_second_part(
         self,
@@ -596,24 +593,8 @@ Please rename it, this name is reserved for Slither's internals"""
         self._analyze_top_level_variables()
         self._analyze_top_level_structures()
 
-        # Start with the contracts without inheritance
-        # Analyze a contract only if all its fathers
-        # Were analyzed
-        while contracts_to_be_analyzed:
-
-            contract = contracts_to_be_analyzed[0]
-
-            contracts_to_be_analyzed = contracts_to_be_analyzed[1:]
-            all_father_analyzed = all(
-                self._underlying_contract_to_parser[father].is_analyzed
-                for father in contract.underlying_contract.inheritance
-            )
-
-            if not contract.underlying_contract.inheritance or all_father_analyzed:
-                self._analyze_struct_events(contract)
-
-            else:
-                contracts_to_be_analyzed += [contract]
+        for contract in contracts_to_be_analyzed:
+            self._analyze_struct_events(contract)
 
     def _analyze_third_part(
         self,
@@ -623,24 +604,8 @@ Please rename it, this name is reserved for Slither's internals"""
         for lib in libraries:
             self._analyze_variables_modifiers_functions(lib)
 
-        # Start with the contracts without inheritance
-        # Analyze a contract only if all its fathers
-        # Were analyzed
-        while contracts_to_be_analyzed:
-
-            contract = contracts_to_be_analyzed[0]
-
-            contracts_to_be_analyzed = contracts_to_be_analyzed[1:]
-            all_father_analyzed = all(
-                self._underlying_contract_to_parser[father].is_analyzed
-                for father in contract.underlying_contract.inheritance
-            )
-
-            if not contract.underlying_contract.inheritance or all_father_analyzed:
-                self._analyze_variables_modifiers_functions(contract)
-
-            else:
-                contracts_to_be_analyzed += [contract]
+        for contract in contracts_to_be_analyzed:
+            self._analyze_variables_modifiers_functions(contract)
 
     def _analyze_using_for(
         self, contracts_to_be_analyzed: List[ContractSolc], libraries: List[ContractSolc]
@@ -650,20 +615,9 @@ Please rename it, this name is reserved for Slither's internals"""
         for lib in libraries:
             lib.analyze_using_for()
 
-        while contracts_to_be_analyzed:
-            contract = contracts_to_be_analyzed[0]
-
-            contracts_to_be_analyzed = contracts_to_be_analyzed[1:]
-            all_father_analyzed = all(
-                self._underlying_contract_to_parser[father].is_analyzed
-                for father in contract.underlying_contract.inheritance
-            )
-
-            if not contract.underlying_contract.inheritance or all_father_analyzed:
-                contract.analyze_using_for()
-                contract.set_is_analyzed(True)
-            else:
-                contracts_to_be_analyzed += [contract]
+        for contract in contracts_to_be_analyzed:
+            contract.analyze_using_for()
+            contract.set_is_analyzed(True)
 
     def _analyze_enums(self, contract: ContractSolc) -> None:
         # Enum must be analyzed first
@@ -741,7 +695,16 @@ Please rename it, this name is reserved for Slither's internals"""
 
         contract.set_is_analyzed(True)
 
+    def _contracts_to_analyze(self) -> List[Contract]:
+        """Contracts converted to SSA and analyzed, see SlitherCore.contracts_to_analyze"""
+        keys = self._compilation_unit.core.contracts_to_analyze
+        if keys is None:
+            return self._compilation_unit.contracts
+        return [c for c in self._compilation_unit.contracts if contract_key(c) in keys]
+
     def _convert_to_slithir(self) -> None:
+        contracts_to_analyze = self._contracts_to_analyze()
+        is_analyzed = set(contracts_to_analyze)
 
         for contract in self._compilation_unit.contracts:
             contract.add_constructor_variables()
@@ -764,8 +727,11 @@ Please rename it, this name is reserved for Slither's internals"""
                         f"{func_expressions}"
                     )
                     raise e
+            if contract not in is_analyzed:
+                continue
             try:
-                contract.convert_expression_to_slithir_ssa()
+                with self._compilation_unit.core.profiler.phase("analysis", "ssa"):
+                    contract.convert_expression_to_slithir_ssa()
             except Exception as e:
                 logger.error(
                     f"\nFailed to convert IR to SSA for {contract.name} contract. Please open an issue https://github.com/crytic/slither/issues.\n "
@@ -788,7 +754,8 @@ Please rename it, this name is reserved for Slither's internals"""
                 raise e
 
             try:
-                func.generate_slithir_ssa({})
+                with self._compilation_unit.core.profiler.phase("analysis", "ssa"):
+                    func.generate_slithir_ssa({})
             except Exception as e:
                 func_expressions = "\n".join([f"\t{ex}" for ex in func.expressions])
                 logger.error(
@@ -798,7 +765,7 @@ Please rename it, this name is reserved for Slither's internals"""
                 raise e
 
         self._compilation_unit.propagate_function_calls()
-        for contract in self._compilation_unit.contracts:
+        for contract in contracts_to_analyze:
             contract.fix_phi()
             contract.update_read_write_using_ssa()
 
@@ -0,0 +1,59 @@
+# Generic graph algorithms
+from typing import Callable, Dict, Hashable, Iterable, List, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+
+def strongly_connected_components(
+    nodes: Iterable[T], successors: Callable[[T], Iterable[T]]
+) -> List[List[T]]:
+    """
+        Compute the strongly connected components of a directed graph
+        Based on Tarjan algo, iterative to support deep graphs
+        The components are returned in reverse topological order:
+        a component comes after all the components reachable from it
+    Args:
+        nodes (iterable(T)): nodes of the graph
+        successors (T -> iterable(T)): successors of a node
+    Returns:
+        list(list(T))
+    """
+    index: Dict[T, int] = {}
+    lowlink: Dict[T, int] = {}
+    on_stack: Dict[T, bool] = {}
+    stack: List[T] = []
+    components: List[List[T]] = []
+
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(successors(root)))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = lowlink[child] = len(index)
+                    stack.append(child)
+                    on_stack[child] = True
+                    work.append((child, iter(successors(child))))
+                    break
+                if on_stack[child]:
+                    lowlink[node] = min(lowlink[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member is node:
+                            break
+                    components.append(component)
+    return components
@@ -0,0 +1,204 @@
+"""
+Incremental re-analysis
+
+Every contract gets a fingerprint computed from the ASTs: the hash of its source code,
+of the code outside of the contracts in its file, and of every top level declaration
+(contract, library, free function, struct, ...) it references, transitively.
+A contract whose fingerprint is unchanged since the previous run keeps its detector results;
+the changed contracts, including the descendants and users of a changed contract,
+are analyzed and checked again.
+
+The state of the previous run (fingerprints and detector results per contract) is stored
+as json, one file per compilation target.
+"""
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from antibug.compile.parse_version_and_install_solc import SOLC_PARSER_DIR
+from slither_core.utils.snapshot import code_fingerprint
+
+if TYPE_CHECKING:
+    from antibug.compile.antibug_compile import AntibugCompile
+    from slither_core.core.declarations import Contract
+
+logger = logging.getLogger("Slither")
+
+INCREMENTAL_DIR = SOLC_PARSER_DIR.joinpath("incremental")
+
+# Bump when the layout of the stored state changes
+INCREMENTAL_FORMAT_VERSION = 1
+
+# AST attributes holding the id of another declaration
+REFERENCE_KEYS = {
+    "referencedDeclaration",
+    "linearizedBaseContracts",
+    "contractDependencies",
+    "baseFunctions",
+    "usedErrors",
+    "usedEvents",
+}
+
+
+def contract_key(contract: "Contract") -> str:
+    """Identifier of a contract, stable across runs"""
+    return f"{contract.source_mapping.filename.absolute}:{contract.name}"
+
+
+def _walk(node, ids: Set[int], references: Set[int]) -> None:
+    """Collect the ids declared in an AST subtree and the ids it references"""
+    to_explore = [node]
+    while to_explore:
+        current = to_explore.pop()
+        if isinstance(current, dict):
+            for key, value in current.items():
+                if key == "id" and isinstance(value, int):
+                    ids.add(value)
+                elif key in REFERENCE_KEYS:
+                    if isinstance(value, int):
+                        references.add(value)
+                    elif isinstance(value, list):
+                        references |= {v for v in value if isinstance(v, int)}
+                elif isinstance(value, (dict, list)):
+                    to_explore.append(value)
+        elif isinstance(current, list):
+            to_explore.extend(current)
+
+
+def _dependencies_closure(dependencies: Dict[str, Set[str]], key: str) -> Set[str]:
+    closure = {key}
+    to_explore = [key]
+    while to_explore:
+        for dependency in dependencies[to_explore.pop()]:
+            if dependency not in closure:
+                closure.add(dependency)
+                to_explore.append(dependency)
+    return closure
+
+
+def contract_fingerprints(
+    antibug_compile: "AntibugCompile",
+) -> Tuple[Dict[str, str], Dict[str, Set[str]]]:
+    """Compute the fingerprint of every contract of a compilation
+
+    Args:
+        antibug_compile (AntibugCompile): compilation
+
+    Returns:
+        Tuple[Dict[str, str], Dict[str, Set[str]]]: contract key -> fingerprint,
+            contract key -> keys of the contracts it depends on (transitively, including itself)
+    """
+    own_hashes: Dict[str, str] = {}
+    ids_to_unit: Dict[int, str] = {}
+    unit_references: Dict[str, Set[int]] = {}
+    contracts: List[str] = []
+
+    for compilation_unit in antibug_compile.compilation_units.values():
+        for filename, ast in compilation_unit.asts.items():
+            source = antibug_compile.src_content.get(filename, "").encode("utf8")
+            is_compact = "nodeType" in ast
+            children = ast.get("nodes" if is_compact else "children", [])
+
+            units = []
+            residual = bytearray(source)
+            for index, node in enumerate(children):
+                node_type = node.get("nodeType" if is_compact else "name")
+                attributes = node if is_compact else node.get("attributes", {})
+                start, length = (int(x) for x in node["src"].split(":")[:2])
+                if node_type == "ContractDefinition":
+                    key = f"{filename}:{attributes['name']}"
+                    contracts.append(key)
+                    residual[start : start + length] = bytes(length)
+                else:
+                    key = f"{filename}#{index}"
+                units.append((key, source[start : start + length]))
+
+                ids: Set[int] = set()
+                references: Set[int] = set()
+                _walk(node, ids, references)
+                for node_id in ids:
+                    ids_to_unit[node_id] = key
+                unit_references[key] = references
+
+            residual_hash = hashlib.sha256(bytes(residual)).hexdigest()
+            for key, content in units:
+                sha = hashlib.sha256()
+                sha.update(f"{compilation_unit.compiler_version}\0{key}\0{residual_hash}\0".encode("utf8"))
+                sha.update(content)
+                own_hashes[key] = sha.hexdigest()
+
+    dependencies = {
+        key: {ids_to_unit[i] for i in references if i in ids_to_unit and ids_to_unit[i] != key}
+        for key, references in unit_references.items()
+    }
+
+    contract_keys = set(contracts)
+    fingerprints: Dict[str, str] = {}
+    closures: Dict[str, Set[str]] = {}
+    for key in contracts:
+        closure = _dependencies_closure(dependencies, key)
+        sha = hashlib.sha256()
+        for unit in sorted(closure):
+            sha.update(f"{unit}\0{own_hashes[unit]}\0".encode("utf8"))
+        fingerprints[key] = sha.hexdigest()
+        closures[key] = closure & contract_keys
+    return fingerprints, closures
+
+
+class IncrementalState:
+    """Detector results of the previous run, and the contracts to check again"""
+
+    def __init__(self, antibug_compile: "AntibugCompile", state_dir: Path = INCREMENTAL_DIR) -> None:
+        targets = "\0".join(sorted(antibug_compile.targets))
+        name = hashlib.sha256(f"{targets}\0{antibug_compile.compiler_version}".encode("utf8"))
+        self.path: Path = state_dir.joinpath(f"{name.hexdigest()}.json")
+
+        self.fingerprints, dependencies = contract_fingerprints(antibug_compile)
+
+        previous = self._load()
+        previous_fingerprints: Dict[str, str] = previous.get("fingerprints", {})
+        # contract key -> detector argument -> results
+        self.results: Dict[str, Dict[str, List[Dict]]] = {
+            key: results
+            for key, results in previous.get("results", {}).items()
+            if key in self.fingerprints and previous_fingerprints.get(key) == self.fingerprints[key]
+        }
+
+        # Contracts without valid results, and the contracts their analysis depends on
+        self.changed: Set[str] = set(self.fingerprints) - set(self.results)
+        self.contracts_to_analyze: Set[str] = set()
+        for key in self.changed:
+            self.contracts_to_analyze |= dependencies[key]
+
+    def _header(self) -> List:
+        return [INCREMENTAL_FORMAT_VERSION, code_fingerprint()]
+
+    def _load(self) -> Dict:
+        try:
+            with open(self.path, encoding="utf8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if state.get("header") != self._header():
+            return {}
+        return state
+
+    def save(self) -> None:
+        state = {"header": self._header(), "fingerprints": self.fingerprints, "results": self.results}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+        except OSError as error:
+            logger.info("Cannot store the incremental state %s: %s", self.path, error)
+
+    def is_changed(self, contract: "Contract") -> bool:
+        return contract_key(contract) in self.changed
+
+    def previous_results(self, contract: "Contract", argument: str) -> Optional[List[Dict]]:
+        return self.results.get(contract_key(contract), {}).get(argument)
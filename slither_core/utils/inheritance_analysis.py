@@ -2,14 +2,50 @@
 Detects various properties of inheritance in provided contracts.
 """
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import TYPE_CHECKING, List, Dict, Set, Tuple
 
+from slither_core.exceptions import SlitherException
+
 if TYPE_CHECKING:
     from slither_core.core.declarations import Contract, Function
     from slither_core.core.variables.state_variable import StateVariable
 
 
+def inheritance_order(contracts: List["Contract"]) -> List["Contract"]:
+    """
+    Sorts contracts so that every contract comes after all the contracts it inherits from
+    (Kahn's algorithm, linear in the number of contracts and inheritance edges).
+    Contracts that are not ordered by inheritance keep their relative order.
+
+    :param contracts: The contracts to sort, their inheritance must be set.
+    :return: The contracts, in inheritance order.
+    """
+    in_contracts = set(contracts)
+    fathers_count: Dict["Contract", int] = {contract: 0 for contract in contracts}
+    children: Dict["Contract", List["Contract"]] = defaultdict(list)
+    for contract in contracts:
+        for father in contract.inheritance:
+            if father in in_contracts and father is not contract:
+                fathers_count[contract] += 1
+                children[father].append(contract)
+
+    ready = deque(contract for contract in contracts if fathers_count[contract] == 0)
+    order: List["Contract"] = []
+    while ready:
+        contract = ready.popleft()
+        order.append(contract)
+        for child in children[contract]:
+            fathers_count[child] -= 1
+            if fathers_count[child] == 0:
+                ready.append(child)
+
+    if len(order) != len(contracts):
+        cycle = [str(contract) for contract in contracts if fathers_count[contract] > 0]
+        raise SlitherException(f"Cyclic inheritance between {', '.join(cycle)}")
+    return order
+
+
 def detect_c3_function_shadowing(
     contract: "Contract",
 ) -> Dict["Function", Set["Function"]]:
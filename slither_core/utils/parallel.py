@@ -0,0 +1,83 @@
+"""
+Parallel detector execution
+
+The worker processes are forked once the analysis is done: they share the analyzed
+objects copy-on-write, and every worker runs a share of the detectors. A worker only sends
+back the raw results of its detectors (see AbstractDetector.detect_raw), which are plain
+dictionaries. The filtering of the results (valid_result, duplicates, triage) stays in the
+parent process and follows the order of the detectors, so the results do not depend on
+the number of workers.
+
+What a detector computes lazily in a worker (caches of the declarations, data dependency)
+is not sent back to the parent process.
+"""
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from slither_core.utils.profiling import DISABLED_PROFILER, Profiler
+
+if TYPE_CHECKING:
+    from slither_core.detectors.abstract_detector import AbstractDetector
+
+logger = logging.getLogger("Slither")
+
+# Detectors of the current parallel run, inherited by the forked workers
+_detectors: List["AbstractDetector"] = []
+_profile = False
+
+
+def _detect_profiled(detector: "AbstractDetector", profiler: Profiler) -> List[Dict]:
+    with profiler.phase("detector", detector.ARGUMENT, detector.slither.antibug_compile.target):
+        return detector.detect_raw()
+
+
+def _detect_raw(index: int) -> Tuple[List[Dict], List[Dict]]:
+    """Run in a worker: raw results of a detector, and its profiling records"""
+    profiler = Profiler(enabled=_profile)
+    return _detect_profiled(_detectors[index], profiler), profiler.records
+
+
+def can_fork() -> bool:
+    """The workers need the fork start method to share the analysis of the parent"""
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def detect_raw(
+    detectors: List["AbstractDetector"],
+    jobs: Optional[int] = 1,
+    profiler: Profiler = DISABLED_PROFILER,
+) -> List[List[Dict]]:
+    """
+    Run the detectors, in forked worker processes if jobs != 1
+
+    :param detectors: detectors, of one or several compilation units
+    :param jobs: number of worker processes, None uses every available core
+    :param profiler: records the time and memory of every detector
+    :return: raw results of every detector, in the order of the detectors
+    """
+    global _detectors, _profile  # pylint: disable=global-statement
+
+    workers = min(jobs or os.cpu_count() or 1, len(detectors))
+    if workers <= 1:
+        return [_detect_profiled(detector, profiler) for detector in detectors]
+    if not can_fork():
+        logger.info("The fork start method is not available, the detectors run sequentially")
+        return [_detect_profiled(detector, profiler) for detector in detectors]
+
+    _detectors = detectors
+    _profile = profiler.enabled
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            results = []
+            for raw_results, records in executor.map(_detect_raw, range(len(detectors))):
+                results.append(raw_results)
+                profiler.add_records(records)
+            return results
+    finally:
+        _detectors = []
+        _profile = False
@@ -0,0 +1,119 @@
+"""
+Opt-in profiling of the compilation, the analysis, the detectors and the printers
+
+A Profiler records, for every phase run in one of its phase() blocks, the wall time,
+the CPU time of the process and the peak of the memory allocated during the phase
+(tracemalloc, relative to the memory allocated when the phase started).
+Phases can be nested: the peak of a phase includes the peaks of its sub-phases.
+A phase can name the compilation unit it works on; its sub-phases inherit it.
+A disabled profiler records nothing and does not start tracemalloc.
+
+tracemalloc.reset_peak requires python 3.9: on python 3.8 the peak of a phase is the
+peak since tracemalloc started, an upper bound of the peak allocated during the phase.
+"""
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+def _reset_peak() -> None:
+    """
+    Compatibility wrapper for tracemalloc.reset_peak (python 3.9+)
+    """
+    if sys.version_info >= (3, 9, 0):
+        tracemalloc.reset_peak()
+
+
+class _Frame:
+    __slots__ = ("unit", "start_memory", "peak_memory")
+
+    def __init__(self, unit: Optional[str], start_memory: int) -> None:
+        self.unit = unit
+        self.start_memory = start_memory
+        self.peak_memory = start_memory
+
+
+class Profiler:
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.records: List[Dict] = []
+        # frames of the phases being run, innermost last
+        self._frames: List[_Frame] = []
+
+    def __getstate__(self) -> Dict:
+        # A profiler saved with a snapshot of the analysis keeps no record
+        return {"enabled": False, "records": [], "_frames": []}
+
+    @contextmanager
+    def phase(self, category: str, name: str, unit: Optional[object] = None) -> Iterator[None]:
+        """
+        Profile the block
+
+        :param category: kind of phase ("compile", "parse", "analysis", "detector", "printer")
+        :param name: name of the phase (target, detector argument, ...)
+        :param unit: compilation unit (target of the compilation), default: the one of the enclosing phase
+        """
+        if not self.enabled:
+            yield
+            return
+
+        if unit is None:
+            unit = self._frames[-1].unit if self._frames else None
+        elif not isinstance(unit, str):
+            unit = " ".join(map(str, unit)) if isinstance(unit, (list, tuple)) else str(unit)
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        current, peak = tracemalloc.get_traced_memory()
+        if self._frames:
+            # the peak of the enclosing phase is lost by reset_peak, keep it
+            self._frames[-1].peak_memory = max(self._frames[-1].peak_memory, peak)
+        _reset_peak()
+        frame = _Frame(unit, current)
+        self._frames.append(frame)
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            _, peak = tracemalloc.get_traced_memory()
+            frame.peak_memory = max(frame.peak_memory, peak)
+            self._frames.pop()
+            if self._frames:
+                self._frames[-1].peak_memory = max(self._frames[-1].peak_memory, frame.peak_memory)
+            _reset_peak()
+
+            self.records.append(
+                {
+                    "category": category,
+                    "name": name,
+                    "unit": unit,
+                    "depth": len(self._frames),
+                    "wall_time": round(wall, 6),
+                    "cpu_time": round(cpu, 6),
+                    "peak_memory": frame.peak_memory - frame.start_memory,
+                }
+            )
+
+    def add_records(self, records: List[Dict]) -> None:
+        """Add the records of phases profiled in another process (see utils.parallel)"""
+        if self.enabled:
+            depth = len(self._frames)
+            self.records += [dict(record, depth=record["depth"] + depth) for record in records]
+
+    def to_json(self, target: Optional[str] = None) -> str:
+        """
+        :param target: analyzed target, recorded in the profile
+        :return: the profile, records in the order the phases ended
+        """
+        return json.dumps({"target": target, "phases": self.records}, indent=2)
+
+
+# Profiler used when profiling is not requested
+DISABLED_PROFILER = Profiler(enabled=False)
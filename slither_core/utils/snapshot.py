@@ -0,0 +1,181 @@
+"""
+Persistent snapshots of analyzed Slither objects
+
+A snapshot holds a Slither object after parsing and analysis (contracts, functions, CFG nodes,
+SlithIR, SSA and data dependency), so detectors can run on it without re-analyzing the code.
+
+On disk, a snapshot is a pickle stream of a header followed by the Slither object.
+The header records the snapshot format version, the python version and a fingerprint
+of the slither_core code: a snapshot produced by another version is never loaded.
+"""
+import gc
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from antibug.compile.antibug_compile import AntibugCompile
+from antibug.compile.parse_version_and_install_solc import SOLC_PARSER_DIR
+
+if TYPE_CHECKING:
+    from slither_core.slither import Slither
+
+logger = logging.getLogger("Slither")
+
+SNAPSHOT_DIR = SOLC_PARSER_DIR.joinpath("snapshots")
+
+# Bump when the layout of the analyzed objects changes in an incompatible way
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_MAGIC = "antibug-slither-snapshot"
+
+# The object graph (CFG, IR, SSA, dependencies) is deeply nested:
+# pickle recurses once per level, so (un)pickling runs in a thread with a large stack
+_RECURSION_LIMIT = 200000
+_STACK_SIZE = 512 * 1024 * 1024
+
+_code_fingerprint: Optional[str] = None
+
+
+def code_fingerprint() -> str:
+    """Fingerprint of the slither_core sources (path, size, mtime of every module)
+
+    Returns:
+        str: hex digest
+    """
+    global _code_fingerprint  # pylint: disable=global-statement
+    if _code_fingerprint is None:
+        root = Path(__file__).resolve().parents[1]
+        sha = hashlib.sha256()
+        for path in sorted(root.rglob("*.py")):
+            stat = path.stat()
+            sha.update(f"{path.relative_to(root)}:{stat.st_size}:{stat.st_mtime_ns}\0".encode("utf-8"))
+        _code_fingerprint = sha.hexdigest()
+    return _code_fingerprint
+
+
+def _header() -> Tuple[str, int, str, str]:
+    return SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, sys.version.split()[0], code_fingerprint()
+
+
+def compute_snapshot_key(antibug_compile: AntibugCompile) -> str:
+    """Compute the snapshot key of a compilation
+    The key covers the inputs of the analysis: the compiler version, the ASTs and the source code
+
+    Args:
+        antibug_compile (AntibugCompile): compilation
+
+    Returns:
+        str: hex digest
+    """
+    sha = hashlib.sha256()
+    sha.update(f"{SNAPSHOT_FORMAT_VERSION}\0".encode("utf-8"))
+    for compilation_unit in antibug_compile.compilation_units.values():
+        sha.update(f"{compilation_unit.compiler_version}\0".encode("utf-8"))
+        sha.update(json.dumps(compilation_unit.asts, sort_keys=True).encode("utf-8"))
+    for path in sorted(antibug_compile.src_content):
+        sha.update(f"{path}\0".encode("utf-8"))
+        sha.update(hashlib.sha256(antibug_compile.src_content[path].encode("utf-8")).digest())
+    return sha.hexdigest()
+
+
+def snapshot_path(key: str, snapshot_dir: Path = SNAPSHOT_DIR) -> Path:
+    return snapshot_dir.joinpath(key[:2], f"{key}.snapshot")
+
+
+def _run_deep(function, *args):
+    """Run function in a thread with a large stack and a high recursion limit"""
+    result = {}
+
+    def target():
+        try:
+            result["value"] = function(*args)
+        except BaseException as e:  # pylint: disable=broad-except
+            result["error"] = e
+
+    previous_limit = sys.getrecursionlimit()
+    previous_stack_size = threading.stack_size(_STACK_SIZE)
+    sys.setrecursionlimit(max(previous_limit, _RECURSION_LIMIT))
+    try:
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+    finally:
+        threading.stack_size(previous_stack_size)
+        sys.setrecursionlimit(previous_limit)
+
+    if "error" in result:
+        raise result["error"]
+    return result.get("value")
+
+
+def _dump(slither: "Slither", path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickler = pickle.Pickler(f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickler.dump(_header())
+            pickler.dump(slither)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _load(path: Path) -> Optional["Slither"]:
+    with open(path, "rb") as f:
+        unpickler = pickle.Unpickler(f)
+        if unpickler.load() != _header():
+            logger.info("%s: snapshot produced by another version, ignored", path)
+            return None
+        # The collector would walk the partially built object graph over and over
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return unpickler.load()
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+
+def save_snapshot(slither: "Slither", path: Path) -> bool:
+    """Save an analyzed Slither object
+    Must be called before any detector or printer is registered
+
+    Args:
+        slither (Slither): analyzed object
+        path (Path): snapshot file
+
+    Returns:
+        bool: True if the snapshot was written
+    """
+    try:
+        _run_deep(_dump, slither, path)
+        return True
+    except (OSError, pickle.PicklingError, AttributeError, TypeError, RecursionError) as error:
+        logger.warning("Cannot save the analysis snapshot %s: %s", path, error)
+        return False
+
+
+def load_snapshot(path: Path) -> Optional["Slither"]:
+    """Load a Slither object saved by save_snapshot
+
+    Args:
+        path (Path): snapshot file
+
+    Returns:
+        Optional[Slither]: the analyzed object, None if the snapshot is missing, corrupted
+            or was produced by another version
+    """
+    if not path.is_file():
+        return None
+    try:
+        return _run_deep(_load, path)
+    except Exception as error:  # pylint: disable=broad-except
+        logger.warning("Cannot load the analysis snapshot %s: %s", path, error)
+        return None
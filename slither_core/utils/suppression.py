@@ -0,0 +1,106 @@
+"""
+Index of the comments suppressing the findings in a source file
+
+    // antibug-disable-start check1,check2
+    ...
+    // antibug-disable-end check1,check2
+
+    // slither-disable-next-line check1,check2
+
+The index is built in one pass over the bytes of the file: only the lines containing
+"-disable-" are decoded and matched. The ranges of a detector do not overlap and are
+sorted, so finding the range containing a result is a binary search; the next line
+comments are a set per line.
+"""
+import logging
+import re
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Set
+
+from antibug.compile.utils.line_index import compute_line_starts
+
+logger = logging.getLogger("Slither")
+
+_DISABLE_RANGE = re.compile(r"^\s*//\s*antibug-disable-(start|end)\s*([a-zA-Z0-9_,-]*)")
+_DISABLE_NEXT_LINE = re.compile(r"^\s*//\s*slither-disable-next-line\s*([a-zA-Z0-9_,-]*)")
+
+_KEYWORD = b"-disable-"
+
+
+class SuppressionIndex:
+    """
+    Suppression comments of a file.
+    The check "all" suppresses every detector
+    """
+
+    def __init__(self, lines: List[bytes], file: str) -> None:
+        """
+        :param lines: lines of the file, line endings included
+        :param file: name of the file, for the error messages
+        """
+        # detector -> start lines of its ranges, and their end lines (inf if not ended)
+        self._starts: Dict[str, List[int]] = {}
+        self._ends: Dict[str, List[float]] = {}
+        # line -> detectors disabled on the next line
+        self._next_line: Dict[int, Set[str]] = {}
+
+        source = b"".join(lines)
+        line_starts = compute_line_starts(lines)
+        parse_ranges = True
+        position = source.find(_KEYWORD)
+        while position != -1:
+            line_number = bisect_right(line_starts, position)
+            line_text = lines[line_number - 1].decode("utf8")
+            if parse_ranges:
+                parse_ranges = self._add_range(line_text, line_number, file)
+            match = _DISABLE_NEXT_LINE.match(line_text)
+            if match:
+                self._next_line.setdefault(line_number, set()).update(match[1].split(","))
+            # next line
+            position = source.find(_KEYWORD, line_starts[line_number])
+
+    def _add_range(self, line_text: str, line_number: int, file: str) -> bool:
+        """
+        Record a start or end comment
+        :return: False if the comment is misplaced, the ranges of the rest of the file are then ignored
+        """
+        match = _DISABLE_RANGE.match(line_text)
+        if not match:
+            return True
+        for check in match[2].split(","):
+            ends = self._ends.setdefault(check, [])
+            if match[1] == "start":
+                if ends and ends[-1] == float("inf"):
+                    logger.error(
+                        f"Consecutive antibug-disable-starts without antibug-disable-end in {file}#{line_number}"
+                    )
+                    return False
+                self._starts.setdefault(check, []).append(line_number)
+                ends.append(float("inf"))
+            else:
+                if not ends or ends[-1] != float("inf"):
+                    logger.error(
+                        f"antibug-disable-end without antibug-disable-start in {file}#{line_number}"
+                    )
+                    return False
+                ends[-1] = line_number
+        return True
+
+    def is_suppressed(self, check: str, lines: List[int]) -> bool:
+        """
+        Check if a finding is suppressed: its lines are strictly inside a disabled range,
+        or the line preceding them disables the detector
+
+        :param check: argument of the detector
+        :param lines: lines of the finding in the file
+        """
+        for name in (check, "all"):
+            starts = self._starts.get(name)
+            if starts:
+                # the last range starting before the finding is the only one that can contain it
+                index = bisect_left(starts, lines[0])
+                if index and self._ends[name][index - 1] > lines[-1]:
+                    return True
+
+        disabled = self._next_line.get(min(lines) - 1)
+        return disabled is not None and ("all" in disabled or check in disabled)
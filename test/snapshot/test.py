@@ -0,0 +1,35 @@
+"""
+Snapshot round trip: every analyzed compilation must be saved and loaded back,
+and the detectors must report the same results on the loaded objects
+
+save_snapshot only logs a warning when an object of the analysis cannot be pickled,
+the --snapshot runs then silently analyze everything again
+
+Usage: python test/snapshot/test.py [target.sol]
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from antibug.compile.safe_dev_analyzer import SafeDevAnalyzer
+from antibug.run_detectors.detectors import RunDetector
+from slither_core.utils.snapshot import load_snapshot, save_snapshot
+
+target = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(__file__), "..", "reentrancy.sol")
+
+analyzed = SafeDevAnalyzer(target, compile_cache=False)
+loaded = SafeDevAnalyzer(target, compile_cache=False)
+assert analyzed.compilation_units, f"{target} did not compile"
+
+with tempfile.TemporaryDirectory() as tmp:
+    for name, slither in analyzed.compilation_units.items():
+        path = Path(tmp, f"{len(os.listdir(tmp))}.snapshot")
+        assert save_snapshot(slither, path), f"{name}: the snapshot was not saved"
+        loaded.compilation_units[name] = load_snapshot(path)
+        assert loaded.compilation_units[name] is not None, f"{name}: the snapshot was not loaded"
+
+expected = RunDetector(analyzed).register_and_run_detectors()[0]
+results = RunDetector(loaded).register_and_run_detectors()[0]
+assert results == expected, "the detectors report other results on the loaded snapshots"
+print(f"{len(analyzed.compilation_units)} compilation unit(s) saved and loaded, {len(expected)} detector result(s)")